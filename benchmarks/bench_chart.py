@@ -0,0 +1,84 @@
+"""차트 렌더링 벤치마크
+
+이벤트 루프에서 직접 렌더링할 때와 ChartRenderer(프로세스 풀)를 쓸 때의
+렌더링 시간과 이벤트 루프 지연을 비교합니다.
+
+    python -m benchmarks.bench_chart --charts 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import numpy as np
+from utils.chart_render import ChartRenderer, render_chart
+
+def make_columns(count: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    close = 50_000_000 * np.exp(np.cumsum(rng.normal(0, 0.01, count)))
+    open_ = close * np.exp(rng.normal(0, 0.005, count))
+    return {
+        "ts": np.arange(count, dtype=np.int64) * 3600 + 1_700_000_000,
+        "open": open_,
+        "high": np.maximum(open_, close) * 1.003,
+        "low": np.minimum(open_, close) * 0.997,
+        "close": close,
+        "volume": rng.uniform(1, 100, count),
+        "value": rng.uniform(1e8, 1e10, count),
+    }
+
+async def monitor_lag(stop: asyncio.Event, samples: list, interval: float = 0.01):
+    """interval마다 깨어나서 예정보다 늦은 시간을 기록"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - start - interval)
+
+async def run(mode: str, charts: int, candles: int) -> dict:
+    renderer = ChartRenderer(max_workers=2, cache_size=0)
+    if mode == "pool":
+        # 프로세스 기동 시간은 제외
+        await renderer.render("warmup", "warmup", make_columns(10, 0), 3600)
+
+    stop = asyncio.Event()
+    lags = []
+    monitor = asyncio.create_task(monitor_lag(stop, lags))
+    latencies = []
+
+    async def one(i: int):
+        columns = make_columns(candles, i)
+        start = time.perf_counter()
+        if mode == "inline":
+            render_chart(f"BENCH-{i}", columns, 3600)
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0)
+        else:
+            await renderer.render(("bench", i), f"BENCH-{i}", columns, 3600)
+            latencies.append(time.perf_counter() - start)
+
+    total_start = time.perf_counter()
+    await asyncio.gather(*[one(i) for i in range(charts)])
+    total = time.perf_counter() - total_start
+    stop.set()
+    await monitor
+    renderer.shutdown()
+
+    return {
+        "mode": mode,
+        "total_s": total,
+        "render_p50_ms": statistics.median(latencies) * 1000,
+        "loop_lag_max_ms": max(lags, default=0) * 1000,
+        "loop_lag_p95_ms": (sorted(lags)[int(len(lags) * 0.95)] if lags else 0) * 1000,
+    }
+
+async def main(charts: int, candles: int):
+    for mode in ("inline", "pool"):
+        r = await run(mode, charts, candles)
+        print(f"{r['mode']:>6}: 전체 {r['total_s']:.2f}s, 렌더링 p50 {r['render_p50_ms']:.0f}ms, "
+              f"루프 지연 p95 {r['loop_lag_p95_ms']:.1f}ms / 최대 {r['loop_lag_max_ms']:.1f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="차트 렌더링 벤치마크")
+    parser.add_argument("--charts", type=int, default=20)
+    parser.add_argument("--candles", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.charts, args.candles))
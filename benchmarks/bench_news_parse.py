@@ -0,0 +1,96 @@
+"""뉴스 랭킹 페이지 파싱 벤치마크
+
+저장된 고정 페이지(benchmarks/fixtures)를 기존 방식(전체 페이지 html.parser, 이벤트 루프에서 실행)과
+백엔드별(bs4/lxml/selectolax) x 실행 위치별(inline/thread/process)로 파싱하면서
+파싱 시간과 이벤트 루프 지연을 비교합니다.
+
+    python -m benchmarks.news_fixtures   # 고정 페이지가 없을 때만
+    python -m benchmarks.bench_news_parse --repeat 50
+"""
+import argparse
+import asyncio
+import glob
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.bench_chart import monitor_lag
+from benchmarks.news_fixtures import FIXTURE_DIR
+from utils.news_parser import available_parsers, PARSERS
+
+def parse_legacy(html: str, limit: int = 10) -> list:
+    """기존 fetch_news 파싱 (전체 페이지를 html.parser로 파싱)"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    items = []
+    for article in soup.select("ul.press_ranking_list > li.as_thumb")[:limit]:
+        items.append((
+            article.select_one("em.list_ranking_num").text.strip(),
+            article.select_one("strong.list_title").text.strip(),
+            article.select_one("a._es_pc_link")["href"],
+        ))
+    return items
+
+async def run(name: str, parser, mode: str, pages: list, repeat: int, executor=None) -> dict:
+    loop = asyncio.get_running_loop()
+    if mode != "inline":
+        # 스레드/프로세스 기동 시간은 제외
+        await loop.run_in_executor(executor, parser, pages[0], 10)
+
+    stop = asyncio.Event()
+    lags = []
+    monitor = asyncio.create_task(monitor_lag(stop, lags))
+    latencies = []
+
+    total_start = time.perf_counter()
+    for i in range(repeat):
+        html = pages[i % len(pages)]
+        start = time.perf_counter()
+        if mode == "inline":
+            parser(html, 10)
+        else:
+            await loop.run_in_executor(executor, parser, html, 10)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0)
+    total = time.perf_counter() - total_start
+    stop.set()
+    await monitor
+
+    return {
+        "parser": name,
+        "mode": mode,
+        "total_s": total,
+        "parse_p50_ms": statistics.median(latencies) * 1000,
+        "loop_lag_max_ms": max(lags, default=0) * 1000,
+        "loop_lag_p95_ms": (sorted(lags)[int(len(lags) * 0.95)] if lags else 0) * 1000,
+    }
+
+async def main(repeat: int):
+    paths = sorted(glob.glob(os.path.join(FIXTURE_DIR, "naver_ranking_*.html")))
+    if not paths:
+        raise SystemExit("고정 페이지가 없습니다. python -m benchmarks.news_fixtures 를 먼저 실행하세요.")
+    pages = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+
+    executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    cases = [("legacy", parse_legacy, "inline")]
+    for name in available_parsers():
+        for mode in ("inline", "thread", "process"):
+            cases.append((name, PARSERS[name], mode))
+
+    print(f"고정 페이지 {len(pages)}개, 반복 {repeat}회")
+    for name, parser, mode in cases:
+        r = await run(name, parser, mode, pages, repeat, executor if mode == "process" else None)
+        print(f"{r['parser']:>10} {r['mode']:>7}: 전체 {r['total_s']:.2f}s, 파싱 p50 {r['parse_p50_ms']:.1f}ms, "
+              f"루프 지연 p95 {r['loop_lag_p95_ms']:.1f}ms / 최대 {r['loop_lag_max_ms']:.1f}ms")
+    executor.shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="뉴스 파싱 벤치마크")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
@@ -0,0 +1,282 @@
+"""오프라인 벤치마크 모음 (뉴스 크롤러 + 임베드/메시지 생성)
+
+디스코드 로그인이나 실제 네이버/업비트 없이, ReplayServer가 고정 데이터(benchmarks/fixtures)를
+응답하는 상태에서 단계별 시간을 잽니다.
+
+    news.fetch       랭킹 페이지 전체 다운로드
+    news.parse       실제 쓰이는 파싱 경로 (CrawlNews.parse_news, NEWS_STREAMING=1이면 RankingStreamParser)
+    news.fetch_news  캐시 없이 CrawlNews.fetch_news 전체 (요청 + 파싱)
+    news.build       CrawlNews.create_news_embed
+    news.render      임베드 -> 디스코드로 보낼 JSON
+    price.fetch      업비트 시세 응답 다운로드
+    price.parse      시세 JSON 디코딩
+    price.request    Finance.request_tickers 전체 (요청 제한기 + 순위표/알림 반영)
+    price.build      Finance.create_price_embed
+    price.render     임베드 -> JSON
+    todo.build       Todo.create_todo_message
+    todo.render      TodoView 버튼 구성 + 메시지 JSON
+
+결과는 JSON(기본 benchmarks/results/<커밋>.json)으로 저장하고, --compare로 이전 결과와 비교합니다.
+p50이 --threshold 비율 이상 느려진 단계가 있으면 종료 코드 1을 반환합니다. (같은 기기에서 잰 결과끼리 비교)
+
+    python -m benchmarks.news_fixtures && python -m benchmarks.upbit_fixtures   # 고정 데이터가 없을 때만
+    python -m benchmarks.bench_suite --repeat 50
+    python -m benchmarks.bench_suite --compare benchmarks/results/<이전 커밋>.json
+    python -m benchmarks.bench_suite --compare old.json new.json
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from benchmarks.replay_server import ReplayServer
+
+RESULT_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+def summarize(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "min_ms": ordered[0] * 1000,
+    }
+
+async def measure(func, repeat: int, warmup: int = 2, min_sample: float = 0.002) -> dict:
+    """func 1회 실행 시간 통계 (코루틴 함수도 가능, 처음 warmup번은 제외)
+
+    아주 짧은 단계는 타이머 오차가 커서, 한 샘플이 min_sample초 이상이 되도록 여러 번 묶어 잰 평균을 씁니다.
+    """
+    async def run_batch(number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            result = func()
+            if inspect.isawaitable(result):
+                await result
+        return time.perf_counter() - start
+
+    number = 1
+    for _ in range(max(1, warmup)):
+        elapsed = await run_batch(1)
+    while elapsed * number < min_sample and number < 10_000:
+        number *= 10 if elapsed * number * 10 < min_sample else 2
+    samples = [await run_batch(number) / number for _ in range(repeat)]
+    result = summarize(samples)
+    result["batch"] = number
+    return result
+
+def stop_loops(cog):
+    """벤치마크 중에는 cog의 주기 작업이 돌지 않도록 정지"""
+    from discord.ext import tasks
+
+    for name, value in vars(type(cog)).items():
+        if isinstance(value, tasks.Loop):
+            getattr(cog, name).cancel()
+
+def render_message(content: str = None, embed=None, view=None) -> str:
+    """디스코드로 보낼 메시지 본문 (JSON)"""
+    payload = {"content": content}
+    if embed is not None:
+        payload["embeds"] = [embed.to_dict()]
+    if view is not None:
+        payload["components"] = view.to_components()
+    return json.dumps(payload, ensure_ascii=False)
+
+async def bench_news(bot, base_url: str, repeat: int, results: dict) -> dict:
+    import cogs.crawl_news as crawl_news
+    from utils.news_cache import PageCache
+    from utils.news_parser import RankingStreamParser
+    from utils.summarizer import summarize_article
+
+    crawl_news.NEWS_RANKING_URL = base_url + "/press/{press}/ranking?type={type}"
+    cog = crawl_news.CrawlNews(bot)
+    stop_loops(cog)
+    try:
+        url = cog.source_url("052", "popular")
+        await cog.init_session()
+
+        async def fetch() -> bytes:
+            async with cog.session.get(url) as response:
+                return await response.read()
+
+        async def fetch_news_cold():
+            cog.page_cache = PageCache(ttl=crawl_news.NEWS_CACHE_TTL)
+            return await cog.fetch_news(url)
+
+        def parse_stream():
+            parser = RankingStreamParser(limit=10)
+            for i in range(0, len(html), crawl_news.NEWS_CHUNK_SIZE):
+                parser.feed_chunk(html[i:i + crawl_news.NEWS_CHUNK_SIZE])
+                if parser.done:
+                    break
+            return parser.items
+
+        html = (await fetch()).decode("utf-8")
+        results["news.fetch"] = await measure(fetch, repeat)
+        if crawl_news.NEWS_STREAMING:
+            results["news.parse"] = await measure(parse_stream, repeat)
+        else:
+            results["news.parse"] = await measure(lambda: cog.parse_news(html), repeat)
+        results["news.fetch_news"] = await measure(fetch_news_cold, repeat)
+
+        # 실제 알림처럼 언론사/요약이 채워진 목록으로 임베드 생성
+        items = cog.merge_feeds([[("052", item) for item in await fetch_news_cold()]])
+        async with cog.session.get(f"{base_url}/article/052/2024000001") as response:
+            summary = summarize_article(await response.text())
+        for item in items:
+            item.summary = summary
+        results["news.build"] = await measure(lambda: cog.create_news_embed(items), repeat)
+        embed = cog.create_news_embed(items)
+        results["news.render"] = await measure(lambda: render_message(embed=embed), repeat)
+        return {"news_parser": cog.parser_name, "news_streaming": crawl_news.NEWS_STREAMING}
+    finally:
+        await cog.cog_unload()
+
+async def bench_price(bot, base_url: str, repeat: int, results: dict):
+    from cogs.finance import Finance
+    from utils.rate_limiter import UpbitRateLimiter
+
+    cog = Finance(bot)
+    stop_loops(cog)
+    try:
+        cog.base_url = f"{base_url}/v1"
+        # 요청 제한기 대기 시간이 측정에 섞이지 않도록 한도를 크게
+        cog.rate_limiter = UpbitRateLimiter(rate=1_000_000)
+        await cog.catalog.refresh()
+        await cog.init_session()
+        markets = ["KRW-BTC", "USDT-BTC"]
+
+        async def fetch() -> bytes:
+            async with cog.session.get(f"{cog.base_url}/ticker", params={"markets": ",".join(markets)}) as response:
+                return await response.read()
+
+        body = await fetch()
+        results["price.fetch"] = await measure(fetch, repeat)
+        results["price.parse"] = await measure(lambda: json.loads(body), repeat)
+        results["price.request"] = await measure(lambda: cog.request_tickers(markets), repeat)
+        data = json.loads(body)
+        results["price.build"] = await measure(lambda: cog.create_price_embed(data), repeat)
+        embed = cog.create_price_embed(data)
+        results["price.render"] = await measure(lambda: render_message(embed=embed), repeat)
+    finally:
+        cog.cog_unload()
+
+async def bench_todo(bot, repeat: int, results: dict):
+    from cogs.todo import Todo, TodoItem, TodoView
+
+    cog = Todo(bot)
+    stop_loops(cog)
+    user = SimpleNamespace(display_name="벤치마크")
+    todos = [TodoItem(f"벤치마크 할 일 {i}") for i in range(4)]
+    todos[0].completed = True
+    results["todo.build"] = await measure(lambda: cog.create_todo_message(user, todos), repeat)
+
+    def render() -> str:
+        return render_message(content=cog.create_todo_message(user, todos), view=TodoView(todos, cog))
+    results["todo.render"] = await measure(render, repeat)
+
+def git_commit() -> str:
+    """현재 커밋 (작업 중인 변경이 있으면 -dirty)"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True
+        ).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+async def run_suite(repeat: int) -> dict:
+    # 봇 데이터(감시 목록, 뉴스 보관소 등)가 실제 data/ 폴더에 섞이지 않도록 임시 폴더 사용
+    os.environ["DATA_DIR"] = tempfile.mkdtemp(prefix="bench_data_")
+    import discord
+    from discord.ext import commands
+
+    server = ReplayServer()
+    base_url = await server.start()
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.default())
+    results = {}
+    try:
+        info = await bench_news(bot, base_url, repeat, results)
+        await bench_price(bot, base_url, repeat, results)
+        await bench_todo(bot, repeat, results)
+        await asyncio.sleep(0.1)  # cog_unload에서 예약한 세션 종료 대기
+    finally:
+        await server.stop()
+
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        **info,
+        "results": results,
+    }
+
+def print_results(report: dict):
+    print(f"커밋 {report['commit']}, 반복 {report['repeat']}회, 파서 {report.get('news_parser')}")
+    for stage, r in report["results"].items():
+        print(f"{stage:>16}: p50 {r['p50_ms']:8.3f}ms  p95 {r['p95_ms']:8.3f}ms  평균 {r['mean_ms']:8.3f}ms")
+
+def compare(base: dict, new: dict, threshold: float) -> bool:
+    """단계별 p50 비교, threshold 비율 이상 느려진 단계가 있으면 True"""
+    print(f"{base['commit']} -> {new['commit']} (p50 기준, ±{threshold:.0%} 초과 표시)")
+    regressed = False
+    for stage in list(dict.fromkeys([*base["results"], *new["results"]])):
+        before = base["results"].get(stage)
+        after = new["results"].get(stage)
+        if not before or not after:
+            print(f"{stage:>16}: {'새 단계' if after else '없어진 단계'}")
+            continue
+        change = after["p50_ms"] / before["p50_ms"] - 1 if before["p50_ms"] else 0.0
+        mark = ""
+        if change > threshold:
+            mark = "  << 느려짐"
+            regressed = True
+        elif change < -threshold:
+            mark = "  빨라짐"
+        print(f"{stage:>16}: {before['p50_ms']:8.3f}ms -> {after['p50_ms']:8.3f}ms ({change:+.1%}){mark}")
+    return regressed
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크 모음")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본 benchmarks/results/<커밋>.json)")
+    parser.add_argument("--compare", nargs="+", metavar="RESULT",
+                        help="이전 결과와 비교 (파일 하나면 지금 실행한 결과와, 두 개면 두 파일끼리)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="느려짐으로 볼 p50 증가 비율")
+    args = parser.parse_args()
+
+    if args.compare and len(args.compare) == 2:
+        sys.exit(1 if compare(load(args.compare[0]), load(args.compare[1]), args.threshold) else 0)
+
+    report = asyncio.run(run_suite(args.repeat))
+    print_results(report)
+    output = args.output or os.path.join(RESULT_DIR, f"{report['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output}")
+
+    if args.compare:
+        print()
+        sys.exit(1 if compare(load(args.compare[0]), report, args.threshold) else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""뉴스 랭킹 페이지 고정 데이터(fixture) 생성
+
+네이버 언론사 랭킹 페이지(media.naver.com/press/{언론사}/ranking)와 같은 마크업 구조로
+head 스크립트, 상단 메뉴, 랭킹 목록 20개, 하단 영역을 채운 페이지와
+기사 페이지(n.news.naver.com/article/{언론사}/{기사 번호})를 만듭니다.
+같은 인자면 항상 같은 페이지가 나옵니다.
+
+    python -m benchmarks.news_fixtures
+"""
+import os
+import random
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+TOPICS = ["경제", "증시", "반도체", "부동산", "환율", "금리", "코스피", "비트코인", "정치", "사회"]
+
+def ranking_page(press: str = "052", seed: int = 0, articles: int = 20, filler: int = 400, lists: int = 1) -> str:
+    """lists가 2 이상이면 순위를 여러 press_ranking_list로 나누고 사이에 광고 영역을 넣음"""
+    rng = random.Random(f"{press}:{seed}")
+    head = (
+        "<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'>"
+        f"<title>언론사 {press} 랭킹 : 네이버 뉴스</title>"
+        + "".join(f"<script>window.__nclick_{i}={{area:'rnk',cid:{i}}};</script>" for i in range(60))
+        + "".join(f"<link rel='stylesheet' href='https://ssl.pstatic.net/static/news/{i}.css'>" for i in range(20))
+        + "</head><body><div id='wrap'>"
+    )
+    header = "".join(
+        f"<div class='press_header_menu'><a href='/press/{press}/menu{i}' class='menu_item'>메뉴 {i}</a>"
+        f"<span class='blind'>광고 영역 {i}</span></div>"
+        for i in range(filler // 2)
+    )
+
+    items = []
+    for rank in range(1, articles + 1):
+        article_id = f"{2024_000_000 + seed * 1000 + rank:010d}"
+        topic = rng.choice(TOPICS)
+        items.append(
+            f"<li class=\"as_thumb\">"
+            f"<a href=\"https://n.news.naver.com/article/{press}/{article_id}?ntype=RANKING\" "
+            f"class=\"_es_pc_link\" data-clk=\"rnk.article{rank}\">"
+            f"<div class=\"list_img\"><img src=\"https://mimgnews.pstatic.net/image/{press}/{article_id}.jpg\" "
+            f"width=\"70\" height=\"70\" alt=\"\"></div>"
+            f"<div class=\"list_text\"><em class=\"list_ranking_num\">{rank}</em>"
+            f"<strong class=\"list_title\">[{topic}] {press} 언론사 {seed}회차 {rank}위 기사 제목 "
+            f"{rng.randint(1, 9999)}</strong>"
+            f"<span class=\"list_view\">조회수 {rng.randint(1000, 999999):,}</span></div></a></li>"
+        )
+    size = -(-articles // lists)
+    ranking = (
+        "<div class='press_ranking_home'><div class='press_ranking_box'>"
+        "<h3 class='press_ranking_title'>많이 본 뉴스</h3>"
+        + "<div class='press_ranking_ad'><ul class='ad_list'><li>광고</li></ul></div>".join(
+            f"<ul class=\"press_ranking_list\">{''.join(items[i:i + size])}</ul>"
+            for i in range(0, articles, size)
+        )
+        + "</div></div>"
+    )
+    footer = "".join(
+        f"<div class='press_footer'><p class='footer_text'>하단 문단 {i} " + "본문 텍스트 " * 15 + "</p></div>"
+        for i in range(filler)
+    )
+    return head + header + ranking + footer + "</div></body></html>"
+
+SENTENCES = [
+    "{topic} 관련 지표가 예상보다 크게 움직이면서 시장의 관심이 집중되고 있다.",
+    "전문가들은 이번 {topic} 흐름이 당분간 이어질 가능성이 높다고 분석했다.",
+    "정부는 {topic} 변동성을 줄이기 위한 추가 대책을 검토하고 있다고 밝혔다.",
+    "일부 투자자들은 {topic} 상황을 지켜보며 관망세를 유지하고 있다.",
+    "업계에서는 {topic} 영향이 하반기 실적에도 반영될 것으로 보고 있다.",
+    "한편 해외 시장에서도 비슷한 {topic} 움직임이 관찰됐다.",
+    "관계자는 {topic} 문제에 대해 신중하게 대응하겠다고 말했다.",
+]
+
+def article_page(press: str = "052", article_id: str = "2024000001", paragraphs: int = 8) -> str:
+    """네이버 뉴스 기사 페이지 (본문은 <article id="dic_area">)"""
+    rng = random.Random(f"{press}:{article_id}")
+    topic = rng.choice(TOPICS)
+    body = []
+    for _ in range(paragraphs):
+        body.append(" ".join(rng.choice(SENTENCES).format(topic=topic) for _ in range(3)))
+    return (
+        "<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'>"
+        f"<title>[{topic}] 기사 {article_id}</title>"
+        + "".join(f"<script>var ad_{i}='{'x' * 200}';</script>" for i in range(40))
+        + "</head><body><div id='ct'>"
+        f"<h2 class='media_end_head_headline'>[{topic}] 기사 {article_id}</h2>"
+        "<div id='newsct_article' class='newsct_article _article_body'>"
+        "<article id='dic_area' class='go_trans _article_content'>"
+        "<span class='end_photo_org'><img src='https://imgnews.pstatic.net/photo.jpg'>"
+        f"<em class='img_desc'>사진 설명 {topic} 자료사진</em></span><br><br>"
+        + "<br><br>".join(body)
+        + "<br><br>홍길동 기자 hong@example.com<br>"
+        "저작권자 ⓒ 무단전재 및 재배포 금지</article></div>"
+        + "".join(f"<div class='related'><a href='/r{i}'>관련 기사 {i}</a></div>" for i in range(100))
+        + "</div></body></html>"
+    )
+
+def write_fixtures():
+    """벤치마크에서 쓰는 고정 페이지 저장"""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    pages = {
+        "naver_ranking_052.html": ranking_page("052", filler=400),
+        "naver_ranking_001_small.html": ranking_page("001", seed=1, filler=50),
+        # 1~10위가 두 목록에 나뉜 페이지
+        "naver_ranking_015_split.html": ranking_page("015", seed=2, articles=10, filler=100, lists=2),
+        "naver_article_052.html": article_page("052", "2024000001"),
+    }
+    for name, html in pages.items():
+        with open(os.path.join(FIXTURE_DIR, name), "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"{name}: {len(html.encode()) / 1024:.0f}KB")
+
+if __name__ == "__main__":
+    write_fixtures()
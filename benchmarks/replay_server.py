@@ -0,0 +1,100 @@
+"""고정 데이터를 그대로 돌려주는 로컬 HTTP 서버
+
+benchmarks/fixtures의 HTML/JSON을 네이버 뉴스/업비트와 같은 경로로 응답합니다.
+응답이 매번 같으므로 커밋 사이 성능 비교에 씁니다.
+
+    /press/{언론사}/ranking        -> naver_ranking_{언론사}*.html (없으면 052)
+    /article/{언론사}/{기사 번호}   -> naver_article_052.html
+    /v1/market/all                 -> upbit_market_all.json
+    /v1/ticker?markets=...         -> upbit_ticker_all.json에서 해당 마켓
+    /v1/ticker/all?quote_currencies=...
+
+    python -m benchmarks.replay_server --port 8766
+"""
+import argparse
+import glob
+import json
+import os
+from aiohttp import web
+from benchmarks.news_fixtures import FIXTURE_DIR
+
+class ReplayServer:
+    """고정 데이터 응답 서버 (port=0이면 빈 포트 사용)"""
+
+    def __init__(self, fixture_dir: str = FIXTURE_DIR):
+        self.fixture_dir = fixture_dir
+        self.ranking_pages = {}  # 언론사 코드 -> HTML 바이트
+        for path in sorted(glob.glob(os.path.join(fixture_dir, "naver_ranking_*.html"))):
+            press = os.path.basename(path).split("_")[2].split(".")[0]
+            self.ranking_pages.setdefault(press, self._read(path))
+        self.article_page = self._read(os.path.join(fixture_dir, "naver_article_052.html"))
+        with open(os.path.join(fixture_dir, "upbit_market_all.json"), encoding="utf-8") as f:
+            self.catalog = json.load(f)
+        with open(os.path.join(fixture_dir, "upbit_ticker_all.json"), encoding="utf-8") as f:
+            self.tickers = {ticker["market"]: ticker for ticker in json.load(f)}
+        self.requests = 0
+        self.runner = None
+        self.base_url = None
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def _html(self, body: bytes) -> web.Response:
+        self.requests += 1
+        return web.Response(body=body, content_type="text/html", charset="utf-8")
+
+    def _json(self, data, status: int = 200) -> web.Response:
+        self.requests += 1
+        return web.json_response(data, status=status, dumps=lambda obj: json.dumps(obj, ensure_ascii=False))
+
+    async def ranking(self, request: web.Request) -> web.Response:
+        press = request.match_info["press"]
+        return self._html(self.ranking_pages.get(press) or self.ranking_pages["052"])
+
+    async def article(self, request: web.Request) -> web.Response:
+        return self._html(self.article_page)
+
+    async def market_all(self, request: web.Request) -> web.Response:
+        return self._json(self.catalog)
+
+    async def ticker(self, request: web.Request) -> web.Response:
+        markets = request.query.get("markets", "").split(",")
+        if any(m not in self.tickers for m in markets):
+            return self._json({"error": {"name": 404, "message": "Code not found"}}, status=404)
+        return self._json([self.tickers[m] for m in markets])
+
+    async def ticker_all(self, request: web.Request) -> web.Response:
+        quotes = request.query.get("quote_currencies", "KRW").split(",")
+        return self._json([t for m, t in self.tickers.items() if m.split("-")[0] in quotes])
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/press/{press}/ranking", self.ranking)
+        app.router.add_get("/article/{press}/{article_id}", self.article)
+        app.router.add_get("/v1/market/all", self.market_all)
+        app.router.add_get("/v1/ticker", self.ticker)
+        app.router.add_get("/v1/ticker/all", self.ticker_all)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self.runner = web.AppRunner(self.make_app(), access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="고정 데이터 응답 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+    web.run_app(ReplayServer().make_app(), host=args.host, port=args.port)
@@ -0,0 +1,34 @@
+"""업비트 REST 응답 고정 데이터(fixture) 생성
+
+utils.upbit_standin과 같은 시세(같은 seed)로 마켓 목록(/v1/market/all)과
+원화/테더/BTC 전체 시세(/v1/ticker/all) 응답을 저장합니다. 시각은 고정값이라 같은 인자면 항상 같은 파일이 나옵니다.
+
+    python -m benchmarks.upbit_fixtures
+"""
+import json
+import os
+from benchmarks.news_fixtures import FIXTURE_DIR
+from utils.upbit_standin import UpbitStandIn
+
+FIXED_TIMESTAMP = 1_700_000_000_000
+
+def upbit_responses(extra_markets: int = 200, seed: int = 42) -> dict:
+    standin = UpbitStandIn(extra_markets=extra_markets, seed=seed)
+    tickers = []
+    for market in standin.tickers:
+        ticker = dict(standin.step(market))
+        ticker["timestamp"] = FIXED_TIMESTAMP
+        tickers.append(ticker)
+    return {"market_all": standin.catalog, "ticker_all": tickers}
+
+def write_fixtures():
+    """벤치마크에서 쓰는 업비트 응답 저장"""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for name, data in upbit_responses().items():
+        path = os.path.join(FIXTURE_DIR, f"upbit_{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        print(f"upbit_{name}.json: {os.path.getsize(path) / 1024:.0f}KB")
+
+if __name__ == "__main__":
+    write_fixtures()
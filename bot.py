@@ -57,7 +57,16 @@ class MyBot(commands.Bot):
                 value=(
                     "`/코인시세` - 특정 코인의 실시간 시세 조회\n"
                     "`/인기코인` - 거래대금 TOP 5 + BTC 시세 조회\n"
-                    "`/코인알림설정` - 주기적 시세 알림 설정 (관리자)"
+                    "`/등락률순위` - 전일대비 상승/하락 TOP 5 조회\n"
+                    "`/급등락` - 최근 1/5/15/60분 급등/급락 TOP 5 조회\n"
+                    "`/시장요약` - 상승/하락 종목 수, 거래대금, 김치 프리미엄 요약\n"
+                    "`/코인차트` - 코인 가격 차트 조회\n"
+                    "`/코인비교` - 여러 코인 시세 한 번에 비교 (`/관심코인`으로 개인/서버 목록 저장)\n"
+                    "`/시장분석` - 전체 원화 마켓 기술적 지표 신호 조회\n"
+                    "`/가격알림` - 목표가 도달 알림 등록 (`/가격알림목록`, `/가격알림삭제`)\n"
+                    "`/상장알림설정` - 신규 상장/상장 폐지/유의 종목 알림 채널 설정 (관리자)\n"
+                    "`/코인알림설정` - 채널별 정기 시세 알림 코인 설정 (관리자)\n"
+                    "`/시세상태` - 업비트 요청 제한 및 캐시 상태 확인 (관리자)"
                 ),
                 inline=False
             )
@@ -67,6 +76,8 @@ class MyBot(commands.Bot):
                 name="📰 뉴스",
                 value=(
                     "`/뉴스조회` - 실시간 뉴스 확인\n"
+                    "`/뉴스검색` - 수집한 뉴스 제목/요약 검색\n"
+                    "`/뉴스상태` - 언론사별 크롤링 간격/상태 확인\n"
                     "`/뉴스알림설정` - 주기적 뉴스 알림 설정 (관리자)"
                 ),
                 inline=False
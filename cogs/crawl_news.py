@@ -1,67 +1,484 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from bs4 import BeautifulSoup
 import aiohttp
 import asyncio
+import codecs
+import copy
+import multiprocessing
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from urllib.parse import urlsplit
 import pytz
 from discord.ext import tasks
 import logging
+from utils.news_cache import PageCache, content_hash
+from utils.news_parser import get_parser, RankingStreamParser
+from utils.seen_index import SeenIndex
+from utils.summarizer import summarize_article
+from utils.news_archive import NewsArchive
+from utils.retry_policy import CircuitBreaker, CircuitOpenError, RetryPolicy
+from utils.crawl_schedule import AdaptiveSchedule
+
+DATA_DIR = os.getenv("DATA_DIR", "data")
+
+# 랭킹 페이지는 자주 바뀌지 않으므로 TTL 동안은 요청 없이 파싱 결과 재사용
+NEWS_CACHE_TTL = float(os.getenv("NEWS_CACHE_TTL", "60"))
+# 파서 백엔드 (auto/selectolax/lxml/bs4)와 파싱 실행 위치 (thread/process)
+NEWS_PARSER = os.getenv("NEWS_PARSER", "auto")
+NEWS_PARSE_EXECUTOR = os.getenv("NEWS_PARSE_EXECUTOR", "thread")
+# 1이면 페이지를 청크로 받으며 점진 파싱하고 랭킹 목록을 다 읽으면 다운로드 중단
+# (전송량은 줄지만 순수 파이썬 파서가 이벤트 루프에서 돌기 때문에 기본은 NEWS_PARSER 백엔드를 실행기에서 사용)
+NEWS_STREAMING = os.getenv("NEWS_STREAMING", "0") == "1"
+NEWS_CHUNK_SIZE = 16 * 1024
+# 요청당 제한 시간(초), 실패 시 재시도 횟수와 첫 대기 시간(초)
+NEWS_REQUEST_TIMEOUT = float(os.getenv("NEWS_REQUEST_TIMEOUT", "5"))
+NEWS_RETRIES = int(os.getenv("NEWS_RETRIES", "2"))
+NEWS_RETRY_BASE = float(os.getenv("NEWS_RETRY_BASE", "0.5"))
+# 호스트별로 연속 실패가 이만큼 쌓이면 일정 시간(초) 요청 중단
+NEWS_BREAKER_FAILURES = int(os.getenv("NEWS_BREAKER_FAILURES", "5"))
+NEWS_BREAKER_COOLDOWN = float(os.getenv("NEWS_BREAKER_COOLDOWN", "60"))
+# TTL이 지나도 이 시간(초) 안의 결과는 바로 응답하고 뒤에서 갱신 (stale-while-revalidate)
+NEWS_STALE_WHILE_REVALIDATE = float(os.getenv("NEWS_STALE_WHILE_REVALIDATE", "300"))
+# 그보다 오래된 결과만 있으면 갱신을 이 시간(초)까지만 기다리고 이전 결과로 응답
+NEWS_STALE_WAIT = float(os.getenv("NEWS_STALE_WAIT", "1.5"))
+# 알림용 크롤링 간격 범위(분)와 한 번 크롤링할 때 보이길 기대하는 새 기사 수
+NEWS_INTERVAL_MIN = float(os.getenv("NEWS_INTERVAL_MIN", "10"))
+NEWS_INTERVAL_MAX = float(os.getenv("NEWS_INTERVAL_MAX", "180"))
+NEWS_TARGET_NEW = float(os.getenv("NEWS_TARGET_NEW", "3"))
+
+# 크롤링할 언론사 코드와 랭킹 종류 (popular: 많이 본 뉴스, comment: 댓글 많은 뉴스)
+NEWS_RANKING_URL = os.getenv("NEWS_RANKING_URL", "https://media.naver.com/press/{press}/ranking?type={type}")
+NEWS_PRESSES = [p for p in os.getenv("NEWS_PRESSES", "052").split(",") if p]
+NEWS_RANKING_TYPES = [t for t in os.getenv("NEWS_RANKING_TYPES", "popular").split(",") if t]
+NEWS_CONCURRENCY = int(os.getenv("NEWS_CONCURRENCY", "8"))
+NEWS_FEED_SIZE = 10
+# 채널별로 이미 보낸 기사를 기억하는 기간(일)과 최대 개수
+NEWS_SEEN_DAYS = float(os.getenv("NEWS_SEEN_DAYS", "3"))
+NEWS_SEEN_MAX = int(os.getenv("NEWS_SEEN_MAX", "500"))
+# 기사 본문 요약 (1이면 사용), 호스트당 동시 요청 수, 요약 프로세스 수
+NEWS_SUMMARY = os.getenv("NEWS_SUMMARY", "1") == "1"
+NEWS_PER_HOST = int(os.getenv("NEWS_PER_HOST", "4"))
+NEWS_SUMMARY_WORKERS = int(os.getenv("NEWS_SUMMARY_WORKERS", "2"))
+NEWS_SUMMARY_CACHE_SIZE = 512
+NEWS_EDIT_INTERVAL = 1.0  # 요약이 채워질 때 메시지 수정 최소 간격(초)
+
+# 언론사 코드 -> 이름 (목록에 없으면 코드 그대로 표시)
+PRESS_NAMES = {
+    '001': '연합뉴스',
+    '003': '뉴시스',
+    '008': '머니투데이',
+    '009': '매일경제',
+    '011': '서울경제',
+    '014': '파이낸셜뉴스',
+    '015': '한국경제',
+    '018': '이데일리',
+    '020': '동아일보',
+    '023': '조선일보',
+    '025': '중앙일보',
+    '028': '한겨레',
+    '032': '경향신문',
+    '052': 'YTN',
+    '055': 'SBS',
+    '056': 'KBS',
+    '214': 'MBC',
+    '366': '조선비즈',
+    '421': '뉴스1',
+    '469': '한국일보',
+}
 
 class NewsItem:
-    def __init__(self, title: str, url: str, summary: str = None, date: str = None):
+    def __init__(self, title: str, url: str, summary: str = None, date: str = None,
+                 rank: int = None, press: str = None, stale: bool = False):
         self.title = title
         self.url = url
         self.summary = summary
         self.date = date
+        self.rank = rank
+        self.press = press
+        self.stale = stale  # 갱신에 실패/지연되어 이전 결과를 보여주는 경우
+
+def format_duration(seconds: float) -> str:
+    """초 -> "N분" 또는 "N.N시간" 표시"""
+    if seconds < 3600:
+        return f"{max(0, seconds) / 60:.0f}분"
+    return f"{seconds / 3600:.1f}시간"
+
+def article_key(url: str) -> str:
+    """같은 기사를 가리키는 URL을 하나로 묶기 위한 키 (언론사/기사 번호)"""
+    match = re.search(r"/article/(\d+)/(\d+)", url)
+    return f"{match.group(1)}/{match.group(2)}" if match else url.split("?")[0]
 
 class CrawlNews(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.news_channel_id = None
+        self.seen_index = SeenIndex(
+            os.path.join(DATA_DIR, "news_seen.json"),
+            ttl=NEWS_SEEN_DAYS * 86400,
+            max_per_channel=NEWS_SEEN_MAX
+        )
         self.session = None
-        self.news_url = "https://media.naver.com/press/052/ranking?type=popular"
+        self.sources = [(press, ranking_type) for press in NEWS_PRESSES for ranking_type in NEWS_RANKING_TYPES]
+        self.crawl_semaphore = asyncio.Semaphore(NEWS_CONCURRENCY)
+        self.page_cache = PageCache(ttl=NEWS_CACHE_TTL)
+        self.inflight = {}  # URL -> 진행 중인 크롤링 (동시 요청 병합)
+        self.degraded = set()  # 마지막 갱신이 실패했거나 기다려도 끝나지 않은 URL (이전 결과 경고 표시용)
+        self.retry_policy = RetryPolicy(
+            attempts=NEWS_RETRIES + 1,
+            timeout=NEWS_REQUEST_TIMEOUT,
+            base_delay=NEWS_RETRY_BASE
+        )
+        self.breakers = {}  # 호스트 -> 서킷 브레이커
+        self.schedule = AdaptiveSchedule(
+            min_interval=NEWS_INTERVAL_MIN * 60,
+            max_interval=NEWS_INTERVAL_MAX * 60,
+            target_new=NEWS_TARGET_NEW
+        )
+        self.parser_name, self.parser = get_parser(NEWS_PARSER)
+        self.bytes_received = 0
+        self.aborted_downloads = 0  # 랭킹 목록만 읽고 중단한 다운로드 수
+        self.parse_executor = None  # None이면 기본 스레드 풀
+        if NEWS_PARSE_EXECUTOR == "process":
+            # 이벤트 루프 스레드가 도는 프로세스를 fork하지 않도록 spawn 사용
+            self.parse_executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        logging.info(f"뉴스 파서: {self.parser_name} ({NEWS_PARSE_EXECUTOR})")
+        self.summary_cache: "OrderedDict[str, str]" = OrderedDict()  # 기사 URL -> 요약 (LRU)
+        self.summary_inflight = {}  # 기사 URL -> 진행 중인 요약 작업
+        self.host_semaphores = {}  # 호스트 -> 동시 요청 제한
+        self.summary_executor = None
+        self.archive = NewsArchive(os.path.join(DATA_DIR, "news_archive.db"))
+        self.archived_parses = 0  # 마지막으로 보관소에 저장했을 때의 파싱 횟수
+        self.archive_tasks = set()
+        self.summary_tasks = set()  # 알림 메시지에 요약을 채우는 작업
         self.daily_news_task.start()
         
     async def init_session(self):
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            # 같은 호스트로 가는 요청이 많으므로 연결을 재사용 (keep-alive)
+            connector = aiohttp.TCPConnector(limit=NEWS_CONCURRENCY, keepalive_timeout=60)
+            self.session = aiohttp.ClientSession(connector=connector)
     
     async def close_session(self):
         if self.session:
             await self.session.close()
             self.session = None
 
-    async def fetch_news(self, url: str) -> list[NewsItem]:
-        """뉴스 크롤링 메인 함수"""
+    async def fetch_news(self, url: str, stale_ok: bool = True) -> list[NewsItem]:
+        """뉴스 크롤링 메인 함수 (캐시 경유, 갱신이 늦거나 실패하면 마지막 결과)
+
+        stale_ok가 False면 (알림 작업) 갱신을 끝까지 기다리고 실패한 경우에만 마지막 결과를 씁니다.
+        """
+        items = self.page_cache.fresh(url)
+        if items is not None:
+            return items
+        task = self.refresh(url)
+        age = self.page_cache.age(url)
+        if age is None or not stale_ok:
+            try:
+                # 호출자가 취소되어도 공유 요청은 계속 진행되도록 shield 처리
+                return await asyncio.shield(task)
+            except Exception:
+                # 오류는 _refresh_done에서 기록
+                return self.page_cache.last_good(url) or []
+        
+        # 이전 결과가 있으면 갱신을 오래 기다리지 않음 (업스트림 장애 중에도 응답 시간 유지)
+        wait = 0 if age < self.page_cache.ttl + NEWS_STALE_WHILE_REVALIDATE else NEWS_STALE_WAIT
+        done, _ = await asyncio.wait({task}, timeout=wait)
+        if task in done and not task.cancelled() and task.exception() is None:
+            return task.result()
+        if wait or task in done:
+            # 백그라운드 갱신 중이라 이전 결과를 준 경우와 달리, 갱신이 실패했거나 기다려도 끝나지 않은 경우
+            self.degraded.add(url)
+        return self.page_cache.last_good(url)
+
+    def refresh(self, url: str) -> asyncio.Task:
+        """URL 갱신 작업 (진행 중이면 그 작업을 공유)"""
+        task = self.inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._crawl(url))
+            self.inflight[url] = task
+            task.add_done_callback(lambda done: self._refresh_done(url, done))
+        return task
+
+    def _refresh_done(self, url: str, task: asyncio.Task):
+        if self.inflight.get(url) is task:
+            del self.inflight[url]
+        if task.cancelled():
+            return
+        if task.exception() is None:
+            self.degraded.discard(url)
+        else:
+            self.degraded.add(url)
+            logging.error(f"뉴스 크롤링 중 오류 발생 ({url}): {task.exception()}")
+            # 실패한 소스는 매분 다시 시도하지 않고 최소 간격 뒤에 다시 크롤링
+            self.schedule.postpone(url, self.schedule.min_interval)
+
+    def circuit_breaker(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        if host not in self.breakers:
+            self.breakers[host] = CircuitBreaker(NEWS_BREAKER_FAILURES, NEWS_BREAKER_COOLDOWN)
+        return self.breakers[host]
+
+    async def _crawl(self, url: str) -> list[NewsItem]:
+        items = await self.request_with_retry(url, self.request_page)
+        # 304/같은 본문이어도 "바뀌지 않음"으로 기록해 다음 크롤링 간격에 반영
+        self.schedule.observe(url, [article_key(item.url) for item in items])
+        return items
+
+    async def request_with_retry(self, url: str, request):
+        """일시적인 오류는 지수 백오프로 재시도, 연속 실패한 호스트는 잠시 요청 중단"""
+        await self.init_session()
+        breaker = self.circuit_breaker(url)
+        for attempt in range(self.retry_policy.attempts):
+            if not breaker.allow():
+                raise CircuitOpenError(
+                    f"{urlsplit(url).netloc} 요청 중단 중 ({breaker.retry_after():.0f}초 후 재시도)"
+                )
+            try:
+                result = await request(url)
+            except Exception as e:
+                if not self.retry_policy.retryable(e):
+                    raise
+                breaker.record_failure()
+                if attempt + 1 >= self.retry_policy.attempts:
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                logging.warning(f"뉴스 요청 실패, {delay:.1f}초 후 재시도 ({url}): {type(e).__name__} {e}")
+                await asyncio.sleep(delay)
+            else:
+                breaker.record_success()
+                return result
+
+    async def request_page(self, url: str) -> list[NewsItem]:
+        """조건부 요청으로 페이지를 받아 바뀐 경우에만 파싱"""
+        timeout = aiohttp.ClientTimeout(total=self.retry_policy.timeout)
+        async with self.session.get(url, headers=self.page_cache.validators(url), timeout=timeout) as response:
+            if response.status == 304:
+                items = self.page_cache.revalidated(url)
+                if items is not None:
+                    return items
+            # 5xx/429는 재시도 대상으로 구분할 수 있게 상태 코드를 담은 예외로
+            response.raise_for_status()
+            if response.status != 200:
+                raise Exception(f"HTTP 요청 실패: {response.status}")
+            
+            if NEWS_STREAMING:
+                ranked, body_hash = await self.read_ranking_stream(response)
+            else:
+                body = await response.read()
+                self.bytes_received += len(body)
+                body_hash = content_hash(body)
+            # 검증자를 주지 않는 서버도 본문이 같으면 파싱 생략
+            items = self.page_cache.revalidated(url, body_hash)
+            if items is not None:
+                return items
+            
+            if NEWS_STREAMING:
+                items = [NewsItem(title=title, url=link, rank=int(rank)) for rank, title, link in ranked]
+            else:
+                html = body.decode(response.get_encoding(), errors="replace")
+                items = await self.parse_news(html)
+            if not items:
+                # 페이지 구조가 바뀌었거나 오류 페이지인 경우 빈 결과로 이전 결과를 덮지 않음
+                raise Exception("랭킹 목록을 찾을 수 없습니다")
+            self.page_cache.store(
+                url, items,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body_hash=body_hash
+            )
+            return items
+
+    async def read_ranking_stream(self, response: aiohttp.ClientResponse) -> tuple[list, str]:
+        """응답을 청크로 읽으며 점진 파싱하고, 랭킹 목록이 끝나면 나머지는 받지 않음
+
+        변경 감지 해시는 페이지 전체 대신 랭킹 목록 부분으로 계산합니다.
+        """
+        decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+        parser = RankingStreamParser(limit=10)
+        async for chunk in response.content.iter_chunked(NEWS_CHUNK_SIZE):
+            self.bytes_received += len(chunk)
+            parser.feed_chunk(decoder.decode(chunk))
+            if parser.done:
+                if response.content.is_eof():
+                    # 이미 다 받은 경우에는 버퍼만 비움 (남겨 두면 풀에 돌아간 연결의 읽기가 멈춘 채로 재사용됨)
+                    await response.content.read()
+                else:
+                    # 남은 본문을 읽지 않고 연결을 닫아 전송 중단
+                    response.close()
+                    self.aborted_downloads += 1
+                break
+        return parser.items, content_hash(parser.ranking_block().encode())
+
+    async def parse_news(self, html: str) -> list[NewsItem]:
+        """랭킹 페이지 HTML에서 상위 10개 기사 추출 (이벤트 루프 밖에서 파싱)"""
+        loop = asyncio.get_running_loop()
+        ranked = await loop.run_in_executor(self.parse_executor, self.parser, html, 10)
+        return [NewsItem(title=title, url=url, rank=int(rank)) for rank, title, url in ranked]
+
+    def source_url(self, press: str, ranking_type: str) -> str:
+        return NEWS_RANKING_URL.format(press=press, type=ranking_type)
+
+    async def fetch_feed(self, due: list[str] = None, stale_ok: bool = True) -> list[NewsItem]:
+        """설정된 모든 언론사/랭킹을 동시에 크롤링해 하나의 순위로 합침
+
+        due를 주면 그 URL만 크롤링하고 나머지는 마지막 결과를 그대로 씁니다.
+        """
+        async def crawl(press: str, ranking_type: str) -> list[tuple]:
+            url = self.source_url(press, ranking_type)
+            if due is not None and url not in due:
+                items = self.page_cache.peek(url)
+                if items is not None:
+                    return [(press, item) for item in items]
+            async with self.crawl_semaphore:
+                items = await self.fetch_news(url, stale_ok)
+            age = self.page_cache.age(url)
+            if url in self.degraded and age is not None and age >= self.page_cache.ttl:
+                # 갱신에 실패/지연되어 이전 결과로 응답한 경우 (캐시된 항목은 그대로 두고 복사본에 표시)
+                # 백그라운드 갱신 중 잠깐 이전 결과를 준 경우는 경고하지 않음
+                items = [copy.copy(item) for item in items]
+                for item in items:
+                    item.stale = True
+            return [(press, item) for item in items]
+        
+        feeds = await asyncio.gather(*[crawl(press, ranking_type) for press, ranking_type in self.sources])
+        # 새로 파싱한 페이지가 있을 때만 이번 크롤링 결과 전체를 한 번에 보관
+        if self.page_cache.parses != self.archived_parses:
+            self.archived_parses = self.page_cache.parses
+            self.archive_in_background(self.archive.add_many, [
+                {"key": article_key(item.url), "title": item.title, "url": item.url,
+                 "press": press, "summary": item.summary, "rank": item.rank}
+                for feed in feeds for press, item in feed
+            ])
+        return self.merge_feeds(feeds)
+
+    def archive_in_background(self, func, *args):
+        """보관소 쓰기는 스레드에서 실행하고 기다리지 않음 (크롤링/전송이 늦어지지 않도록)"""
+        task = asyncio.create_task(asyncio.to_thread(func, *args))
+        self.archive_tasks.add(task)
+        task.add_done_callback(self._archive_done)
+
+    def _archive_done(self, task: asyncio.Task):
+        self.archive_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logging.error(f"뉴스 보관 중 오류: {task.exception()}")
+
+    def merge_feeds(self, feeds: list[list[tuple]], limit: int = NEWS_FEED_SIZE) -> list[NewsItem]:
+        """언론사별 순위를 같은 순위끼리 번갈아 합치고 중복 기사 제거 (캐시된 항목은 수정하지 않음)"""
+        merged = []
+        seen = set()
+        ordered = sorted(
+            ((item.rank or 0, source, press, item)
+             for source, feed in enumerate(feeds) for press, item in feed),
+            key=lambda entry: (entry[0], entry[1])
+        )
+        for _, _, press, item in ordered:
+            key = article_key(item.url)
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(NewsItem(
+                title=item.title, url=item.url, date=item.date,
+                summary=item.summary or self.summary_cache.get(item.url),
+                rank=len(merged) + 1, press=press, stale=item.stale
+            ))
+            if len(merged) >= limit:
+                break
+        return merged
+
+    def host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(NEWS_PER_HOST)
+        return self.host_semaphores[host]
+
+    def get_summary_executor(self) -> ProcessPoolExecutor:
+        if not self.summary_executor:
+            self.summary_executor = ProcessPoolExecutor(
+                max_workers=NEWS_SUMMARY_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self.summary_executor
+
+    async def fetch_summary(self, url: str) -> str | None:
+        """기사 본문을 받아 요약 (URL당 한 번만 받고 결과는 캐시)"""
+        if url in self.summary_cache:
+            self.summary_cache.move_to_end(url)
+            return self.summary_cache[url]
+        if url not in self.summary_inflight:
+            self.summary_inflight[url] = asyncio.create_task(self._summarize(url))
+        task = self.summary_inflight[url]
         try:
-            await self.init_session()
-            async with self.session.get(url) as response:
+            return await asyncio.shield(task)
+        finally:
+            if task.done() and self.summary_inflight.get(url) is task:
+                del self.summary_inflight[url]
+
+    async def request_article(self, url: str) -> str:
+        """기사 본문 HTML (랭킹 페이지와 같은 요청 제한 시간)"""
+        timeout = aiohttp.ClientTimeout(total=self.retry_policy.timeout)
+        async with self.host_semaphore(url):
+            async with self.session.get(url, timeout=timeout) as response:
+                # 5xx/429는 재시도 대상으로 구분할 수 있게 상태 코드를 담은 예외로
+                response.raise_for_status()
                 if response.status != 200:
                     raise Exception(f"HTTP 요청 실패: {response.status}")
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                news_items = []
-                articles = soup.select('ul.press_ranking_list > li.as_thumb')[:10]  
-                
-                for article in articles:
-                    title = article.select_one('strong.list_title').text.strip()
-                    url = article.select_one('a._es_pc_link')['href']
-                    rank = article.select_one('em.list_ranking_num').text.strip()
-                    
-                    news_items.append(NewsItem(
-                        title=f"{rank}. {title}",
-                        url=url
-                    ))
-                
-                return news_items
-                
+                body = await response.read()
+                return body.decode(response.get_encoding(), errors="replace")
+
+    async def _summarize(self, url: str) -> str | None:
+        try:
+            html = await self.request_with_retry(url, self.request_article)
+            
+            loop = asyncio.get_running_loop()
+            summary = await loop.run_in_executor(self.get_summary_executor(), summarize_article, html)
+            self.summary_cache[url] = summary
+            if len(self.summary_cache) > NEWS_SUMMARY_CACHE_SIZE:
+                self.summary_cache.popitem(last=False)
+            return summary
         except Exception as e:
-            logging.error(f"뉴스 크롤링 중 오류 발생: {e}")
-            return []
+            logging.error(f"기사 요약 중 오류 ({url}): {e}")
+            return None
+
+    async def fill_summaries(self, news_items: list[NewsItem], messages: list[discord.Message]):
+        """요약이 없는 기사를 동시에 요약하고, 끝나는 대로 이미 보낸 메시지를 수정"""
+        pending = [item for item in news_items if not item.summary]
+        if not NEWS_SUMMARY or not pending or not messages:
+            return
+        
+        async def summarize(item: NewsItem):
+            item.summary = await self.fetch_summary(item.url)
+        
+        async def edit():
+            embed = self.create_news_embed(news_items)
+            for message in messages:
+                try:
+                    await message.edit(embed=embed)
+                except discord.HTTPException as e:
+                    logging.error(f"뉴스 요약 반영 실패: {e}")
+        
+        # 수정 요청이 너무 잦지 않도록 NEWS_EDIT_INTERVAL 간격으로 모아서 반영
+        last_edit = time.monotonic()
+        changed = False
+        for finished in asyncio.as_completed([summarize(item) for item in pending]):
+            await finished
+            changed = True
+            if time.monotonic() - last_edit >= NEWS_EDIT_INTERVAL:
+                await edit()
+                last_edit = time.monotonic()
+                changed = False
+        if changed:
+            await edit()
+        self.archive_in_background(self.archive.set_summaries, {
+            article_key(item.url): item.summary for item in pending if item.summary
+        })
 
     def create_news_embed(self, news_items: list[NewsItem]) -> discord.Embed:
         """뉴스 임베드 생성"""
@@ -73,29 +490,69 @@ class CrawlNews(commands.Cog):
         )
         
         for item in news_items:
+            press = f" · {PRESS_NAMES.get(item.press, item.press)}" if item.press else ""
             embed.add_field(
-                name=item.title,
-                value=f"[링크]({item.url})\n{item.summary if item.summary else ''}\n",
+                name=f"{item.rank}. {item.title}" if item.rank else item.title,
+                value=f"[링크]({item.url}){press}\n{item.summary if item.summary else ''}\n",
                 inline=False
             )
             
-        embed.set_footer(text=f"마지막 업데이트: {datetime.now(pytz.timezone('Asia/Seoul')).strftime('%H:%M')}")
+        footer = f"마지막 업데이트: {datetime.now(pytz.timezone('Asia/Seoul')).strftime('%H:%M')}"
+        if any(item.stale for item in news_items):
+            footer += " • 뉴스 서버 응답이 늦어 일부는 이전 결과입니다 (갱신 중)"
+        embed.set_footer(text=footer)
         return embed
 
-    @tasks.loop(hours=3)  # 3시간마다 실행
+    @tasks.loop(minutes=1)  # 소스별 크롤링 시각 확인
     async def daily_news_task(self):
-        """뉴스 전송 (3시간 간격)"""
-        if not self.news_channel_id:
+        """구독 채널에 아직 보내지 않은 뉴스만 전송 (크롤링할 때가 된 소스가 있을 때만, 새 뉴스가 없으면 생략)"""
+        channel_ids = self.seen_index.channel_ids()
+        if not channel_ids:
             return
-            
-        channel = self.bot.get_channel(self.news_channel_id)
-        if not channel:
+        due = self.schedule.due(self.source_url(press, ranking_type) for press, ranking_type in self.sources)
+        if not due:
             return
             
-        news_items = await self.fetch_news(self.news_url)
-        if news_items:
-            embed = self.create_news_embed(news_items)
-            await channel.send(embed=embed)
+        news_items = await self.fetch_feed(due, stale_ok=False)
+        for url in due:
+            self.schedule.advance(url)
+        if not news_items:
+            return
+        
+        items_by_key = {article_key(item.url): item for item in news_items}
+        embeds = {}  # 새 기사 키 묶음 -> 임베드 (같은 묶음을 받는 채널끼리는 한 번만 생성)
+        messages = {}  # 새 기사 키 묶음 -> 보낸 메시지 (요약이 채워지면 수정)
+        for channel_id in channel_ids:
+            channel = self.bot.get_channel(channel_id)
+            if not channel:
+                continue
+            new_keys = tuple(self.seen_index.unseen(channel_id, items_by_key))
+            if not new_keys:
+                continue
+            if new_keys not in embeds:
+                embeds[new_keys] = self.create_news_embed([items_by_key[key] for key in new_keys])
+            try:
+                message = await channel.send(embed=embeds[new_keys])
+                messages.setdefault(new_keys, []).append(message)
+                self.seen_index.mark(channel_id, new_keys)
+            except discord.HTTPException as e:
+                logging.error(f"뉴스 전송 실패 (channel {channel_id}): {e}")
+        
+        self.seen_index.save()
+        # 요약은 기다리지 않음 (요약이 오래 걸려도 다음 크롤링 확인이 밀리지 않도록)
+        for new_keys, sent in messages.items():
+            task = asyncio.create_task(self.fill_summaries([items_by_key[key] for key in new_keys], sent))
+            self.summary_tasks.add(task)
+            task.add_done_callback(self._summary_done)
+
+    def _summary_done(self, task: asyncio.Task):
+        self.summary_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logging.error(f"뉴스 요약 반영 중 오류: {task.exception()}")
+
+    @daily_news_task.before_loop
+    async def before_daily_news_task(self):
+        await self.bot.wait_until_ready()
 
     @app_commands.command(name="뉴스조회", description="실시간 뉴스를 조회합니다")
     async def check_news(self, interaction: discord.Interaction):
@@ -103,34 +560,122 @@ class CrawlNews(commands.Cog):
         await interaction.response.defer() 
         
         try:
-            news_items = await self.fetch_news(self.news_url)
+            news_items = await self.fetch_feed()
             if news_items:
+                # 목록을 먼저 보내고 요약은 준비되는 대로 채움
                 embed = self.create_news_embed(news_items)
-                await interaction.followup.send(embed=embed)
+                message = await interaction.followup.send(embed=embed, wait=True)
+                await self.fill_summaries(news_items, [message])
             else:
                 await interaction.followup.send("뉴스를 가져오는데 실패했습니다.", ephemeral=True)
         except Exception as e:
             logging.error(f"뉴스 조회 중 오류 발생: {e}")
             await interaction.followup.send(f"오류가 발생했습니다: {str(e)}", ephemeral=True)
 
-    @app_commands.command(name="뉴스알림설정", description="실시간 뉴스 알림을 받을 채널을 설정합니다")
-    @app_commands.checks.has_permissions(administrator=True)
-    async def set_news_channel(self, interaction: discord.Interaction):
-        """뉴스 채널 설정"""
-        self.news_channel_id = interaction.channel.id
+    @app_commands.command(name="뉴스검색", description="지금까지 수집한 뉴스 제목/요약을 검색합니다")
+    @app_commands.describe(검색어="검색할 단어 (여러 단어는 모두 포함된 기사만)")
+    async def search_news(self, interaction: discord.Interaction, 검색어: str):
+        """뉴스 보관소 검색"""
+        await interaction.response.defer()
         
+        try:
+            start = time.perf_counter()
+            results = await asyncio.to_thread(self.archive.search, 검색어, 10)
+            elapsed = (time.perf_counter() - start) * 1000
+            
+            embed = discord.Embed(
+                title=f"🔎 뉴스 검색 - {검색어}",
+                description=None if results else "```검색 결과가 없습니다.```",
+                color=discord.Color.blue()
+            )
+            seoul = pytz.timezone('Asia/Seoul')
+            for result in results:
+                press = PRESS_NAMES.get(result["press"], result["press"]) if result["press"] else ""
+                seen = datetime.fromtimestamp(result["first_seen"], seoul).strftime("%Y-%m-%d %H:%M")
+                summary = result["summary"] or ""
+                embed.add_field(
+                    name=result["title"][:256],
+                    value=f"[링크]({result['url']}) · {press} · {seen}\n{summary}"[:1024],
+                    inline=False
+                )
+            embed.set_footer(text=f"{len(results)}건 • {elapsed:.1f}ms")
+            await interaction.followup.send(embed=embed)
+        except Exception as e:
+            logging.error(f"뉴스 검색 중 오류 발생: {e}")
+            await interaction.followup.send(f"오류가 발생했습니다: {str(e)}", ephemeral=True)
+
+    @app_commands.command(name="뉴스상태", description="언론사별 뉴스 크롤링 간격과 상태를 확인합니다")
+    async def news_status(self, interaction: discord.Interaction):
+        """소스별 현재 크롤링 간격/변경 빈도/서버 상태"""
+        now = time.monotonic()
+        breaker_states = {"closed": "정상", "open": "요청 중단", "half_open": "재시도 대기"}
         embed = discord.Embed(
-            title="✅ 뉴스 채널 설정 완료",
-            description="설정한 게시판에서 3시간 간격으로 뉴스가 전송됩니다.",
-            color=discord.Color.green()
+            title="📡 뉴스 크롤링 상태",
+            description=(
+                f"간격 범위: {format_duration(self.schedule.min_interval)} ~ {format_duration(self.schedule.max_interval)} "
+                f"(크롤링마다 새 기사 {self.schedule.target_new:g}건 목표)"
+            ),
+            color=discord.Color.blue()
         )
+        for press, ranking_type in self.sources:
+            url = self.source_url(press, ranking_type)
+            source = self.schedule.get(url)
+            rate = f"{source.rate * 3600:.1f}건/시간" if source.rate is not None else "측정 전"
+            changed = f"{format_duration(now - source.changed_at)} 전" if source.changed_at else "-"
+            embed.add_field(
+                name=f"{PRESS_NAMES.get(press, press)} · {ranking_type}",
+                value=(
+                    f"간격 {format_duration(source.interval)} · 새 기사 {rate}\n"
+                    f"다음 확인 {format_duration(source.next_at - now)} 후 · 마지막 변경 {changed}\n"
+                    f"서버: {breaker_states[self.circuit_breaker(url).state]}"
+                ),
+                inline=False
+            )
+        cache = self.page_cache
+        embed.set_footer(
+            text=f"캐시 적중 {cache.hits} · 변경 없음 {cache.not_modified} · 파싱 {cache.parses} · "
+                 f"이전 결과 응답 {cache.stale_served} · 수신 {self.bytes_received / 1024:.0f}KB"
+        )
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="뉴스알림설정", description="실시간 뉴스 알림을 받을 채널을 설정합니다")
+    @app_commands.describe(해제="이 채널의 뉴스 알림 끄기")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def set_news_channel(self, interaction: discord.Interaction, 해제: bool = False):
+        """뉴스 채널 설정"""
+        if 해제:
+            self.seen_index.unsubscribe(interaction.channel.id)
+            embed = discord.Embed(
+                title="🔕 뉴스 알림 해제",
+                description="이 채널에서 더 이상 뉴스를 보내지 않습니다.",
+                color=discord.Color.light_grey()
+            )
+        else:
+            self.seen_index.subscribe(interaction.channel.id)
+            embed = discord.Embed(
+                title="✅ 뉴스 채널 설정 완료",
+                description=(
+                    f"설정한 게시판에 새 뉴스가 전송됩니다. 뉴스가 바뀌는 빈도에 맞춰 "
+                    f"{format_duration(NEWS_INTERVAL_MIN * 60)}~{format_duration(NEWS_INTERVAL_MAX * 60)} 간격으로 확인합니다. "
+                    "(이미 보낸 뉴스는 다시 보내지 않습니다)"
+                ),
+                color=discord.Color.green()
+            )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    def cog_unload(self):
+    async def cog_unload(self):
         """Cog 언로드 시 정리 작업"""
         self.daily_news_task.cancel()
-        if self.session:
-            asyncio.create_task(self.close_session())
+        for task in self.summary_tasks:
+            task.cancel()
+        for executor in (self.parse_executor, self.summary_executor):
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+        await asyncio.gather(*self.summary_tasks, return_exceptions=True)
+        await self.close_session()
+        # 스레드에서 진행 중인 보관소 쓰기가 끝난 뒤에 연결을 닫음
+        await asyncio.gather(*self.archive_tasks, return_exceptions=True)
+        self.archive.close()
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(CrawlNews(bot)) 
\ No newline at end of file
@@ -2,12 +2,91 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import aiohttp
+import asyncio
+import io
 import logging
+import os
+import time
 from datetime import datetime
 import pytz
+import numpy as np
 from typing import Optional, List, Dict
 from discord.ext import tasks
+from utils.ticker_cache import TickerCache
+from utils.market_catalog import MarketCatalog
+from utils.coin_search import CoinNotFoundError
+from utils.upbit_stream import UpbitTickerStream
+from utils.market_ranking import MarketRanking
+from utils.rate_limiter import UpbitRateLimiter, RateLimitExceeded
+from utils.price_alerts import PriceAlertIndex
+from utils.candle_store import CandleStore, INTERVALS
+from utils.chart_render import ChartRenderer
+from utils.watchlists import WatchlistStore
+from utils.indicators import build_market_matrix, analyze_markets
+from utils.price_history import PriceHistory
+from utils.market_summary import summarize_market
+from utils.listing_watch import ListingWatcher, CatalogChanges
 
+UPBIT_API_URL = os.getenv("UPBIT_API_URL", "https://api.upbit.com/v1")
+UPBIT_WS_URL = os.getenv("UPBIT_WS_URL", "wss://api.upbit.com/websocket/v1")
+# 웹소켓 실시간 시세 사용 여부 및 시세판 만료 시간 (초)
+UPBIT_STREAM = os.getenv("UPBIT_STREAM", "0") == "1"
+STREAM_STALE_AFTER = float(os.getenv("STREAM_STALE_AFTER", "10"))
+# 시세 캐시 유지 시간 (초)
+TICKER_CACHE_TTL = float(os.getenv("TICKER_CACHE_TTL", "1.5"))
+# 업비트 요청 그룹별 초당 요청 수 및 최대 대기 시간 (초)
+UPBIT_RATE_LIMIT = float(os.getenv("UPBIT_RATE_LIMIT", "10"))
+UPBIT_MAX_WAIT = float(os.getenv("UPBIT_MAX_WAIT", "2"))
+# 마켓 카탈로그 갱신 주기 (분)
+# 변경이 없으면 해시 비교만 하므로 상장/폐지 감지를 위해 1분마다 갱신
+CATALOG_REFRESH_MINUTES = float(os.getenv("CATALOG_REFRESH_MINUTES", "1"))
+# 봇 데이터 저장 경로
+DATA_DIR = os.getenv("DATA_DIR", "data")
+# 목표가 알림 확인 주기 (초), 같은 알림 재발송 대기 시간 (초), 유저당 최대 알림 수
+ALERT_CHECK_SECONDS = float(os.getenv("ALERT_CHECK_SECONDS", "5"))
+ALERT_COOLDOWN = float(os.getenv("ALERT_COOLDOWN", "300"))
+MAX_ALERTS_PER_USER = 20
+# 디스코드 메시지 한도 (임베드당 필드 수, 메시지당 임베드 수, 메시지당 임베드 전체 글자 수)
+EMBED_MAX_FIELDS = 25
+MESSAGE_MAX_EMBEDS = 10
+MESSAGE_MAX_EMBED_CHARS = 6000
+# 단기 급등락 계산용 시세 기록 보관 시간 (샘플링 주기는 ALERT_CHECK_SECONDS 공유)
+PRICE_HISTORY_MINUTES = int(os.getenv("PRICE_HISTORY_MINUTES", "60"))
+MOVER_PERIOD_CHOICES = [
+    app_commands.Choice(name="1분", value=1),
+    app_commands.Choice(name="5분", value=5),
+    app_commands.Choice(name="15분", value=15),
+    app_commands.Choice(name="60분", value=60),
+]
+# 시세 한 번 요청당 최대 마켓 수, 비교 명령어 최대 코인 수
+TICKER_CHUNK_SIZE = int(os.getenv("TICKER_CHUNK_SIZE", "50"))
+MAX_COMPARE_COINS = 20
+# 정기 시세 알림 채널이 서버 관심 코인(없으면 BTC + 거래대금 TOP 5)을 따른다는 표시
+REPORT_DEFAULT = "*"
+REPORT_HOURS = float(os.getenv("REPORT_HOURS", "3"))
+# 시장 분석에 사용할 캔들 간격과 개수
+ANALYSIS_INTERVAL = os.getenv("ANALYSIS_INTERVAL", "1d")
+ANALYSIS_LENGTH = 60
+# 백그라운드로 모든 원화 마켓을 동기화할 캔들 간격, 최초 수집 개수, 동기화 주기 (분)
+CANDLE_SYNC_INTERVALS = [i for i in os.getenv("CANDLE_SYNC_INTERVALS", "1d").split(",") if i]
+# 시장 분석은 동기화된 캔들만 읽으므로 분석 간격은 항상 동기화
+if ANALYSIS_INTERVAL not in CANDLE_SYNC_INTERVALS:
+    CANDLE_SYNC_INTERVALS.append(ANALYSIS_INTERVAL)
+CANDLE_BACKFILL = int(os.getenv("CANDLE_BACKFILL", "200"))
+CANDLE_SYNC_MINUTES = float(os.getenv("CANDLE_SYNC_MINUTES", "30"))
+# 차트 렌더링 프로세스 수
+CHART_WORKERS = int(os.getenv("CHART_WORKERS", "2"))
+
+CHART_INTERVAL_CHOICES = [
+    app_commands.Choice(name="1분봉", value="1m"),
+    app_commands.Choice(name="5분봉", value="5m"),
+    app_commands.Choice(name="15분봉", value="15m"),
+    app_commands.Choice(name="1시간봉", value="60m"),
+    app_commands.Choice(name="4시간봉", value="240m"),
+    app_commands.Choice(name="일봉", value="1d"),
+]
+
+# 마켓 카탈로그를 불러오기 전까지 사용하는 기본 한글명
 COIN_NAMES = {
     'BTC': '비트코인',
     'ETH': '이더리움',
@@ -159,26 +238,48 @@ COIN_NAMES = {
     'MATIC': '폴리곤',
 }
 
-def create_reverse_mapping(coin_names: dict) -> dict:
-    """코인 한글명으로 심볼을 찾기 위한 역방향 매핑"""
-    reverse_map = {}
-    for symbol, korean in coin_names.items():
-        # 기본 한글명 매핑
-        reverse_map[korean.lower()] = symbol
-        # 특수문자 제거한 한글명도 매핑 (예: "비트코인골드" -> BTG)
-        cleaned_name = korean.replace(" ", "").lower()
-        reverse_map[cleaned_name] = symbol
-    return reverse_map
-
-COIN_SYMBOLS = create_reverse_mapping(COIN_NAMES)
-
 class Finance(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.session = None
-        self.base_url = "https://api.upbit.com/v1"
-        self.alert_channel_id = None
-        self.price_alert_task.start()  # 가격 알림 task 시작
+        self.base_url = UPBIT_API_URL
+        self.rate_limiter = UpbitRateLimiter(rate=UPBIT_RATE_LIMIT, max_wait=UPBIT_MAX_WAIT)
+        self.ticker_cache = TickerCache(self.request_tickers, ttl=TICKER_CACHE_TTL)
+        self.ranking = MarketRanking()  # 원화 마켓 순위표
+        self.catalog = MarketCatalog(self.request_market_catalog, COIN_NAMES)
+        self.listing_watcher = ListingWatcher(os.path.join(DATA_DIR, "listing_watch.json"))
+        self.handled_catalog_digest = None
+        self.catalog_refresh_task.change_interval(minutes=CATALOG_REFRESH_MINUTES)
+        self.catalog_refresh_task.start()  # 마켓 카탈로그 갱신 task 시작
+        self.stream = None
+        if UPBIT_STREAM:
+            self.stream = UpbitTickerStream(
+                UPBIT_WS_URL,
+                self.stream_markets,
+                stale_after=STREAM_STALE_AFTER,
+                on_ticker=lambda ticker: self.ingest_tickers([ticker])
+            )
+            self.stream.start()
+        self.price_alert_task.change_interval(hours=REPORT_HOURS)
+        self.price_alert_task.start()  # 정기 시세 알림 task 시작
+        self.alert_index = PriceAlertIndex(
+            os.path.join(DATA_DIR, "price_alerts.json"),
+            cooldown=ALERT_COOLDOWN
+        )
+        self.fired_alerts = []  # 다음 틱에 묶어서 보낼 발동 알림
+        self.price_history = PriceHistory(
+            capacity=int(PRICE_HISTORY_MINUTES * 60 / ALERT_CHECK_SECONDS) + 1
+        )
+        self.market_tick_task.change_interval(seconds=ALERT_CHECK_SECONDS)
+        self.market_tick_task.start()  # 시세 샘플링 + 목표가 알림 task 시작
+        self.candles = CandleStore(os.path.join(DATA_DIR, "candles"), self.request_candles)
+        self.candle_sync_task.change_interval(minutes=CANDLE_SYNC_MINUTES)
+        self.candle_sync_task.start()  # 캔들 동기화 task 시작
+        self.chart_renderer = ChartRenderer(max_workers=CHART_WORKERS)
+        self.watchlists = WatchlistStore(os.path.join(DATA_DIR, "watchlists.json"))
+        self.analysis_cache = None  # (캔들 저장소 버전 키, 지표 결과)
+        self.snapshot_cache = None  # (조회 시각, 원화/테더/BTC 전체 시세)
+        self.snapshot_task = None  # 진행 중인 전체 시세 조회 (동시 요청 병합)
         
     async def init_session(self):
         if not self.session:
@@ -190,23 +291,80 @@ class Finance(commands.Cog):
             self.session = None
 
     async def fetch_price(self, markets: list[str]) -> list[dict]:
-        """업비트 시세 조회"""
+        """업비트 시세 조회 (캐시 경유)"""
+        if not markets:
+            return []
+        # 실시간 시세판이 살아 있으면 업스트림 요청 없이 응답
+        if self.stream:
+            tickers = self.stream.snapshot(markets)
+            if tickers is not None:
+                return tickers
+        return await self.ticker_cache.get(markets)
+
+    async def fetch_price_batch(self, markets: list[str]) -> list[dict]:
+        """마켓이 많으면 TICKER_CHUNK_SIZE개씩 나눠 동시에 조회 (입력 순서 유지)"""
+        chunks = [markets[i:i + TICKER_CHUNK_SIZE] 
+                  for i in range(0, len(markets), TICKER_CHUNK_SIZE)]
+        results = await asyncio.gather(*[self.fetch_price(chunk) for chunk in chunks])
+        return [ticker for result in results for ticker in result]
+
+    async def upbit_get(self, path: str, params: dict = None, group: str = "default"):
+        """업비트 API 공통 요청 (요청 수 제한 적용)"""
+        await self.init_session()
+        for attempt in range(2):
+            await self.rate_limiter.acquire(group)
+            try:
+                async with self.session.get(f"{self.base_url}{path}", params=params) as response:
+                    self.rate_limiter.update(group, response.headers.get("Remaining-Req"), response.status)
+                    # 429는 이번 초를 다 쓴 것으로 보고 다음 초에 한 번만 다시 시도
+                    if response.status == 429 and attempt == 0:
+                        continue
+                    if response.status != 200:
+                        raise Exception(f"API 요청 실패: {response.status}")
+                    return await response.json()
+            finally:
+                self.rate_limiter.finish(group)
+
+    async def request_tickers(self, markets: list[str]) -> list[dict]:
+        """업비트 시세 API 직접 호출"""
         try:
-            await self.init_session()
-            url = f"{self.base_url}/ticker"
             params = {
                 "markets": ",".join(markets)
             }
-            
-            async with self.session.get(url, params=params) as response:
-                if response.status != 200:
-                    raise Exception(f"API 요청 실패: {response.status}")
-                return await response.json()
+            data = await self.upbit_get("/ticker", params, group="ticker")
+            self.ingest_tickers(data)
+            return data
                 
         except Exception as e:
             logging.error(f"시세 조회 중 오류 발생: {e}")
             raise
 
+    async def fetch_market_snapshot(self) -> list[dict]:
+        """원화/테더/BTC 전체 마켓 시세를 한 번의 요청으로 조회 (짧은 TTL 캐시)"""
+        if self.snapshot_cache and time.monotonic() - self.snapshot_cache[0] < TICKER_CACHE_TTL:
+            return self.snapshot_cache[1]
+        if not self.snapshot_task or self.snapshot_task.done():
+            self.snapshot_task = asyncio.create_task(self.request_market_snapshot())
+        # 호출자가 취소되어도 공유 요청은 계속 진행되도록 shield 처리
+        return await asyncio.shield(self.snapshot_task)
+
+    async def request_market_snapshot(self) -> list[dict]:
+        """업비트 전체 시세 API 직접 호출"""
+        data = await self.upbit_get("/ticker/all", {"quote_currencies": "KRW,USDT,BTC"}, group="ticker")
+        self.ingest_tickers(data)
+        self.ticker_cache.put(data)
+        self.snapshot_cache = (time.monotonic(), data)
+        return data
+
+    def ingest_tickers(self, tickers: list[dict]):
+        """새로 받은 시세를 순위표와 목표가 알림에 반영 (REST/웹소켓 공통)"""
+        for ticker in tickers:
+            if ticker["market"].startswith("KRW-"):
+                self.ranking.update(ticker)
+            self.fired_alerts.extend(
+                self.alert_index.evaluate(ticker["market"], ticker["trade_price"])
+            )
+
     def format_price(self, price: float, market_type: str) -> str:
         """가격 포맷팅"""
         if market_type == "KRW":
@@ -240,7 +398,7 @@ class Finance(commands.Cog):
 
         market = data[0]["market"]
         symbol = market.split("-")[1]
-        korean_name = COIN_NAMES.get(symbol, symbol)
+        korean_name = self.catalog.korean_name(symbol)
         
         # 첫 번째 마켓(KRW)의 변동률로 색상 결정
         main_change_rate = data[0]["signed_change_rate"] * 100
@@ -302,20 +460,46 @@ class Finance(commands.Cog):
         
         return embed
 
+    def search_coins(self, query: str, limit: int = 25) -> List[str]:
+        """접두어/초성/오타 검색 (같은 단계는 거래대금 순위가 높은 코인 우선)"""
+        return self.catalog.search_index.search(
+            query, limit=limit,
+            popularity=lambda symbol: self.ranking.rank("acc_trade_price_24h", f"KRW-{symbol}")
+        )
+
+    def create_busy_embed(self) -> discord.Embed:
+        """요청 수 제한으로 조회를 건너뛴 경우 안내 임베드"""
+        return discord.Embed(
+            title="⏳ 요청 대기 초과",
+            description="```조회 요청이 많아 잠시 처리할 수 없습니다.\n몇 초 후 다시 시도해주세요.```",
+            color=discord.Color.orange()
+        )
+
     def find_symbol(self, query: str) -> str:
-        """코인명 또는 심볼로 실제 심볼 찾기"""
-        query = query.strip()
+        """코인명 또는 심볼로 실제 심볼 찾기 (정확히 일치하거나 접두어로 하나만 맞는 경우만, 초성 포함)
+
+        오타/부분 문자열 검색은 자동완성에서만 쓰고, 여기서는 다른 코인으로 알림이 저장되지 않도록
+        확정할 수 없으면 추천 코인과 함께 CoinNotFoundError를 발생시킵니다.
+        """
+        symbol = self.catalog.find_symbol(query)
+        if symbol:
+            return symbol
         
-        # 대문자로 변환한 입력값이 심볼인 경우
-        if query.upper() in COIN_NAMES:
-            return query.upper()
+        # 초성이 정확히 같은 코인이 하나면 확정 (ㅂㅌㅋㅇ는 ㅂㅌㅋㅇ로 시작하는 다른 코인이 있어도 비트코인)
+        matches = self.catalog.search_index.exact_matches(query)
+        if len(matches) == 1:
+            return matches.pop()
+        matches = self.catalog.search_index.prefix_matches(query)
+        if len(matches) == 1:
+            return matches.pop()
         
-        # 한글명으로 검색
-        cleaned_query = query.replace(" ", "").lower()
-        if cleaned_query in COIN_SYMBOLS:
-            return COIN_SYMBOLS[cleaned_query]
-            
-        raise ValueError(f"'{query}'에 해당하는 코인을 찾을 수 없습니다.")
+        message = f"'{query}'에 해당하는 코인을 찾을 수 없습니다."
+        suggestions = self.search_coins(query, limit=3)
+        if suggestions:
+            message += " 혹시: " + ", ".join(
+                f"{self.catalog.korean_name(symbol)}({symbol})" for symbol in suggestions
+            )
+        raise CoinNotFoundError(message)
 
     @app_commands.command(name="코인시세", description="암호화폐의 실시간 시세를 조회합니다")
     @app_commands.describe(코인="코인 심볼 또는 이름 (예: BTC, 비트코인, ETH, 이더리움)")
@@ -350,6 +534,8 @@ class Finance(commands.Cog):
                 color=discord.Color.red()
             )
             await interaction.followup.send(embed=error_embed, ephemeral=True)
+        except RateLimitExceeded:
+            await interaction.followup.send(embed=self.create_busy_embed(), ephemeral=True)
         except Exception as e:
             error_embed = discord.Embed(
                 title="❌ 시스템 오류",
@@ -359,52 +545,241 @@ class Finance(commands.Cog):
             logging.error(f"시세 조회 중 오류: {e}")
             await interaction.followup.send(embed=error_embed, ephemeral=True)
 
+    @app_commands.command(name="코인차트", description="암호화폐의 가격 차트를 조회합니다")
+    @app_commands.describe(
+        코인="코인 심볼 또는 이름 (예: BTC, 비트코인)",
+        간격="캔들 간격 (기본: 1시간봉)",
+        개수="표시할 캔들 개수 (10~200, 기본: 100)"
+    )
+    @app_commands.choices(간격=CHART_INTERVAL_CHOICES)
+    async def check_chart(self, interaction: discord.Interaction, 코인: str,
+                          간격: app_commands.Choice[str] = None, 개수: int = 100):
+        """코인 가격 차트 조회"""
+        await interaction.response.defer()
+        
+        try:
+            symbol = self.find_symbol(코인)
+            market = f"KRW-{symbol}"
+            interval = 간격.value if 간격 else "60m"
+            count = max(10, min(개수, 200))
+            
+            # 마감된 캔들까지 동기화 후 최근 구간만 memmap으로 읽음
+            # (오래 열지 않아 빈 구간이 count개보다 길면 다 채우지 않고 최근 count개부터 새로 받음, 전체 채우기는 candle_sync_task)
+            await self.candles.sync(market, interval, backfill=count, max_gap=count)
+            columns = self.candles.tail(market, interval, count)
+            if len(columns["ts"]) == 0:
+                raise ValueError("해당 코인의 캔들 정보를 찾을 수 없습니다")
+            
+            # 같은 캔들 구간이면 렌더링된 이미지를 그대로 사용
+            last_ts = int(columns["ts"][-1])
+            title = f"{symbol}/KRW  {interval}"
+            png = await self.chart_renderer.render(
+                (market, interval, count, last_ts), title, columns, INTERVALS[interval][1]
+            )
+            
+            korean_name = self.catalog.korean_name(symbol)
+            embed = discord.Embed(
+                title=f"📈 {korean_name} ({symbol}) 차트",
+                color=discord.Color.blue(),
+                timestamp=datetime.now(pytz.UTC)
+            )
+            embed.set_image(url="attachment://chart.png")
+            korea_time = datetime.fromtimestamp(last_ts, pytz.timezone('Asia/Seoul'))
+            embed.set_footer(
+                text=f"업비트 기준 • 마지막 마감 캔들 {korea_time.strftime('%Y-%m-%d %H:%M')} KST"
+            )
+            await interaction.followup.send(
+                embed=embed,
+                file=discord.File(io.BytesIO(png), filename="chart.png")
+            )
+            
+        except ValueError as ve:
+            error_embed = discord.Embed(
+                title="❌ 차트 조회 실패",
+                description=f"```{str(ve)}```",
+                color=discord.Color.red()
+            )
+            await interaction.followup.send(embed=error_embed, ephemeral=True)
+        except RateLimitExceeded:
+            await interaction.followup.send(embed=self.create_busy_embed(), ephemeral=True)
+        except Exception as e:
+            error_embed = discord.Embed(
+                title="❌ 시스템 오류",
+                description="```차트 생성 중 오류가 발생했습니다.\n잠시 후 다시 시도해주세요.```",
+                color=discord.Color.red()
+            )
+            logging.error(f"차트 조회 중 오류: {e}")
+            await interaction.followup.send(embed=error_embed, ephemeral=True)
+
     def cog_unload(self):
         """Cog 언로드 시 정리 작업"""
+        self.catalog_refresh_task.cancel()
+        self.price_alert_task.cancel()
+        self.market_tick_task.cancel()
+        self.candle_sync_task.cancel()
+        self.chart_renderer.shutdown()
+        if self.stream:
+            asyncio.create_task(self.stream.stop())
         if self.session:
-            import asyncio
             asyncio.create_task(self.close_session())
 
+    async def request_market_catalog(self) -> List[Dict]:
+        """업비트 마켓 목록 API 직접 호출 (유의 종목 정보 포함)"""
+        return await self.upbit_get("/market/all", {"is_details": "true"}, group="market")
+
+    @tasks.loop(minutes=1)
+    async def catalog_refresh_task(self):
+        """마켓 카탈로그 주기적 갱신 및 상장/폐지/유의 종목 변경 알림"""
+        try:
+            old_names = self.catalog.names
+            await self.catalog.refresh()
+            # 다른 곳에서 먼저 갱신했을 수도 있으므로 마지막으로 처리한 해시와 비교
+            if self.catalog.digest == self.handled_catalog_digest:
+                return
+            self.handled_catalog_digest = self.catalog.digest
+            logging.info(f"마켓 카탈로그 갱신 완료: KRW 마켓 {len(self.catalog.krw_markets)}개")
+            self.ranking.retain(self.catalog.krw_markets)
+            if self.stream:
+                await self.stream.refresh_subscription()
+        except Exception as e:
+            logging.error(f"마켓 카탈로그 갱신 중 오류: {e}")
+            return
+        
+        try:
+            changes = self.listing_watcher.diff(self.catalog.warnings)
+            if changes:
+                await self.dispatch_listing_changes(changes, old_names)
+        except Exception as e:
+            logging.error(f"상장 변경 알림 중 오류: {e}")
+
+    @catalog_refresh_task.before_loop
+    async def before_catalog_refresh_task(self):
+        await self.bot.wait_until_ready()
+
+    async def dispatch_listing_changes(self, changes: CatalogChanges, old_names: Dict[str, str]):
+        """구독 채널에 상장 변경 알림 전송 (임베드는 한 번만 생성)"""
+        if not self.listing_watcher.channels:
+            return
+        embed = self.create_listing_embed(changes, old_names)
+        for channel_id in self.listing_watcher.channels:
+            channel = self.bot.get_channel(channel_id)
+            if not channel:
+                continue
+            try:
+                await channel.send(embed=embed)
+            except discord.HTTPException as e:
+                logging.error(f"상장 변경 알림 전송 실패 (channel {channel_id}): {e}")
+
+    def create_listing_embed(self, changes: CatalogChanges, old_names: Dict[str, str]) -> discord.Embed:
+        """상장/폐지/유의 종목 변경 임베드 생성"""
+        embed = discord.Embed(
+            title="📢 업비트 마켓 변경",
+            color=discord.Color.orange(),
+            timestamp=datetime.now(pytz.UTC)
+        )
+        
+        def label(market: str) -> str:
+            symbol = market.split("-")[1]
+            # 폐지된 마켓은 새 카탈로그에 이름이 없으므로 이전 이름 사용
+            name = self.catalog.names.get(symbol) or old_names.get(symbol, symbol)
+            return f"{name} ({market})"
+        
+        for title, markets in (("🆕 신규 상장", changes.listed),
+                               ("🚫 상장 폐지", changes.delisted),
+                               ("⚠️ 유의 종목 지정", changes.warned),
+                               ("✅ 유의 종목 해제", changes.unwarned)):
+            if not markets:
+                continue
+            lines = [label(market) for market in markets[:20]]
+            if len(markets) > 20:
+                lines.append(f"외 {len(markets) - 20}개")
+            embed.add_field(name=title, value="```\n" + "\n".join(lines) + "\n```", inline=False)
+        
+        korea_time = datetime.now(pytz.timezone('Asia/Seoul'))
+        embed.set_footer(
+            text=f"업비트 기준 • {korea_time.strftime('%Y-%m-%d %H:%M:%S')} KST"
+        )
+        return embed
+
+    @app_commands.command(name="상장알림설정", description="업비트 신규 상장/상장 폐지/유의 종목 알림을 이 채널에서 받거나 끕니다")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def set_listing_channel(self, interaction: discord.Interaction):
+        """상장 변경 알림 채널 설정/해제"""
+        subscribed = self.listing_watcher.toggle_channel(interaction.channel.id)
+        
+        if subscribed:
+            embed = discord.Embed(
+                title="✅ 상장 알림 채널 설정 완료",
+                description="업비트 마켓 목록을 1분마다 확인해 신규 상장, 상장 폐지, 유의 종목 변경을 알려드립니다.",
+                color=discord.Color.green()
+            )
+        else:
+            embed = discord.Embed(
+                title="🔕 상장 알림 해제",
+                description="이 채널에서 더 이상 상장 변경 알림을 보내지 않습니다.",
+                color=discord.Color.light_grey()
+            )
+        embed.add_field(
+            name="📍 채널",
+            value=interaction.channel.mention,
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    async def request_candles(self, path: str, params: dict) -> List[Dict]:
+        """업비트 캔들 API 직접 호출"""
+        return await self.upbit_get(path, params, group="candles")
+
+    @tasks.loop(minutes=30)
+    async def candle_sync_task(self):
+        """원화 마켓 캔들 주기적 동기화 (비어 있으면 과거 캔들부터 수집)"""
+        try:
+            if not self.catalog.loaded:
+                await self.catalog.refresh()
+            for interval in CANDLE_SYNC_INTERVALS:
+                added = await self.candles.sync_many(self.catalog.krw_markets, interval, CANDLE_BACKFILL)
+                logging.info(f"{interval} 캔들 동기화 완료: {len(added)}개 마켓, {sum(added.values())}개 추가")
+        except Exception as e:
+            logging.error(f"캔들 동기화 중 오류: {e}")
+
+    async def stream_markets(self) -> List[str]:
+        """웹소켓으로 구독할 마켓 목록 (원화 + 테더 마켓)"""
+        if not self.catalog.loaded:
+            await self.catalog.refresh()
+        return [market for market in self.catalog.markets 
+                if market.startswith(("KRW-", "USDT-"))]
+
     async def fetch_all_krw_markets(self) -> List[Dict]:
         """모든 원화 마켓 시세 조회"""
         try:
-            await self.init_session()
-            # 원화 마켓 목록 조회
-            markets_url = f"{self.base_url}/market/all"
-            async with self.session.get(markets_url) as response:
-                if response.status != 200:
-                    raise Exception("마켓 목록 조회 실패")
-                markets_data = await response.json()
-                
-            # KRW 마켓만 필터링
-            krw_markets = [market["market"] for market in markets_data 
-                         if market["market"].startswith("KRW-")]
+            # 카탈로그가 아직 없을 때만 마켓 목록을 직접 조회
+            if not self.catalog.loaded:
+                await self.catalog.refresh()
             
             # 시세 조회
-            return await self.fetch_price(krw_markets)
+            return await self.fetch_price(self.catalog.krw_markets)
                 
         except Exception as e:
             logging.error(f"전체 마켓 조회 중 오류: {e}")
             raise
 
+    async def get_ranking(self) -> MarketRanking:
+        """최신 시세가 반영된 원화 마켓 순위표 반환"""
+        # 웹소켓이 살아 있으면 순위표가 실시간으로 갱신되므로 조회 생략
+        if not (self.stream and self.stream.is_fresh):
+            await self.fetch_all_krw_markets()
+        return self.ranking
+
     async def get_top_markets(self) -> discord.Embed:
         """BTC + TOP 5 거래대금 코인 시세 임베드 생성"""
         try:
-            # 전체 원화 마켓 데이터 조회
-            all_markets = await self.fetch_all_krw_markets()
+            ranking = await self.get_ranking()
             
             # 비트코인 데이터 찾기
-            btc_data = next((item for item in all_markets 
-                           if item["market"] == "KRW-BTC"), None)
-            
-            # 거래대금 기준 정렬
-            sorted_markets = sorted(all_markets, 
-                                 key=lambda x: x["acc_trade_price_24h"], 
-                                 reverse=True)
+            btc_data = ranking.tickers.get("KRW-BTC")
             
-            # TOP 5 추출 (BTC 제외)
-            top_markets = [market for market in sorted_markets 
-                         if market["market"] != "KRW-BTC"][:5]
+            # 거래대금 TOP 5 추출 (BTC 제외)
+            top_markets = ranking.top("acc_trade_price_24h", 5, exclude={"KRW-BTC"})
             
             # 임베드 생성
             embed = discord.Embed(
@@ -421,7 +796,7 @@ class Finance(commands.Cog):
             # TOP 5 정보 추가
             for idx, market in enumerate(top_markets, 1):
                 symbol = market["market"].split("-")[1]
-                korean_name = COIN_NAMES.get(symbol, symbol)
+                korean_name = self.catalog.korean_name(symbol)
                 self.add_market_field(embed, market, 
                                     f"#{idx} {korean_name} ({symbol})")
             
@@ -458,32 +833,273 @@ class Finance(commands.Cog):
             inline=False
         )
 
+    def report_markets(self, channel) -> Optional[tuple]:
+        """채널 정기 시세 알림에 넣을 마켓 (None이면 BTC + 거래대금 TOP 5)"""
+        markets = self.watchlists.get(f"channel:{channel.id}")
+        if markets == [REPORT_DEFAULT]:
+            guild = getattr(channel, "guild", None)
+            markets = self.watchlists.get(f"guild:{guild.id}") if guild else []
+        return tuple(markets) or None
+
     @tasks.loop(hours=3)
     async def price_alert_task(self):
-        """3시간 간격으로 시세 알림"""
-        if not self.alert_channel_id:
+        """구독 채널별 정기 시세 알림
+
+        모든 채널의 마켓 합집합을 한 번에 조회하고, 같은 목록을 쓰는 채널끼리는 임베드를 한 번만 만들어 같이 보냅니다.
+        """
+        reports = {}  # 마켓 목록 -> 채널 목록
+        for key in self.watchlists.keys("channel:"):
+            channel = self.bot.get_channel(int(key.split(":")[1]))
+            if channel:
+                reports.setdefault(self.report_markets(channel), []).append(channel)
+        if not reports:
             return
-            
+        
         try:
-            channel = self.bot.get_channel(self.alert_channel_id)
-            if not channel:
-                return
-                
-            embed = await self.get_top_markets()
-            await channel.send(embed=embed)
-            
+            embeds = {}
+            if None in reports:
+                embeds[None] = await self.get_top_markets()
+            union = list(dict.fromkeys(market for markets in reports if markets for market in markets))
+            tickers = {ticker["market"]: ticker for ticker in await self.fetch_price_batch(union)}
+            for markets in reports:
+                if markets is not None:
+                    data = [tickers[market] for market in markets if market in tickers]
+                    embeds[markets] = self.create_compare_embed(data, title="⏰ 정기 시세 알림")
         except Exception as e:
             logging.error(f"시세 알림 중 오류 발생: {e}")
+            return
+        
+        for markets, channels in reports.items():
+            for channel in channels:
+                try:
+                    await channel.send(embed=embeds[markets])
+                except discord.HTTPException as e:
+                    logging.error(f"시세 알림 전송 실패 (channel {channel.id}): {e}")
 
-    @app_commands.command(name="코인알림설정", description="실시간 시세 알림을 받을 채널을 설정합니다")
+    @price_alert_task.before_loop
+    async def before_price_alert_task(self):
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(seconds=5)
+    async def market_tick_task(self):
+        """원화 마켓 시세 샘플링 후 단기 기록 저장 및 목표가 알림 발송"""
+        try:
+            # 웹소켓이 없으면 전체 원화 마켓을 한 번에 조회 (조회 시 ingest에서 목표가 평가됨)
+            ranking = await self.get_ranking()
+            self.price_history.record(list(ranking.tickers.values()))
+        except Exception as e:
+            logging.error(f"시세 샘플링 중 오류: {e}")
+        
+        try:
+            await self.dispatch_alerts()
+        except Exception as e:
+            logging.error(f"목표가 알림 발송 중 오류: {e}")
+
+    @market_tick_task.before_loop
+    async def before_market_tick_task(self):
+        await self.bot.wait_until_ready()
+
+    async def dispatch_alerts(self):
+        """이번 틱에 발동한 알림을 받는 곳(DM/채널)별로 묶어서 전송 (메시지 한도를 넘으면 나눠 보냄)"""
+        if not self.fired_alerts:
+            return
+        # 다시 보내려고 남겨 둔 알림이 그 사이 또 발동했으면 한 번만
+        fired = list({alert.alert_id: (alert, rising) for alert, rising in self.fired_alerts}.values())
+        self.fired_alerts = []
+        
+        destinations = {}
+        for alert, rising in fired:
+            key = ("dm", alert.user_id) if alert.dm else ("channel", alert.channel_id)
+            destinations.setdefault(key, []).append((alert, rising))
+        
+        for (kind, target_id), items in destinations.items():
+            embeds = self.create_alert_embeds(items)
+            sent = 0  # 전송에 성공한 알림 수
+            try:
+                if kind == "dm":
+                    target = self.bot.get_user(target_id) or await self.bot.fetch_user(target_id)
+                else:
+                    target = self.bot.get_channel(target_id)
+                    if not target:
+                        continue
+                for start, end in self.split_embeds(embeds):
+                    batch = items[start * EMBED_MAX_FIELDS:end * EMBED_MAX_FIELDS]
+                    if kind == "dm":
+                        await target.send(embeds=embeds[start:end])
+                    else:
+                        mentions = " ".join(sorted({f"<@{alert.user_id}>" for alert, _ in batch}))
+                        await target.send(content=mentions, embeds=embeds[start:end])
+                    sent += len(batch)
+            except discord.HTTPException as e:
+                logging.error(f"목표가 알림 전송 실패 ({kind} {target_id}): {e}")
+                # 일시적인 오류면 보내지 못한 알림을 다음 틱에 다시 전송
+                if e.status >= 500 or e.status == 429:
+                    self.fired_alerts.extend(items[sent:])
+        
+        # 마지막 발동 시각 저장 (재시작 후에도 중복 알림 방지)
+        self.alert_index.save()
+
+    @staticmethod
+    def split_embeds(embeds: list[discord.Embed]) -> list[tuple[int, int]]:
+        """메시지당 임베드 수/전체 글자 수 한도에 맞춰 임베드를 나눈 구간 [(시작, 끝)]"""
+        ranges = []
+        start, chars = 0, 0
+        for i, embed in enumerate(embeds):
+            if i > start and (i - start >= MESSAGE_MAX_EMBEDS or chars + len(embed) > MESSAGE_MAX_EMBED_CHARS):
+                ranges.append((start, i))
+                start, chars = i, 0
+            chars += len(embed)
+        if embeds:
+            ranges.append((start, len(embeds)))
+        return ranges
+
+    def create_alert_embeds(self, items: list) -> list[discord.Embed]:
+        """발동한 목표가 알림 임베드 생성 (임베드당 필드 EMBED_MAX_FIELDS개)"""
+        embeds = []
+        for start in range(0, len(items), EMBED_MAX_FIELDS):
+            embed = discord.Embed(
+                title="🔔 목표가 알림",
+                color=discord.Color.gold(),
+                timestamp=datetime.now(pytz.UTC)
+            )
+            for alert, rising in items[start:start + EMBED_MAX_FIELDS]:
+                symbol = alert.market.split("-")[1]
+                market_type = alert.market.split("-")[0]
+                current_price = self.alert_index.last_price.get(alert.market, alert.price)
+                trend = "🔺 상향 돌파" if rising else "⏬ 하향 돌파"
+                embed.add_field(
+                    name=f"{self.catalog.korean_name(symbol)} ({symbol}) {trend}",
+                    value=f"```\n"
+                          f"목표가: {self.format_price(alert.price, market_type)} {market_type}\n"
+                          f"현재가: {self.format_price(current_price, market_type)} {market_type}\n"
+                          f"```",
+                    inline=False
+                )
+            embeds.append(embed)
+        return embeds
+
+    @app_commands.command(name="가격알림", description="코인이 목표가를 지나가면 알림을 받습니다")
+    @app_commands.describe(
+        코인="코인 심볼 또는 이름 (예: BTC, 비트코인)",
+        가격="목표가 (KRW)",
+        dm="DM으로 받기 (끄면 이 채널에 멘션)"
+    )
+    async def add_price_alert(self, interaction: discord.Interaction, 코인: str, 가격: float, dm: bool = True):
+        """목표가 알림 등록"""
+        try:
+            if 가격 <= 0:
+                raise ValueError("목표가는 0보다 커야 합니다.")
+            if len(self.alert_index.user_alerts(interaction.user.id)) >= MAX_ALERTS_PER_USER:
+                raise ValueError(f"목표가 알림은 최대 {MAX_ALERTS_PER_USER}개까지 등록할 수 있습니다.")
+            
+            symbol = self.find_symbol(코인)
+            market = f"KRW-{symbol}"
+            alert = self.alert_index.add(
+                interaction.user.id, market, 가격,
+                channel_id=interaction.channel_id, dm=dm
+            )
+            
+            embed = discord.Embed(
+                title="✅ 목표가 알림 등록 완료",
+                description=(
+                    f"**{self.catalog.korean_name(symbol)} ({symbol})** 가격이 "
+                    f"**{self.format_price(가격, 'KRW')} KRW**를 지나가면 "
+                    f"{'DM으로' if dm else '이 채널에서'} 알려드립니다."
+                ),
+                color=discord.Color.green()
+            )
+            embed.set_footer(text=f"알림 번호: {alert.alert_id} • /가격알림삭제 로 해제할 수 있습니다.")
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            
+        except ValueError as ve:
+            error_embed = discord.Embed(
+                title="❌ 알림 등록 실패",
+                description=f"```{str(ve)}```",
+                color=discord.Color.red()
+            )
+            await interaction.response.send_message(embed=error_embed, ephemeral=True)
+
+    @app_commands.command(name="가격알림목록", description="등록한 목표가 알림을 확인합니다")
+    async def list_price_alerts(self, interaction: discord.Interaction):
+        """내 목표가 알림 목록"""
+        alerts = self.alert_index.user_alerts(interaction.user.id)
+        
+        embed = discord.Embed(
+            title="🔔 내 목표가 알림",
+            color=discord.Color.blue()
+        )
+        if not alerts:
+            embed.description = "등록된 알림이 없습니다. `/가격알림`으로 추가해보세요."
+        for alert in alerts:
+            symbol = alert.market.split("-")[1]
+            embed.add_field(
+                name=f"#{alert.alert_id} {self.catalog.korean_name(symbol)} ({symbol})",
+                value=f"목표가 {self.format_price(alert.price, 'KRW')} KRW • {'DM' if alert.dm else f'<#{alert.channel_id}>'}",
+                inline=False
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="가격알림삭제", description="등록한 목표가 알림을 삭제합니다")
+    @app_commands.describe(번호="/가격알림목록 에 표시된 알림 번호")
+    async def remove_price_alert(self, interaction: discord.Interaction, 번호: int):
+        """목표가 알림 삭제"""
+        if self.alert_index.remove(번호, user_id=interaction.user.id):
+            embed = discord.Embed(
+                title="🗑️ 목표가 알림 삭제 완료",
+                description=f"#{번호} 알림을 삭제했습니다.",
+                color=discord.Color.green()
+            )
+        else:
+            embed = discord.Embed(
+                title="❌ 알림 삭제 실패",
+                description=f"#{번호} 알림을 찾을 수 없습니다.",
+                color=discord.Color.red()
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="코인알림설정", description="정기 시세 알림을 받을 채널과 코인 목록을 설정합니다")
+    @app_commands.describe(
+        코인목록="쉼표나 공백으로 구분한 코인 목록 (비우면 서버 관심 코인, 없으면 BTC + 거래대금 TOP 5)",
+        해제="이 채널의 정기 시세 알림 끄기"
+    )
     @app_commands.checks.has_permissions(administrator=True)
-    async def set_price_channel(self, interaction: discord.Interaction):
-        """시세 알림 채널 설정"""
-        self.alert_channel_id = interaction.channel.id
+    async def set_price_channel(self, interaction: discord.Interaction, 코인목록: Optional[str] = None, 해제: bool = False):
+        """채널별 정기 시세 알림 설정"""
+        key = f"channel:{interaction.channel.id}"
+        
+        if 해제:
+            self.watchlists.set(key, [])
+            embed = discord.Embed(
+                title="🔕 시세 알림 해제",
+                description="이 채널에서 더 이상 정기 시세 알림을 보내지 않습니다.",
+                color=discord.Color.light_grey()
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
         
+        unknown = []
+        if 코인목록:
+            symbols, unknown = self.parse_coin_list(코인목록)
+            if not symbols:
+                embed = discord.Embed(
+                    title="❌ 시세 알림 설정 실패",
+                    description="```입력한 코인을 찾을 수 없습니다.```",
+                    color=discord.Color.red()
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
+            self.watchlists.set(key, [f"KRW-{symbol}" for symbol in symbols[:MAX_COMPARE_COINS]])
+        else:
+            self.watchlists.set(key, [REPORT_DEFAULT])
+        
+        markets = self.report_markets(interaction.channel)
+        if markets:
+            target = ", ".join(market.split("-")[1] for market in markets)
+        else:
+            target = "비트코인과 거래대금 TOP 5 코인"
         embed = discord.Embed(
             title="✅ 시세 알림 채널 설정 완료",
-            description="3시간 간격으로 비트코인과 거래대금 TOP 5 코인의 시세 정보가 전송됩니다.",
+            description=f"{REPORT_HOURS:g}시간 간격으로 {target}의 시세 정보가 전송됩니다.",
             color=discord.Color.green()
         )
         embed.add_field(
@@ -491,8 +1107,253 @@ class Finance(commands.Cog):
             value=interaction.channel.mention,
             inline=False
         )
+        if unknown:
+            embed.add_field(name="⚠️ 찾을 수 없는 코인", value=", ".join(unknown), inline=False)
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    def parse_coin_list(self, text: str) -> tuple[list[str], list[str]]:
+        """쉼표/공백으로 구분된 코인 목록을 심볼로 변환 (찾은 심볼, 찾지 못한 입력)"""
+        symbols, unknown = [], []
+        for token in text.replace(",", " ").split():
+            try:
+                symbols.append(self.find_symbol(token))
+            except ValueError:
+                unknown.append(token)
+        return list(dict.fromkeys(symbols)), unknown
+
+    def create_compare_embed(self, data: list[dict], unknown: list[str] = None,
+                             title: str = "📋 코인 시세 비교") -> discord.Embed:
+        """여러 코인 시세 비교표 임베드 생성"""
+        # 한글은 고정폭 글꼴에서 두 칸을 차지하므로 머리글은 직접 맞춤
+        lines = ["코인              현재가   전일대비 거래대금(백만)"]
+        for item in data:
+            symbol = item["market"].split("-")[1]
+            change_rate = item["signed_change_rate"] * 100
+            change_emoji = "🔺" if change_rate > 0 else "⏬" if change_rate < 0 else "➖"
+            lines.append(
+                f"{symbol:<8}"
+                f"{self.format_price(item['trade_price'], 'KRW'):>16}"
+                f" {change_emoji}{change_rate:+7.2f}%"
+                f"{item['acc_trade_price_24h'] / 1000000:>15,.0f}"
+            )
+        
+        embed = discord.Embed(
+            title=title,
+            description="```\n" + "\n".join(lines) + "\n```",
+            color=discord.Color.blue(),
+            timestamp=datetime.now(pytz.UTC)
+        )
+        if unknown:
+            embed.add_field(
+                name="⚠️ 찾을 수 없는 코인",
+                value=", ".join(unknown),
+                inline=False
+            )
+        korea_time = datetime.now(pytz.timezone('Asia/Seoul'))
+        embed.set_footer(
+            text=f"업비트 원화 마켓 기준 • {korea_time.strftime('%Y-%m-%d %H:%M:%S')} KST"
+        )
+        return embed
+
+    @app_commands.command(name="코인비교", description="여러 코인의 시세를 한 번에 비교합니다")
+    @app_commands.describe(코인목록="쉼표나 공백으로 구분한 코인 목록 (비우면 /관심코인 목록 사용)")
+    async def compare_coins(self, interaction: discord.Interaction, 코인목록: Optional[str] = None):
+        """여러 코인 시세 비교"""
+        await interaction.response.defer()
+        
+        try:
+            if 코인목록:
+                symbols, unknown = self.parse_coin_list(코인목록)
+            else:
+                markets = self.watchlists.get(f"user:{interaction.user.id}")
+                if not markets and interaction.guild:
+                    markets = self.watchlists.get(f"guild:{interaction.guild.id}")
+                if not markets:
+                    raise ValueError("비교할 코인을 입력하거나 /관심코인 으로 목록을 먼저 저장해주세요.")
+                symbols, unknown = [market.split("-")[1] for market in markets], []
+            
+            if not symbols:
+                raise ValueError("입력한 코인을 찾을 수 없습니다.")
+            if len(symbols) > MAX_COMPARE_COINS:
+                raise ValueError(f"한 번에 최대 {MAX_COMPARE_COINS}개까지 비교할 수 있습니다.")
+            
+            data = await self.fetch_price_batch([f"KRW-{symbol}" for symbol in symbols])
+            if not data:
+                raise ValueError("시세 정보를 찾을 수 없습니다")
+            
+            await interaction.followup.send(embed=self.create_compare_embed(data, unknown))
+            
+        except ValueError as ve:
+            error_embed = discord.Embed(
+                title="❌ 코인 비교 실패",
+                description=f"```{str(ve)}```",
+                color=discord.Color.red()
+            )
+            await interaction.followup.send(embed=error_embed, ephemeral=True)
+        except RateLimitExceeded:
+            await interaction.followup.send(embed=self.create_busy_embed(), ephemeral=True)
+        except Exception as e:
+            error_embed = discord.Embed(
+                title="❌ 시스템 오류",
+                description="```시세 조회 중 오류가 발생했습니다.\n잠시 후 다시 시도해주세요.```",
+                color=discord.Color.red()
+            )
+            logging.error(f"코인 비교 중 오류: {e}")
+            await interaction.followup.send(embed=error_embed, ephemeral=True)
+
+    @app_commands.command(name="관심코인", description="/코인비교 에 사용할 관심 코인 목록을 저장합니다")
+    @app_commands.describe(
+        코인목록="쉼표나 공백으로 구분한 코인 목록 (비우면 현재 목록 확인, '삭제' 입력 시 초기화)",
+        서버="서버 공용 목록으로 저장 (서버 관리 권한 필요, 정기 시세 알림에도 사용)"
+    )
+    async def set_watchlist(self, interaction: discord.Interaction, 코인목록: Optional[str] = None, 서버: bool = False):
+        """관심 코인 목록 저장/조회"""
+        if 서버:
+            if not interaction.guild:
+                embed = discord.Embed(
+                    title="❌ 관심 코인 저장 실패",
+                    description="```서버 공용 목록은 서버 채널에서만 설정할 수 있습니다.```",
+                    color=discord.Color.red()
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
+            if 코인목록 and not interaction.user.guild_permissions.manage_guild:
+                embed = discord.Embed(
+                    title="❌ 권한 없음",
+                    description="```서버 공용 목록은 서버 관리 권한이 있어야 바꿀 수 있습니다.```",
+                    color=discord.Color.red()
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
+            key = f"guild:{interaction.guild.id}"
+        else:
+            key = f"user:{interaction.user.id}"
+        unknown = []
+        
+        if 코인목록 and 코인목록.strip() == "삭제":
+            self.watchlists.set(key, [])
+        elif 코인목록:
+            symbols, unknown = self.parse_coin_list(코인목록)
+            if not symbols:
+                # 오타 하나로 저장된 목록이 지워지지 않도록 목록은 그대로 둠 (삭제는 '삭제'로만)
+                embed = discord.Embed(
+                    title="❌ 관심 코인 저장 실패",
+                    description=f"```입력한 코인을 찾을 수 없습니다: {', '.join(unknown)}```",
+                    color=discord.Color.red()
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
+            self.watchlists.set(key, [f"KRW-{symbol}" for symbol in symbols[:MAX_COMPARE_COINS]])
+        
+        markets = self.watchlists.get(key)
+        embed = discord.Embed(
+            title="⭐ 서버 관심 코인 목록" if 서버 else "⭐ 관심 코인 목록",
+            description=", ".join(
+                f"{self.catalog.korean_name(market.split('-')[1])} ({market.split('-')[1]})" 
+                for market in markets
+            ) or "저장된 관심 코인이 없습니다.",
+            color=discord.Color.green() if 코인목록 else discord.Color.blue()
+        )
+        if unknown:
+            embed.add_field(name="⚠️ 찾을 수 없는 코인", value=", ".join(unknown), inline=False)
+        embed.set_footer(text=f"최대 {MAX_COMPARE_COINS}개 • /코인비교 를 목록 없이 실행하면 이 목록을 사용합니다.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    def get_market_analysis(self) -> Optional[dict]:
+        """전체 원화 마켓 지표 계산 (캔들이 추가됐을 때만 다시 계산)"""
+        markets = self.catalog.krw_markets
+        key = (self.candles.version, tuple(markets))
+        if self.analysis_cache and self.analysis_cache[0] == key:
+            return self.analysis_cache[1]
+        
+        matrix = build_market_matrix(self.candles, markets, ANALYSIS_INTERVAL, ANALYSIS_LENGTH)
+        # 시간 축 길이는 항상 ANALYSIS_LENGTH이므로 마켓별로 값이 있는 캔들 수로 수집 상태 판단
+        filled = np.count_nonzero(~np.isnan(matrix["close"]), axis=1)
+        if not np.any(filled >= ANALYSIS_LENGTH // 2):
+            return None
+        analysis = analyze_markets(matrix)
+        analysis["markets"] = matrix["markets"]
+        self.analysis_cache = (key, analysis)
+        return analysis
+
+    @app_commands.command(name="시장분석", description="전체 원화 마켓의 기술적 지표 신호를 확인합니다")
+    async def check_market_analysis(self, interaction: discord.Interaction):
+        """이동평균/RSI/변동성/거래량 신호 상위 코인 조회"""
+        await interaction.response.defer()
+        
+        try:
+            analysis = self.get_market_analysis()
+            if analysis is None:
+                raise ValueError("캔들 데이터를 수집하는 중입니다. 잠시 후 다시 시도해주세요.")
+            ranking = await self.get_ranking()
+            
+            markets = analysis["markets"]
+            valid = analysis["valid"]
+            signals = [
+                ("🔥 과매수", "rsi", True, lambda v: f"RSI {v:.1f}"),
+                ("🧊 과매도", "rsi", False, lambda v: f"RSI {v:.1f}"),
+                ("📢 거래대금 급증", "volume_z", True, lambda v: f"z {v:+.1f}"),
+                ("🌪️ 변동성", "volatility", True, lambda v: f"σ {v:.1f}%"),
+            ]
+            
+            embed = discord.Embed(
+                title="🔬 원화 마켓 기술적 분석",
+                description=f"{ANALYSIS_INTERVAL} 캔들 {ANALYSIS_LENGTH}개 기준 • 분석 대상 {int(valid.sum())}개 마켓",
+                color=discord.Color.purple(),
+                timestamp=datetime.now(pytz.UTC)
+            )
+            
+            for label, name, descending, fmt in signals:
+                values = np.where(valid, analysis[name], np.nan)
+                order = np.argsort(-values if descending else values)
+                order = order[~np.isnan(values[order])][:3]
+                for idx, row in enumerate(order, 1):
+                    ticker = ranking.tickers.get(str(markets[row]))
+                    if not ticker:
+                        continue
+                    symbol = ticker["market"].split("-")[1]
+                    self.add_market_field(
+                        embed, ticker,
+                        f"{label} #{idx} {self.catalog.korean_name(symbol)} ({symbol}) • {fmt(values[row])}"
+                    )
+            
+            crosses = [
+                ("골든크로스", analysis["golden_cross"] & valid),
+                ("데드크로스", analysis["dead_cross"] & valid),
+            ]
+            embed.add_field(
+                name="✂️ 이동평균(5/20) 교차",
+                value="\n".join(
+                    f"{label}: " + (", ".join(str(m).split("-")[1] for m in markets[mask][:15]) or "없음")
+                    for label, mask in crosses
+                ),
+                inline=False
+            )
+            
+            korea_time = datetime.now(pytz.timezone('Asia/Seoul'))
+            embed.set_footer(
+                text=f"업비트 기준 • {korea_time.strftime('%Y-%m-%d %H:%M:%S')} KST • 투자 판단의 책임은 본인에게 있습니다"
+            )
+            await interaction.followup.send(embed=embed)
+            
+        except ValueError as ve:
+            error_embed = discord.Embed(
+                title="❌ 시장 분석 실패",
+                description=f"```{str(ve)}```",
+                color=discord.Color.red()
+            )
+            await interaction.followup.send(embed=error_embed, ephemeral=True)
+        except RateLimitExceeded:
+            await interaction.followup.send(embed=self.create_busy_embed(), ephemeral=True)
+        except Exception as e:
+            error_embed = discord.Embed(
+                title="❌ 시스템 오류",
+                description="```시장 분석 중 오류가 발생했습니다.\n잠시 후 다시 시도해주세요.```",
+                color=discord.Color.red()
+            )
+            logging.error(f"시장 분석 중 오류: {e}")
+            await interaction.followup.send(embed=error_embed, ephemeral=True)
+
     @app_commands.command(name="인기코인", description="거래대금 기준 TOP 5 코인과 비트코인 시세를 조회합니다")
     async def check_top_coins(self, interaction: discord.Interaction):
         """인기 코인 시세 조회"""
@@ -502,6 +1363,8 @@ class Finance(commands.Cog):
             embed = await self.get_top_markets()
             await interaction.followup.send(embed=embed)
             
+        except RateLimitExceeded:
+            await interaction.followup.send(embed=self.create_busy_embed(), ephemeral=True)
         except Exception as e:
             error_embed = discord.Embed(
                 title="❌ 조회 실패",
@@ -511,5 +1374,218 @@ class Finance(commands.Cog):
             logging.error(f"인기 코인 조회 중 오류: {e}")
             await interaction.followup.send(embed=error_embed, ephemeral=True)
 
+    @app_commands.command(name="등락률순위", description="원화 마켓 상승률/하락률 TOP 5를 조회합니다")
+    async def check_movers(self, interaction: discord.Interaction):
+        """전일대비 상승/하락 상위 코인 조회"""
+        await interaction.response.defer()
+        
+        try:
+            ranking = await self.get_ranking()
+            
+            embed = discord.Embed(
+                title="📊 전일대비 등락률 순위",
+                description="원화 마켓 상승률 TOP 5 + 하락률 TOP 5",
+                color=discord.Color.blue(),
+                timestamp=datetime.now(pytz.UTC)
+            )
+            
+            for prefix, markets in (("🔺 상승", ranking.top("signed_change_rate", 5)),
+                                    ("⏬ 하락", ranking.bottom("signed_change_rate", 5))):
+                for idx, market in enumerate(markets, 1):
+                    symbol = market["market"].split("-")[1]
+                    korean_name = self.catalog.korean_name(symbol)
+                    self.add_market_field(embed, market, 
+                                        f"{prefix} #{idx} {korean_name} ({symbol})")
+            
+            korea_time = datetime.now(pytz.timezone('Asia/Seoul'))
+            embed.set_footer(
+                text=f"업비트 기준 • {korea_time.strftime('%Y-%m-%d %H:%M:%S')} KST"
+            )
+            await interaction.followup.send(embed=embed)
+            
+        except RateLimitExceeded:
+            await interaction.followup.send(embed=self.create_busy_embed(), ephemeral=True)
+        except Exception as e:
+            error_embed = discord.Embed(
+                title="❌ 조회 실패",
+                description="```시세 정보를 불러오는 중 오류가 발생했습니다.\n잠시 후 다시 시도해주세요.```",
+                color=discord.Color.red()
+            )
+            logging.error(f"등락률 순위 조회 중 오류: {e}")
+            await interaction.followup.send(embed=error_embed, ephemeral=True)
+
+    @app_commands.command(name="시장요약", description="전체 시장 상승/하락 종목 수, 거래대금, 김치 프리미엄을 요약합니다")
+    async def check_market_summary(self, interaction: discord.Interaction):
+        """원화/테더/BTC 마켓 통합 스냅샷 요약"""
+        await interaction.response.defer()
+        
+        try:
+            summary = summarize_market(await self.fetch_market_snapshot())
+            
+            embed = discord.Embed(
+                title="🌐 시장 요약",
+                description=f"원화 {summary['krw_count']}개 • 테더 {summary['usdt_count']}개 • "
+                            f"BTC {summary['btc_count']}개 마켓",
+                color=self.get_change_color(summary["median_change"] * 100),
+                timestamp=datetime.now(pytz.UTC)
+            )
+            embed.add_field(
+                name="📊 원화 마켓 등락",
+                value=f"```\n"
+                      f"상승: {summary['advancers']}개 | 하락: {summary['decliners']}개 | 보합: {summary['unchanged']}개\n"
+                      f"등락률 중앙값: {summary['median_change'] * 100:+.2f}%\n"
+                      f"등락률 평균: {summary['mean_change'] * 100:+.2f}%\n"
+                      f"```",
+                inline=False
+            )
+            
+            value_lines = [f"원화 마켓: {summary['krw_value'] / 100000000:,.0f}억원"]
+            if summary["usdt_value"] is not None:
+                value_lines.append(f"테더 마켓: {summary['usdt_value'] / 100000000:,.0f}억원 (환산)")
+            if summary["btc_value"] is not None:
+                value_lines.append(f"BTC 마켓: {summary['btc_value'] / 100000000:,.0f}억원 (환산)")
+            embed.add_field(
+                name="💰 24시간 거래대금",
+                value="```\n" + "\n".join(value_lines) + "\n```",
+                inline=False
+            )
+            
+            premiums = summary["premiums"]
+            if premiums:
+                lines = [
+                    f"테더 환율: {self.format_price(summary['usdt_rate'], 'KRW')} KRW",
+                    f"중앙값: {summary['median_premium'] * 100:+.2f}% ({len(premiums)}개 코인)",
+                ]
+                # 대표 코인 먼저, 나머지는 프리미엄 큰 순
+                shown = [symbol for symbol in ("BTC", "ETH") if symbol in premiums]
+                shown += sorted((s for s in premiums if s not in shown), key=premiums.get, reverse=True)
+                for symbol in shown[:8]:
+                    lines.append(f"{self.catalog.korean_name(symbol)} ({symbol}): {premiums[symbol] * 100:+.2f}%")
+                embed.add_field(
+                    name="🇰🇷 김치 프리미엄 (원화 vs 테더)",
+                    value="```\n" + "\n".join(lines) + "\n```",
+                    inline=False
+                )
+            
+            korea_time = datetime.now(pytz.timezone('Asia/Seoul'))
+            embed.set_footer(
+                text=f"업비트 기준 • {korea_time.strftime('%Y-%m-%d %H:%M:%S')} KST"
+            )
+            await interaction.followup.send(embed=embed)
+            
+        except RateLimitExceeded:
+            await interaction.followup.send(embed=self.create_busy_embed(), ephemeral=True)
+        except Exception as e:
+            error_embed = discord.Embed(
+                title="❌ 조회 실패",
+                description="```시세 정보를 불러오는 중 오류가 발생했습니다.\n잠시 후 다시 시도해주세요.```",
+                color=discord.Color.red()
+            )
+            logging.error(f"시장 요약 조회 중 오류: {e}")
+            await interaction.followup.send(embed=error_embed, ephemeral=True)
+
+    @app_commands.command(name="급등락", description="최근 몇 분 사이 가장 많이 오르고 내린 코인을 조회합니다")
+    @app_commands.describe(기간="비교할 기간")
+    @app_commands.choices(기간=MOVER_PERIOD_CHOICES)
+    async def check_short_movers(self, interaction: discord.Interaction, 기간: int = 5):
+        """단기 시세 기록 기준 급등/급락 코인 조회"""
+        gainers, losers, span = self.price_history.movers(기간 * 60, 5)
+        if not gainers:
+            embed = discord.Embed(
+                title="⏳ 데이터 수집 중",
+                description="```시세 기록이 아직 충분하지 않습니다.\n잠시 후 다시 시도해주세요.```",
+                color=discord.Color.orange()
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+        
+        # 봇이 켜진 지 얼마 안 됐으면 실제 비교 구간이 더 짧음
+        description = f"최근 {기간}분 상승률 TOP 5 + 하락률 TOP 5"
+        if span < 기간 * 60 - ALERT_CHECK_SECONDS:
+            description += f" (기록 부족으로 최근 {span / 60:.1f}분 기준)"
+        embed = discord.Embed(
+            title=f"⚡ {기간}분 급등락",
+            description=description,
+            color=discord.Color.blue(),
+            timestamp=datetime.now(pytz.UTC)
+        )
+        _, traded, _ = self.price_history.changes(기간 * 60)
+        for prefix, movers in (("🔺 급등", gainers), ("⏬ 급락", losers)):
+            lines = []
+            for market, change in movers:
+                symbol = market.split("-")[1]
+                ticker = self.ranking.tickers.get(market)
+                price = self.format_price(ticker["trade_price"], "KRW") if ticker else "-"
+                value = traded[self.price_history.market_index[market]]
+                value_text = f"{value / 1000000:,.0f}백만" if not np.isnan(value) else "-"
+                lines.append(
+                    f"{self.catalog.korean_name(symbol)} ({symbol}): {change * 100:+.2f}% "
+                    f"| {price} KRW | 거래 {value_text}"
+                )
+            embed.add_field(name=prefix, value="```\n" + "\n".join(lines) + "\n```", inline=False)
+        
+        korea_time = datetime.now(pytz.timezone('Asia/Seoul'))
+        embed.set_footer(
+            text=f"업비트 기준 • {korea_time.strftime('%Y-%m-%d %H:%M:%S')} KST"
+        )
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="시세상태", description="업비트 요청 제한 및 캐시 상태를 확인합니다")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def check_upstream_status(self, interaction: discord.Interaction):
+        """업비트 요청 통계 조회"""
+        stats = self.rate_limiter.stats
+        cache = self.ticker_cache
+        
+        embed = discord.Embed(
+            title="🛠️ 시세 조회 상태",
+            color=discord.Color.blue(),
+            timestamp=datetime.now(pytz.UTC)
+        )
+        embed.add_field(
+            name="🚦 요청 제한",
+            value=f"```\n"
+                  f"요청: {stats['requests']}회\n"
+                  f"대기: {stats['delayed']}회 (총 {stats['wait_seconds']:.1f}초)\n"
+                  f"거절: {stats['shed']}회\n"
+                  f"429 응답: {stats['throttled']}회\n"
+                  f"```",
+            inline=False
+        )
+        embed.add_field(
+            name="🗃️ 시세 캐시",
+            value=f"```\n"
+                  f"캐시 응답: {cache.hits}회\n"
+                  f"업스트림 요청: {cache.upstream_calls}회\n"
+                  f"```",
+            inline=False
+        )
+        if self.stream:
+            embed.add_field(
+                name="📡 실시간 시세",
+                value=f"```\n"
+                      f"연결: {'정상' if self.stream.is_fresh else '끊김'}\n"
+                      f"구독 마켓: {len(self.stream.subscribed)}개\n"
+                      f"재연결: {self.stream.reconnects}회\n"
+                      f"```",
+                inline=False
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @check_price.autocomplete("코인")
+    @check_chart.autocomplete("코인")
+    @add_price_alert.autocomplete("코인")
+    async def coin_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        """코인 입력 자동완성 (입력이 없으면 거래대금 상위 코인)"""
+        if current.strip():
+            symbols = self.search_coins(current)
+        else:
+            symbols = [market["market"].split("-")[1] 
+                       for market in self.ranking.top("acc_trade_price_24h", 25)]
+        return [
+            app_commands.Choice(name=f"{self.catalog.korean_name(symbol)} ({symbol})", value=symbol)
+            for symbol in symbols
+        ]
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(Finance(bot))
\ No newline at end of file
@@ -0,0 +1,61 @@
+import asyncio
+import unittest
+
+import aiohttp
+from aiohttp import web
+
+from utils.rate_limiter import RateLimitExceeded, UpbitRateLimiter
+from utils.upbit_standin import UpbitStandIn
+
+class RateLimiterStandInTest(unittest.IsolatedAsyncioTestCase):
+    """업비트 대체 서버(초당 10회 제한)에 동시에 몰아서 요청해도 429가 나오지 않는지 확인"""
+
+    async def asyncSetUp(self):
+        self.standin = UpbitStandIn(extra_markets=10, rate_limit=10)
+        self.runner = web.AppRunner(self.standin.make_app(), access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.base_url = f"http://127.0.0.1:{self.runner.addresses[0][1]}/v1"
+        self.session = aiohttp.ClientSession()
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.runner.cleanup()
+
+    async def get(self, limiter: UpbitRateLimiter, group: str = "ticker") -> int:
+        """Finance.upbit_get과 같은 순서로 요청하고 상태 코드 반환 (429 재시도 없이)"""
+        await limiter.acquire(group)
+        try:
+            async with self.session.get(f"{self.base_url}/ticker", params={"markets": "KRW-BTC"}) as response:
+                limiter.update(group, response.headers.get("Remaining-Req"), response.status)
+                await response.read()
+                return response.status
+        finally:
+            limiter.finish(group)
+
+    async def test_concurrent_burst_has_no_429(self):
+        limiter = UpbitRateLimiter(rate=10, max_wait=5.0)
+        statuses = await asyncio.gather(*[self.get(limiter) for _ in range(39)])
+        self.assertEqual(statuses.count(429), 0)
+        self.assertEqual(statuses.count(200), 39)
+        self.assertEqual(limiter.stats["throttled"], 0)
+
+    async def test_bursts_across_second_boundaries_have_no_429(self):
+        limiter = UpbitRateLimiter(rate=10, max_wait=5.0)
+        statuses = []
+        for _ in range(3):
+            statuses += await asyncio.gather(*[self.get(limiter) for _ in range(7)])
+            await asyncio.sleep(0.35)
+        self.assertEqual(statuses.count(429), 0)
+
+    async def test_sheds_requests_over_max_wait(self):
+        limiter = UpbitRateLimiter(rate=10, max_wait=0.5)
+        results = await asyncio.gather(*[self.get(limiter) for _ in range(30)], return_exceptions=True)
+        shed = [r for r in results if isinstance(r, RateLimitExceeded)]
+        self.assertTrue(shed)
+        self.assertEqual(limiter.stats["shed"], len(shed))
+        self.assertNotIn(429, results)
+
+if __name__ == "__main__":
+    unittest.main()
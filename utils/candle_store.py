@@ -0,0 +1,195 @@
+import asyncio
+import math
+import os
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+# 간격별 (업비트 API 경로, 초 단위 길이)
+INTERVALS = {
+    "1m": ("/candles/minutes/1", 60),
+    "5m": ("/candles/minutes/5", 300),
+    "15m": ("/candles/minutes/15", 900),
+    "60m": ("/candles/minutes/60", 3600),
+    "240m": ("/candles/minutes/240", 14400),
+    "1d": ("/candles/days", 86400),
+}
+
+# 컬럼명, 자료형, 업비트 응답 필드
+COLUMNS = (
+    ("ts", np.int64, None),
+    ("open", np.float64, "opening_price"),
+    ("high", np.float64, "high_price"),
+    ("low", np.float64, "low_price"),
+    ("close", np.float64, "trade_price"),
+    ("volume", np.float64, "candle_acc_trade_volume"),
+    ("value", np.float64, "candle_acc_trade_price"),
+)
+
+PAGE_SIZE = 200  # 업비트 캔들 API 최대 개수
+
+def parse_candle_time(value: str) -> int:
+    """candle_date_time_utc 문자열을 epoch 초로 변환"""
+    return int(datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp())
+
+def format_candle_time(ts: int) -> str:
+    """epoch 초를 캔들 API의 to 파라미터 형식으로 변환"""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+# 캔들 저장소 처리 클래스
+class CandleStore:
+    """마켓/간격별 컬럼 파일에 캔들을 쌓고 memmap으로 읽는 저장소"""
+
+    def __init__(self, root: str, fetcher: Callable[[str, dict], Awaitable[List[Dict]]], concurrency: int = 4):
+        self.root = root
+        self.fetcher = fetcher
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self._maps: Dict[Tuple[str, str], Tuple[int, Dict[str, np.ndarray]]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self.version = 0  # 캔들이 추가될 때마다 증가 (계산 결과 캐시 무효화용)
+
+    def _dir(self, market: str, interval: str) -> str:
+        return os.path.join(self.root, interval, market)
+
+    def _open(self, market: str, interval: str) -> Dict[str, np.ndarray]:
+        """컬럼 파일을 memmap으로 열기 (파일 크기가 바뀌었을 때만 다시 매핑)"""
+        directory = self._dir(market, interval)
+        ts_path = os.path.join(directory, "ts.bin")
+        size = os.path.getsize(ts_path) if os.path.exists(ts_path) else 0
+        cached = self._maps.get((market, interval))
+        if cached and cached[0] == size:
+            return cached[1]
+
+        # 추가 도중 중단되면 일부 컬럼만 길어질 수 있으므로 가장 짧은 컬럼 길이에 맞춰 자름
+        itemsize = np.dtype(np.int64).itemsize
+        paths = [os.path.join(directory, f"{name}.bin") for name, _, _ in COLUMNS]
+        sizes = [os.path.getsize(path) if os.path.exists(path) else 0 for path in paths]
+        count = min(sizes) // itemsize
+        for path, file_size in zip(paths, sizes):
+            if file_size != count * itemsize:
+                os.truncate(path, count * itemsize)
+
+        columns = {}
+        for path, (name, dtype, _) in zip(paths, COLUMNS):
+            if count == 0:
+                columns[name] = np.empty(0, dtype=dtype)
+            else:
+                columns[name] = np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+        self._maps[(market, interval)] = (count * itemsize, columns)
+        return columns
+
+    def count(self, market: str, interval: str) -> int:
+        return len(self._open(market, interval)["ts"])
+
+    def last_ts(self, market: str, interval: str) -> Optional[int]:
+        ts = self._open(market, interval)["ts"]
+        return int(ts[-1]) if len(ts) else None
+
+    def range(self, market: str, interval: str, start: Optional[int] = None,
+              end: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """[start, end] 구간 캔들을 복사 없이 memmap 슬라이스로 반환"""
+        columns = self._open(market, interval)
+        ts = columns["ts"]
+        lo = 0 if start is None else int(np.searchsorted(ts, start, side="left"))
+        hi = len(ts) if end is None else int(np.searchsorted(ts, end, side="right"))
+        return {name: column[lo:hi] for name, column in columns.items()}
+
+    def tail(self, market: str, interval: str, count: int) -> Dict[str, np.ndarray]:
+        """최근 count개 캔들 (memmap 슬라이스)"""
+        columns = self._open(market, interval)
+        return {name: column[-count:] if count else column[:0] for name, column in columns.items()}
+
+    def append(self, market: str, interval: str, candles: List[Dict]) -> int:
+        """마감된 새 캔들만 시간순으로 추가하고 추가된 개수 반환"""
+        step = INTERVALS[interval][1]
+        now = time.time()
+        last = self.last_ts(market, interval)
+
+        rows = {}
+        for candle in candles:
+            ts = parse_candle_time(candle["candle_date_time_utc"])
+            # 진행 중인 캔들과 이미 저장된 캔들은 제외
+            if ts + step > now or (last is not None and ts <= last):
+                continue
+            rows[ts] = candle
+        if not rows:
+            return 0
+
+        order = sorted(rows)
+        directory = self._dir(market, interval)
+        os.makedirs(directory, exist_ok=True)
+        # 행 수는 ts.bin 기준이므로 ts.bin을 마지막에 써서, 중간에 멈춰도 다른 컬럼만 길게 남도록 함
+        try:
+            for name, dtype, field in COLUMNS[1:] + COLUMNS[:1]:
+                if field is None:
+                    values = np.array(order, dtype=dtype)
+                else:
+                    values = np.array([rows[ts][field] for ts in order], dtype=dtype)
+                with open(os.path.join(directory, f"{name}.bin"), "ab") as f:
+                    f.write(values.tobytes())
+        except OSError:
+            # 다음에 열 때 컬럼 길이를 다시 맞추도록 매핑 캐시 제거
+            self._maps.pop((market, interval), None)
+            raise
+        self.version += 1
+        return len(order)
+
+    def reset(self, market: str, interval: str):
+        """마켓/간격의 저장된 캔들 삭제 (이미 열린 memmap은 삭제된 파일을 계속 가리키므로 안전)"""
+        directory = self._dir(market, interval)
+        for name, _, _ in COLUMNS:
+            path = os.path.join(directory, f"{name}.bin")
+            if os.path.exists(path):
+                os.remove(path)
+        self._maps.pop((market, interval), None)
+        self.version += 1
+
+    async def _fetch_page(self, market: str, interval: str, to: int) -> List[Dict]:
+        path, _ = INTERVALS[interval]
+        params = {"market": market, "to": format_candle_time(to), "count": PAGE_SIZE}
+        async with self.semaphore:
+            return await self.fetcher(path, params)
+
+    async def sync(self, market: str, interval: str, backfill: int = PAGE_SIZE,
+                   max_gap: Optional[int] = None) -> int:
+        """저장소가 비어 있으면 backfill개를 채우고, 아니면 마지막 캔들 이후를 빠짐없이 추가
+
+        봇이 오래 꺼져 있었어도 마지막 저장 캔들까지 페이지를 거슬러 받으므로 중간에 빈 구간이 생기지 않습니다.
+        max_gap을 주면 (사용자가 기다리는 요청) 빠진 캔들이 그보다 많을 때 기존 캔들을 버리고 최근 backfill개부터 새로 쌓습니다.
+        """
+        lock = self._locks.setdefault((market, interval), asyncio.Lock())
+        async with lock:
+            step = INTERVALS[interval][1]
+            now = int(time.time())
+            last = self.last_ts(market, interval)
+
+            if last is None:
+                pages = math.ceil(backfill / PAGE_SIZE)
+            elif last + 2 * step > now:
+                return 0  # 다음 캔들이 아직 마감되지 않음
+            elif max_gap is not None and (now - last) // step > max_gap:
+                self.reset(market, interval)
+                pages = math.ceil(backfill / PAGE_SIZE)
+            else:
+                pages = math.ceil((now - last) / (step * PAGE_SIZE))
+            if pages <= 0:
+                return 0
+
+            # 페이지별 구간을 미리 계산해 두면 이전 응답을 기다리지 않고 동시에 요청 가능
+            aligned = now - now % step + step
+            results = await asyncio.gather(*[
+                self._fetch_page(market, interval, aligned - page * step * PAGE_SIZE)
+                for page in range(pages)
+            ])
+            candles = [candle for page in results for candle in page]
+            return self.append(market, interval, candles)
+
+    async def sync_many(self, markets: List[str], interval: str, backfill: int = PAGE_SIZE) -> Dict[str, int]:
+        """여러 마켓을 동시에 동기화 (실패한 마켓은 건너뜀)"""
+        results = await asyncio.gather(
+            *[self.sync(market, interval, backfill) for market in markets],
+            return_exceptions=True
+        )
+        return {market: result for market, result in zip(markets, results)
+                if not isinstance(result, Exception)}
@@ -0,0 +1,91 @@
+import asyncio
+import io
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Hashable, Optional
+import numpy as np
+
+def render_chart(title: str, columns: Dict[str, np.ndarray], step: int) -> bytes:
+    """캔들 + 거래량 차트 PNG 생성 (프로세스 풀에서 실행)"""
+    # 자식 프로세스에서만 matplotlib을 불러와 봇 프로세스의 시작 시간과 메모리를 아낌
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.dates as mdates
+    import matplotlib.pyplot as plt
+
+    ts = columns["ts"]
+    x = mdates.date2num([datetime.fromtimestamp(int(t), tz=timezone.utc) for t in ts])
+    rising = columns["close"] >= columns["open"]
+    colors = np.where(rising, "#ff3b3b", "#3b3bff")
+    # 몸통은 Rectangle 대신 굵은 선(LineCollection)으로 그려 캔들 수가 많아도 빠르게 렌더링
+    body_width = max(1.0, 600 / max(len(ts), 1))
+
+    fig, (ax_price, ax_volume) = plt.subplots(
+        2, 1, figsize=(10, 6), sharex=True,
+        gridspec_kw={"height_ratios": [3, 1]}
+    )
+    ax_price.vlines(x, columns["low"], columns["high"], colors=colors, linewidth=0.8)
+    ax_price.vlines(x, columns["open"], columns["close"], colors=colors, linewidth=body_width)
+    ax_price.set_title(title)
+    ax_price.ticklabel_format(axis="y", style="plain", useOffset=False)
+    ax_price.grid(alpha=0.3)
+    ax_volume.vlines(x, 0, columns["value"], colors=colors, linewidth=body_width)
+    ax_volume.grid(alpha=0.3)
+    ax_volume.xaxis.set_major_formatter(mdates.DateFormatter("%m-%d %H:%M" if step < 86400 else "%Y-%m-%d"))
+    fig.autofmt_xdate()
+    fig.tight_layout()
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=100)
+    plt.close(fig)
+    return buffer.getvalue()
+
+# 차트 렌더링 처리 클래스
+class ChartRenderer:
+    """프로세스 풀 차트 렌더링 + 렌더링 결과 LRU 캐시"""
+
+    def __init__(self, max_workers: int = 2, cache_size: int = 64):
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if not self._executor:
+            # 이벤트 루프 스레드가 도는 프로세스를 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def render(self, key: Hashable, title: str, columns: Dict[str, np.ndarray], step: int) -> bytes:
+        """key가 같으면 캐시된 PNG 반환, 같은 차트를 동시에 요청하면 한 번만 렌더링"""
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        if key in self._inflight:
+            return await asyncio.shield(self._inflight[key])
+
+        # memmap 슬라이스는 자식 프로세스로 넘기기 위해 일반 배열로 복사
+        arrays = {name: np.array(column) for name, column in columns.items()}
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_executor(), render_chart, title, arrays, step)
+        self._inflight[key] = future
+        try:
+            png = await asyncio.shield(future)
+        finally:
+            self._inflight.pop(key, None)
+
+        self.cache[key] = png
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return png
+
+    def shutdown(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,132 @@
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_START, HANGUL_END = 0xAC00, 0xD7A3
+
+class CoinNotFoundError(ValueError):
+    """입력이 코인 하나로 확정되지 않는 경우 (메시지에 추천 코인 포함)"""
+
+def normalize(text: str) -> str:
+    """공백 제거 + 소문자"""
+    return text.replace(" ", "").lower()
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 변환 (예: 비트코인 -> ㅂㅌㅋㅇ), 나머지 문자는 그대로"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_START <= code <= HANGUL_END:
+            result.append(CHOSUNG[(code - HANGUL_START) // 588])
+        else:
+            result.append(char)
+    return "".join(result)
+
+def deletes(word: str) -> Set[str]:
+    """한 글자를 지운 모든 변형 (편집 거리 1 후보 탐색용)"""
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+# 코인 검색 인덱스 처리 클래스
+class CoinSearchIndex:
+    """심볼/한글명/초성 접두어, 부분 문자열, 오타(편집 거리 1) 검색 인덱스"""
+
+    # 점수가 낮을수록 우선
+    EXACT, PREFIX, SUBSTRING, TYPO = range(4)
+
+    def __init__(self, names: Dict[str, str]):
+        self.names = names
+        keys: List[Tuple[str, str]] = []
+        self._bigrams: Dict[str, Set[str]] = {}
+        self._deletes: Dict[str, Set[str]] = {}
+
+        for symbol, korean in names.items():
+            for key in {symbol.lower(), normalize(korean), to_chosung(normalize(korean))}:
+                keys.append((key, symbol))
+                for i in range(len(key) - 1):
+                    self._bigrams.setdefault(key[i:i + 2], set()).add(symbol)
+                for variant in deletes(key) | {key}:
+                    self._deletes.setdefault(variant, set()).add(symbol)
+
+        keys.sort()
+        self._keys = keys
+        self._key_strings = [key for key, _ in keys]
+
+    def _prefix(self, query: str) -> Dict[str, int]:
+        """정렬된 키에서 접두어 범위만 탐색"""
+        found = {}
+        i = bisect_left(self._key_strings, query)
+        while i < len(self._keys) and self._key_strings[i].startswith(query):
+            key, symbol = self._keys[i]
+            score = self.EXACT if key == query else self.PREFIX
+            found[symbol] = min(found.get(symbol, score), score)
+            i += 1
+        return found
+
+    def _substring(self, query: str) -> Set[str]:
+        """바이그램 역색인 교집합으로 후보를 좁힌 뒤 부분 문자열 확인"""
+        if len(query) < 2:
+            return set()
+        candidates = None
+        for i in range(len(query) - 1):
+            posting = self._bigrams.get(query[i:i + 2], set())
+            candidates = posting if candidates is None else candidates & posting
+            if not candidates:
+                return set()
+        return {
+            symbol for symbol in candidates
+            if any(query in key for key in self._symbol_keys(symbol))
+        }
+
+    def _typo(self, query: str) -> Set[str]:
+        """삭제 변형 사전으로 편집 거리 1 이내 후보 탐색 (SymSpell 방식)"""
+        if len(query) < 2:
+            return set()
+        found = set()
+        for variant in deletes(query) | {query}:
+            found |= self._deletes.get(variant, set())
+        return found
+
+    def _symbol_keys(self, symbol: str) -> Tuple[str, str, str]:
+        korean = normalize(self.names[symbol])
+        return symbol.lower(), korean, to_chosung(korean)
+
+    def _prefix_scores(self, query: str) -> Dict[str, int]:
+        """접두어 탐색 점수 (정확/접두어)"""
+        scores = self._prefix(query)
+        # "비트ㅋ"처럼 완성형과 초성이 섞인 입력은 전체를 초성으로 바꿔서 한 번 더 탐색
+        if any(char in CHOSUNG for char in query):
+            for symbol, score in self._prefix(to_chosung(query)).items():
+                scores[symbol] = min(scores.get(symbol, score), score)
+        return scores
+
+    def prefix_matches(self, query: str) -> Set[str]:
+        """심볼/한글명/초성이 query로 시작하는 코인 (오타/부분 문자열은 제외)"""
+        query = normalize(query)
+        return set(self._prefix_scores(query)) if query else set()
+
+    def exact_matches(self, query: str) -> Set[str]:
+        """심볼/한글명/초성이 query와 정확히 같은 코인 (예: ㅂㅌㅋㅇ -> 비트코인)"""
+        query = normalize(query)
+        if not query:
+            return set()
+        return {symbol for symbol, score in self._prefix_scores(query).items() if score == self.EXACT}
+
+    def search(self, query: str, limit: int = 25,
+               popularity: Optional[Callable[[str], Optional[int]]] = None) -> List[str]:
+        """검색어에 맞는 심볼 목록 (정확 > 접두어 > 부분 문자열 > 오타, 같은 단계는 인기순)"""
+        query = normalize(query)
+        if not query:
+            return []
+
+        scores = self._prefix_scores(query)
+        for symbol in self._substring(query):
+            scores.setdefault(symbol, self.SUBSTRING)
+        if len(scores) < limit:
+            for symbol in self._typo(query):
+                scores.setdefault(symbol, self.TYPO)
+
+        def sort_key(symbol: str):
+            rank = popularity(symbol) if popularity else None
+            return (scores[symbol], rank if rank is not None else float("inf"), len(self.names[symbol]), symbol)
+
+        return sorted(scores, key=sort_key)[:limit]
@@ -0,0 +1,73 @@
+import time
+from typing import Dict, Iterable, List, Optional
+
+class SourceSchedule:
+    """한 랭킹 페이지의 크롤링 간격 (새 기사 유입 속도로 조정)"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.rate = None  # 새 기사 수/초 (지수 이동 평균)
+        self.keys = None  # 마지막으로 본 랭킹의 기사 키
+        self.checked_at = None
+        self.changed_at = None
+        self.next_at = 0.0  # 처음에는 바로 크롤링
+
+# 크롤링 주기 처리 클래스
+class AdaptiveSchedule:
+    """소스별로 최근 랭킹이 바뀐 빈도에 맞춰 크롤링 간격 조정
+
+    한 번 크롤링할 때 새 기사가 target_new개 정도 보이도록 간격을 잡고 [min_interval, max_interval]로 제한합니다.
+    속보가 많을 때는 짧아지고, 랭킹이 거의 안 바뀌는 밤에는 길어집니다.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float, target_new: float = 3.0, smoothing: float = 0.5):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_new = target_new
+        self.smoothing = smoothing
+        self.sources: Dict[str, SourceSchedule] = {}
+
+    def get(self, url: str) -> SourceSchedule:
+        if url not in self.sources:
+            initial = min(self.max_interval, max(self.min_interval, 30 * 60))
+            self.sources[url] = SourceSchedule(initial)
+        return self.sources[url]
+
+    def due(self, urls: Iterable[str], now: Optional[float] = None) -> List[str]:
+        """크롤링할 때가 된 URL"""
+        now = time.monotonic() if now is None else now
+        return [url for url in urls if self.get(url).next_at <= now]
+
+    def postpone(self, url: str, delay: float, now: Optional[float] = None):
+        """크롤링에 실패한 소스는 delay초 뒤에 다시 시도"""
+        now = time.monotonic() if now is None else now
+        self.get(url).next_at = now + delay
+
+    def advance(self, url: str, now: Optional[float] = None):
+        """정기 크롤링을 마친 소스의 다음 크롤링 시각 설정 (실패로 미뤄 둔 소스는 그대로)"""
+        now = time.monotonic() if now is None else now
+        source = self.get(url)
+        if source.next_at <= now:
+            source.next_at = now + source.interval
+
+    def observe(self, url: str, keys: Iterable[str], now: Optional[float] = None) -> SourceSchedule:
+        """새로 받은 랭킹으로 변경 빈도와 간격 조정 (봇 명령으로 받은 결과도 포함)
+
+        다음 크롤링 시각은 정기 크롤링(advance)에서만 정하므로, 봇 명령이 잦아도 정기 알림이 밀리지 않습니다.
+        """
+        now = time.monotonic() if now is None else now
+        source = self.get(url)
+        keys = list(keys)
+        if source.keys is not None and now > source.checked_at:
+            new = len(set(keys) - set(source.keys))
+            if new:
+                source.changed_at = now
+            observed = new / (now - source.checked_at)
+            source.rate = observed if source.rate is None else (
+                self.smoothing * observed + (1 - self.smoothing) * source.rate
+            )
+            interval = self.target_new / source.rate if source.rate > 0 else self.max_interval
+            source.interval = min(self.max_interval, max(self.min_interval, interval))
+        source.keys = keys
+        source.checked_at = now
+        return source
@@ -0,0 +1,99 @@
+import warnings
+from typing import Dict, List
+import numpy as np
+from utils.candle_store import CandleStore, INTERVALS
+
+def build_market_matrix(store: CandleStore, markets: List[str], interval: str,
+                        length: int) -> Dict[str, np.ndarray]:
+    """마켓별 최근 캔들을 같은 시간 축에 맞춘 (마켓 x 시간) 2차원 배열로 변환
+
+    거래가 없어 빠진 캔들은 직전 종가로 채우고 거래대금은 0으로 둡니다.
+    """
+    step = INTERVALS[interval][1]
+    tails = [store.tail(market, interval, length) for market in markets]
+    last_ts = max((int(tail["ts"][-1]) for tail in tails if len(tail["ts"])), default=None)
+    if last_ts is None:
+        return {"markets": np.array(markets), "ts": np.empty(0, dtype=np.int64),
+                "close": np.empty((len(markets), 0)), "value": np.empty((len(markets), 0))}
+
+    start = last_ts - step * (length - 1)
+    close = np.full((len(markets), length), np.nan)
+    value = np.zeros((len(markets), length))
+    for row, tail in enumerate(tails):
+        ts = np.asarray(tail["ts"])
+        keep = ts >= start
+        cols = (ts[keep] - start) // step
+        close[row, cols] = tail["close"][keep]
+        value[row, cols] = tail["value"][keep]
+
+    # 행마다 마지막으로 값이 있던 열 번호를 누적 최댓값으로 구해 앞 값으로 채움 (forward fill)
+    valid = ~np.isnan(close)
+    last_valid = np.where(valid, np.arange(length), 0)
+    np.maximum.accumulate(last_valid, axis=1, out=last_valid)
+    close = close[np.arange(len(markets))[:, None], last_valid]
+
+    return {
+        "markets": np.array(markets),
+        "ts": start + step * np.arange(length, dtype=np.int64),
+        "close": close,
+        "value": value,
+    }
+
+def moving_average(close: np.ndarray, window: int, offset: int = 0) -> np.ndarray:
+    """마지막(offset만큼 이전) 시점의 단순 이동평균"""
+    end = close.shape[1] - offset
+    return np.nanmean(close[:, end - window:end], axis=1)
+
+def rsi(close: np.ndarray, window: int = 14) -> np.ndarray:
+    """마지막 시점 RSI (단순 평균 방식)"""
+    diff = np.diff(close[:, -(window + 1):], axis=1)
+    gain = np.nansum(np.clip(diff, 0, None), axis=1) / window
+    loss = np.nansum(np.clip(-diff, 0, None), axis=1) / window
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = gain / loss
+        result = 100 - 100 / (1 + rs)
+    # 하락이 전혀 없으면 100, 변동이 전혀 없으면 50
+    result = np.where(loss == 0, np.where(gain == 0, 50.0, 100.0), result)
+    return result
+
+def volatility(close: np.ndarray, window: int = 20) -> np.ndarray:
+    """최근 window 구간 로그 수익률 표준편차 (%)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(np.log(close[:, -(window + 1):]), axis=1)
+    return np.nanstd(returns, axis=1) * 100
+
+def volume_zscore(value: np.ndarray, window: int = 20) -> np.ndarray:
+    """마지막 거래대금이 직전 window 구간 평균에서 몇 표준편차 떨어졌는지"""
+    history = value[:, -(window + 1):-1]
+    mean = history.mean(axis=1)
+    std = history.std(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (value[:, -1] - mean) / std
+    return np.where(std > 0, z, 0.0)
+
+def analyze_markets(matrix: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """전체 마켓 지표를 한 번에 계산 (마켓별 루프 없음)"""
+    # 신규 상장 등으로 값이 전부 비어 있는 행의 경고는 무시 (valid로 걸러냄)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return _analyze(matrix["close"], matrix["value"])
+
+def _analyze(close: np.ndarray, value: np.ndarray) -> Dict[str, np.ndarray]:
+    ma5 = moving_average(close, 5)
+    ma20 = moving_average(close, 20)
+    prev_ma5 = moving_average(close, 5, offset=1)
+    prev_ma20 = moving_average(close, 20, offset=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ma20_gap = (close[:, -1] / ma20 - 1) * 100
+    return {
+        "ma5": ma5,
+        "ma20": ma20,
+        "ma20_gap": ma20_gap,
+        "golden_cross": (prev_ma5 <= prev_ma20) & (ma5 > ma20),
+        "dead_cross": (prev_ma5 >= prev_ma20) & (ma5 < ma20),
+        "rsi": rsi(close),
+        "volatility": volatility(close),
+        "volume_z": volume_zscore(value),
+        # 20개 이상 캔들이 있는 마켓만 신호 대상
+        "valid": np.count_nonzero(~np.isnan(close[:, -21:]), axis=1) >= 21,
+    }
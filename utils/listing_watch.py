@@ -0,0 +1,63 @@
+import json
+import os
+from typing import Dict, List, Optional
+
+class CatalogChanges:
+    def __init__(self, listed: List[str], delisted: List[str], warned: List[str], unwarned: List[str]):
+        self.listed = listed
+        self.delisted = delisted
+        self.warned = warned
+        self.unwarned = unwarned
+
+    def __bool__(self) -> bool:
+        return bool(self.listed or self.delisted or self.warned or self.unwarned)
+
+# 상장/상장 폐지 감지 처리 클래스
+class ListingWatcher:
+    """마지막으로 본 마켓 목록과 유의 종목 상태를 저장해 두고 변경분만 계산"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.channels: List[int] = []
+        self.warnings: Optional[Dict[str, bool]] = None  # 마켓 -> 유의 종목 여부
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.channels = data.get("channels", [])
+            self.warnings = data.get("warnings")
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"channels": self.channels, "warnings": self.warnings}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def toggle_channel(self, channel_id: int) -> bool:
+        """채널 구독 추가/해제 (구독 상태가 되면 True)"""
+        if channel_id in self.channels:
+            self.channels.remove(channel_id)
+            subscribed = False
+        else:
+            self.channels.append(channel_id)
+            subscribed = True
+        self.save()
+        return subscribed
+
+    def diff(self, warnings: Dict[str, bool]) -> Optional[CatalogChanges]:
+        """새 카탈로그와 집합 비교 후 상태 갱신 (처음 보는 경우 기준점만 저장하고 None)"""
+        previous = self.warnings
+        self.warnings = dict(warnings)
+        self.save()
+        if previous is None:
+            return None
+
+        old_markets = previous.keys()
+        new_markets = warnings.keys()
+        common = old_markets & new_markets
+        return CatalogChanges(
+            listed=sorted(new_markets - old_markets),
+            delisted=sorted(old_markets - new_markets),
+            warned=sorted(m for m in common if warnings[m] and not previous[m]),
+            unwarned=sorted(m for m in common if previous[m] and not warnings[m]),
+        )
@@ -0,0 +1,87 @@
+import time
+from typing import Awaitable, Callable, Dict, List
+from utils.coin_search import CoinSearchIndex
+
+def create_reverse_mapping(coin_names: dict) -> dict:
+    """코인 한글명으로 심볼을 찾기 위한 역방향 매핑"""
+    reverse_map = {}
+    for symbol, korean in coin_names.items():
+        # 기본 한글명 매핑
+        reverse_map[korean.lower()] = symbol
+        # 특수문자 제거한 한글명도 매핑 (예: "비트코인골드" -> BTG)
+        cleaned_name = korean.replace(" ", "").lower()
+        reverse_map[cleaned_name] = symbol
+    return reverse_map
+
+def is_warning(item: dict) -> bool:
+    """유의 종목 여부 (구버전 market_warning / 신버전 market_event 모두 지원)"""
+    if item.get("market_warning") == "CAUTION":
+        return True
+    return bool((item.get("market_event") or {}).get("warning"))
+
+# 업비트 마켓 카탈로그 처리 클래스
+class MarketCatalog:
+    """업비트 마켓 목록, 한글명, 유의 종목 정보 캐시"""
+
+    def __init__(self, fetcher: Callable[[], Awaitable[List[Dict]]], fallback_names: Dict[str, str]):
+        self.fetcher = fetcher
+        self.names: Dict[str, str] = dict(fallback_names)
+        self.symbols: Dict[str, str] = create_reverse_mapping(self.names)
+        self.search_index = CoinSearchIndex(self.names)
+        self.markets: List[str] = []
+        self.krw_markets: List[str] = []
+        self.warnings: Dict[str, bool] = {}
+        self.loaded_at = None
+        self.digest = None  # 마지막 응답 요약 해시 (변경 여부 판단용)
+
+    @property
+    def loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    async def refresh(self) -> bool:
+        """마켓 목록을 다시 받아 바뀐 경우에만 카탈로그 재구성 (재구성하면 True)"""
+        data = await self.fetcher()
+
+        # 대부분의 갱신은 변경이 없으므로 해시만 비교하고 끝냄
+        digest = hash(tuple((item["market"], item["korean_name"], is_warning(item)) for item in data))
+        if digest == self.digest:
+            self.loaded_at = time.time()
+            return False
+
+        names = {}
+        markets = []
+        krw_markets = []
+        warnings = {}
+        for item in data:
+            market = item["market"]
+            markets.append(market)
+            warnings[market] = is_warning(item)
+            if market.startswith("KRW-"):
+                krw_markets.append(market)
+                names[market.split("-")[1]] = item["korean_name"]
+
+        symbols = create_reverse_mapping(names)
+        # 자동완성은 키 입력마다 호출되므로 검색 인덱스는 여기서 미리 만들어 둠
+        search_index = CoinSearchIndex(names)
+
+        # await 없이 한 번에 교체하므로 조회 중인 코루틴은 항상 일관된 상태를 봄
+        self.names = names
+        self.symbols = symbols
+        self.search_index = search_index
+        self.markets = markets
+        self.krw_markets = krw_markets
+        self.warnings = warnings
+        self.loaded_at = time.time()
+        self.digest = digest
+        return True
+
+    def korean_name(self, symbol: str) -> str:
+        """심볼의 한글명 반환 (없으면 심볼 그대로)"""
+        return self.names.get(symbol, symbol)
+
+    def find_symbol(self, query: str) -> str | None:
+        """심볼 또는 한글명으로 심볼 찾기"""
+        query = query.strip()
+        if query.upper() in self.names:
+            return query.upper()
+        return self.symbols.get(query.replace(" ", "").lower())
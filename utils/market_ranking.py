@@ -0,0 +1,77 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 마켓 순위 인덱스 처리 클래스
+class MarketRanking:
+    """시세가 바뀔 때마다 지표별 정렬 인덱스를 갱신하는 순위표"""
+
+    FIELDS = ("acc_trade_price_24h", "signed_change_rate")
+
+    def __init__(self, fields: Iterable[str] = FIELDS):
+        # 지표별 (값, 마켓) 오름차순 리스트
+        self._index: Dict[str, List[Tuple[float, str]]] = {field: [] for field in fields}
+        self._values: Dict[str, Dict[str, float]] = {field: {} for field in fields}
+        self.tickers: Dict[str, Dict] = {}
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def update(self, ticker: Dict):
+        """한 마켓의 시세 반영 (지표당 O(log n) 탐색)"""
+        market = ticker["market"]
+        self.tickers[market] = ticker
+        for field, index in self._index.items():
+            value = ticker.get(field)
+            if value is None:
+                continue
+            old = self._values[field].get(market)
+            if old == value:
+                continue
+            if old is not None:
+                del index[bisect_left(index, (old, market))]
+            insort(index, (value, market))
+            self._values[field][market] = value
+
+    def update_many(self, tickers: Iterable[Dict]):
+        for ticker in tickers:
+            self.update(ticker)
+
+    def remove(self, market: str):
+        """상장 폐지 등으로 사라진 마켓 제거"""
+        self.tickers.pop(market, None)
+        for field, index in self._index.items():
+            old = self._values[field].pop(market, None)
+            if old is not None:
+                del index[bisect_left(index, (old, market))]
+
+    def retain(self, markets: Iterable[str]):
+        """주어진 마켓만 남기고 제거"""
+        keep = set(markets)
+        for market in [m for m in self.tickers if m not in keep]:
+            self.remove(market)
+
+    def top(self, field: str, n: int, exclude: Iterable[str] = ()) -> List[Dict]:
+        """지표 기준 상위 n개 (내림차순)"""
+        return self._take(reversed(self._index[field]), n, exclude)
+
+    def bottom(self, field: str, n: int, exclude: Iterable[str] = ()) -> List[Dict]:
+        """지표 기준 하위 n개 (오름차순)"""
+        return self._take(iter(self._index[field]), n, exclude)
+
+    def rank(self, field: str, market: str) -> Optional[int]:
+        """지표 기준 내림차순 순위 (1부터 시작)"""
+        value = self._values[field].get(market)
+        if value is None:
+            return None
+        index = self._index[field]
+        return len(index) - bisect_right(index, (value, market)) + 1
+
+    def _take(self, keys, n: int, exclude: Iterable[str]) -> List[Dict]:
+        excluded = set(exclude)
+        result = []
+        for _, market in keys:
+            if len(result) >= n:
+                break
+            if market not in excluded:
+                result.append(self.tickers[market])
+        return result
@@ -0,0 +1,68 @@
+from typing import Dict, List
+import numpy as np
+
+def to_columns(tickers: List[Dict]) -> Dict[str, np.ndarray]:
+    """시세 목록을 한 번 훑어서 열 단위 배열로 변환"""
+    quote, base = zip(*(ticker["market"].split("-") for ticker in tickers)) if tickers else ((), ())
+    return {
+        "quote": np.array(quote, dtype=object),
+        "base": np.array(base, dtype=object),
+        "price": np.array([ticker["trade_price"] for ticker in tickers], dtype=float),
+        "change": np.array([ticker["signed_change_rate"] for ticker in tickers], dtype=float),
+        "value": np.array([ticker["acc_trade_price_24h"] for ticker in tickers], dtype=float),
+    }
+
+def summarize_market(tickers: List[Dict]) -> Dict:
+    """원화/테더/BTC 마켓 통합 스냅샷으로 시장 요약 지표 계산 (추가 요청 없음)
+
+    김치 프리미엄은 원화와 테더 마켓에 모두 있는 코인을 KRW-USDT 환율로 환산해 비교합니다.
+    """
+    cols = to_columns(tickers)
+    krw = cols["quote"] == "KRW"
+    usdt = cols["quote"] == "USDT"
+    btc = cols["quote"] == "BTC"
+    krw_change = cols["change"][krw]
+
+    summary = {
+        "krw_count": int(krw.sum()),
+        "usdt_count": int(usdt.sum()),
+        "btc_count": int(btc.sum()),
+        "advancers": int((krw_change > 0).sum()),
+        "decliners": int((krw_change < 0).sum()),
+        "unchanged": int((krw_change == 0).sum()),
+        "krw_value": float(cols["value"][krw].sum()),
+        "median_change": float(np.median(krw_change)) if len(krw_change) else 0.0,
+        "mean_change": float(krw_change.mean()) if len(krw_change) else 0.0,
+        "btc_value": None,  # BTC 마켓 거래대금 (원화 환산)
+        "usdt_rate": None,
+        "usdt_value": None,  # 테더 마켓 거래대금 (원화 환산)
+        "premiums": {},
+        "median_premium": None,
+    }
+
+    btc_index = np.flatnonzero(krw & (cols["base"] == "BTC"))
+    if len(btc_index):
+        summary["btc_value"] = float(cols["value"][btc].sum() * cols["price"][btc_index[0]])
+
+    # 원화 마켓 기준 테더 환율
+    rate_index = np.flatnonzero(krw & (cols["base"] == "USDT"))
+    if len(rate_index) == 0:
+        return summary
+    usdt_rate = cols["price"][rate_index[0]]
+    summary["usdt_rate"] = float(usdt_rate)
+    summary["usdt_value"] = float(cols["value"][usdt].sum() * usdt_rate)
+
+    # 양쪽 마켓에 모두 상장된 코인만 골라 한 번에 프리미엄 계산
+    krw_index = np.flatnonzero(krw)
+    usdt_index = np.flatnonzero(usdt)
+    _, krw_pos, usdt_pos = np.intersect1d(
+        cols["base"][krw_index].astype(str), cols["base"][usdt_index].astype(str), return_indices=True
+    )
+    if len(krw_pos):
+        krw_price = cols["price"][krw_index[krw_pos]]
+        usdt_price = cols["price"][usdt_index[usdt_pos]]
+        premium = krw_price / (usdt_price * usdt_rate) - 1
+        symbols = cols["base"][krw_index[krw_pos]]
+        summary["premiums"] = {str(symbol): float(p) for symbol, p in zip(symbols, premium)}
+        summary["median_premium"] = float(np.median(premium))
+    return summary
@@ -0,0 +1,176 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    press TEXT,
+    summary TEXT,
+    best_rank INTEGER,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_first_seen ON articles(first_seen);
+-- 한글은 띄어쓰기/조사 때문에 단어 단위 색인이 잘 맞지 않아 3글자 단위(trigram) 색인 사용
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, content='articles', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, summary) VALUES ('delete', old.id, old.title, old.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE OF title, summary ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, summary) VALUES ('delete', old.id, old.title, old.summary);
+    INSERT INTO articles_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+END;
+-- trigram은 3글자 미만 검색어를 찾지 못하므로, 2글자씩 나눈 텍스트를 단어 단위(unicode61)로 따로 색인
+-- (내용은 저장하지 않는 색인 전용 테이블, bigrams()는 연결마다 등록하는 파이썬 함수)
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_bigram USING fts5(
+    title, summary, content='', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS articles_bigram_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_bigram(rowid, title, summary) VALUES (new.id, bigrams(new.title), bigrams(new.summary));
+END;
+CREATE TRIGGER IF NOT EXISTS articles_bigram_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_bigram(articles_bigram, rowid, title, summary)
+    VALUES ('delete', old.id, bigrams(old.title), bigrams(old.summary));
+END;
+CREATE TRIGGER IF NOT EXISTS articles_bigram_au AFTER UPDATE OF title, summary ON articles BEGIN
+    INSERT INTO articles_bigram(articles_bigram, rowid, title, summary)
+    VALUES ('delete', old.id, bigrams(old.title), bigrams(old.summary));
+    INSERT INTO articles_bigram(rowid, title, summary) VALUES (new.id, bigrams(new.title), bigrams(new.summary));
+END;
+"""
+
+WORD = re.compile(r"\w+")
+
+def bigrams(text: Optional[str]) -> Optional[str]:
+    """단어마다 겹치는 2글자 조각으로 나눈 텍스트 ("비트코인" -> "비트 트코 코인", 1글자 단어는 그대로)"""
+    if text is None:
+        return None
+    grams = []
+    for word in WORD.findall(text.lower()):
+        grams.extend(word[i:i + 2] for i in range(max(1, len(word) - 1)))
+    return " ".join(grams)
+
+# 뉴스 보관소 처리 클래스
+class NewsArchive:
+    """크롤링한 기사 보관 + 전문 검색 (SQLite FTS5)
+
+    메서드는 모두 동기 함수이므로 봇에서는 asyncio.to_thread로 호출합니다.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.create_function("bigrams", 1, bigrams, deterministic=True)
+        has_bigram = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'articles_bigram'"
+        ).fetchone()
+        self.conn.executescript(SCHEMA)
+        if not has_bigram:
+            # 2글자 색인이 없던 보관소는 기존 기사로 한 번 채움
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO articles_bigram(rowid, title, summary) "
+                    "SELECT id, bigrams(title), bigrams(summary) FROM articles"
+                )
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def add_many(self, rows: List[Dict]) -> int:
+        """한 번의 크롤링 결과를 한 트랜잭션으로 저장 (이미 있는 기사는 순위/시각만 갱신)"""
+        now = time.time()
+        with self.lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                """
+                INSERT INTO articles (key, title, url, press, summary, best_rank, first_seen, last_seen)
+                VALUES (:key, :title, :url, :press, :summary, :rank, :now, :now)
+                ON CONFLICT(key) DO UPDATE SET
+                    last_seen = excluded.last_seen,
+                    best_rank = MIN(COALESCE(best_rank, excluded.best_rank), COALESCE(excluded.best_rank, best_rank))
+                """,
+                [{"summary": None, "rank": None, "press": None, **row, "now": now} for row in rows]
+            )
+            return self.conn.total_changes - before
+
+    def set_summaries(self, summaries: Dict[str, str]):
+        """기사 키 -> 요약 일괄 저장 (요약은 목록보다 늦게 만들어짐)"""
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "UPDATE articles SET summary = ? WHERE key = ? AND summary IS NOT ?",
+                [(summary, key, summary) for key, summary in summaries.items() if summary]
+            )
+
+    def count(self) -> int:
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """제목/요약 검색 (모든 검색어 포함, 관련도 순)
+
+        3글자 이상 검색어는 trigram 색인, 2글자 검색어는 2글자 색인에서 찾고 두 bm25 점수를 합해 정렬합니다.
+        1글자 검색어나 문자/숫자가 없는 검색어는 색인으로 찾을 수 없어 조건으로만 거릅니다 (대소문자 무시).
+        """
+        terms = [term for term in query.split() if term]
+        if not terms:
+            return []
+
+        joins = []
+        conditions = []
+        params: List = []
+        ranks = []
+        # 각 검색어를 따옴표로 감싸 FTS 문법 문자로 해석되지 않게 함
+        indexed = [term for term in terms if len(term) >= 3]
+        if indexed:
+            joins.append("JOIN articles_fts ON articles_fts.rowid = a.id")
+            conditions.append("articles_fts MATCH ?")
+            params.append(" ".join('"' + term.replace('"', '""') + '"' for term in indexed))
+            # 제목 일치에 가중치
+            ranks.append("bm25(articles_fts, 5.0, 1.0)")
+        paired = []
+        scanned = []
+        for term in terms:
+            if len(term) >= 3:
+                continue
+            gram = bigrams(term) if len(term) == 2 else ""
+            # 1글자이거나 문자/숫자가 없는 검색어("--" 등)는 색인에 없으므로 조건으로만 거름
+            (paired if gram else scanned).append(gram or term)
+        if paired:
+            joins.append("JOIN articles_bigram ON articles_bigram.rowid = a.id")
+            conditions.append("articles_bigram MATCH ?")
+            params.append(" ".join('"' + gram + '"' for gram in paired))
+            ranks.append("bm25(articles_bigram, 5.0, 1.0)")
+        for term in scanned:
+            conditions.append("instr(lower(a.title || ' ' || COALESCE(a.summary, '')), ?) > 0")
+            params.append(term.lower())
+        if not conditions:
+            return []
+
+        sql = (
+            "SELECT a.key, a.title, a.url, a.press, a.summary, a.best_rank, a.first_seen "
+            "FROM articles a " + " ".join(joins)
+            + " WHERE " + " AND ".join(conditions)
+            # 같은 점수면 최신 기사 우선
+            + " ORDER BY " + (" + ".join(ranks) + ", " if ranks else "") + "a.first_seen DESC LIMIT ?"
+        )
+        params.append(limit)
+
+        columns = ("key", "title", "url", "press", "summary", "best_rank", "first_seen")
+        with self.lock:
+            return [dict(zip(columns, row)) for row in self.conn.execute(sql, params)]
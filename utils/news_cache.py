@@ -0,0 +1,76 @@
+import hashlib
+import time
+from typing import Any, Dict, Optional
+
+class CachedPage:
+    def __init__(self, items: Any, etag: Optional[str], last_modified: Optional[str], content_hash: str):
+        self.items = items
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.checked_at = time.monotonic()
+
+def content_hash(body: bytes) -> str:
+    """응답 본문 해시 (ETag/Last-Modified를 주지 않는 서버용)"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+# 뉴스 페이지 캐시 처리 클래스
+class PageCache:
+    """URL별 HTTP 검증자(ETag/Last-Modified, 본문 해시)와 파싱 결과 캐시"""
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._pages: Dict[str, CachedPage] = {}
+        self.hits = 0  # TTL 이내라 요청 없이 응답
+        self.not_modified = 0  # 304 또는 본문 해시가 같아 파싱 생략
+        self.parses = 0
+        self.stale_served = 0  # 갱신을 기다리지 않고 이전 결과로 응답
+
+    def age(self, url: str) -> Optional[float]:
+        """마지막으로 확인한 뒤 지난 시간(초) (결과가 없으면 None)"""
+        page = self._pages.get(url)
+        return time.monotonic() - page.checked_at if page else None
+
+    def last_good(self, url: str) -> Optional[Any]:
+        """TTL과 관계없이 마지막으로 받은 파싱 결과 (갱신 실패/지연 시 사용)"""
+        page = self._pages.get(url)
+        if page is None:
+            return None
+        self.stale_served += 1
+        return page.items
+
+    def fresh(self, url: str) -> Optional[Any]:
+        """TTL 이내의 파싱 결과 (없으면 None)"""
+        page = self._pages.get(url)
+        if page and time.monotonic() - page.checked_at < self.ttl:
+            self.hits += 1
+            return page.items
+        return None
+
+    def peek(self, url: str) -> Optional[Any]:
+        """요청/통계 없이 마지막 파싱 결과 (없으면 None)"""
+        page = self._pages.get(url)
+        return page.items if page else None
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """조건부 요청 헤더"""
+        page = self._pages.get(url)
+        headers = {}
+        if page and page.etag:
+            headers["If-None-Match"] = page.etag
+        if page and page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+        return headers
+
+    def revalidated(self, url: str, body_hash: Optional[str] = None) -> Optional[Any]:
+        """304를 받았거나 본문 해시가 같으면 TTL을 갱신하고 이전 결과 반환"""
+        page = self._pages.get(url)
+        if page is None or (body_hash is not None and body_hash != page.content_hash):
+            return None
+        page.checked_at = time.monotonic()
+        self.not_modified += 1
+        return page.items
+
+    def store(self, url: str, items: Any, etag: Optional[str], last_modified: Optional[str], body_hash: str):
+        self.parses += 1
+        self._pages[url] = CachedPage(items, etag, last_modified, body_hash)
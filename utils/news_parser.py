@@ -0,0 +1,208 @@
+"""네이버 언론사 랭킹 페이지 파서
+
+백엔드(bs4 / lxml / selectolax)를 바꿔 끼울 수 있고, 모두 (순위, 제목, URL) 튜플 목록을 반환합니다.
+결과가 단순 튜플이라 스레드/프로세스 풀 어디서 실행해도 됩니다.
+"""
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Tuple
+
+RankedItem = Tuple[str, str, str]  # (순위, 제목, URL)
+
+RANKING_LIST_CLASS = "press_ranking_list"
+_LIST_OPEN = re.compile(r"<ul\b[^>]*\bclass=[\"'][^\"']*\bpress_ranking_list\b", re.IGNORECASE)
+
+_LIST_CLOSE = re.compile(r"</ul\s*>", re.IGNORECASE)
+
+def extract_ranking_block(html: str) -> str:
+    """랭킹 목록(<ul class="press_ranking_list">...</ul>) 부분만 잘라 이어 붙임 (못 찾으면 전체)
+
+    목록 안에는 ul이 중첩되지 않으므로 각 목록은 다음 </ul>까지입니다.
+    순위가 여러 목록으로 나뉜 페이지도 있어 모든 목록을 모읍니다.
+    """
+    blocks = []
+    position = 0
+    while True:
+        match = _LIST_OPEN.search(html, position)
+        if not match:
+            break
+        end = _LIST_CLOSE.search(html, match.end())
+        if not end:
+            blocks.append(html[match.start():])
+            break
+        blocks.append(html[match.start():end.end()])
+        position = end.end()
+    return "".join(blocks) if blocks else html
+
+def parse_bs4(html: str, limit: int = 10) -> List[RankedItem]:
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # 잘라내기에 실패해도 랭킹 목록 하위 트리만 만들도록 SoupStrainer 사용
+    only_list = SoupStrainer("ul", class_=RANKING_LIST_CLASS)
+    soup = BeautifulSoup(extract_ranking_block(html), "html.parser", parse_only=only_list)
+    items = []
+    for article in soup.select(f"ul.{RANKING_LIST_CLASS} > li.as_thumb")[:limit]:
+        items.append((
+            article.select_one("em.list_ranking_num").text.strip(),
+            article.select_one("strong.list_title").text.strip(),
+            article.select_one("a._es_pc_link")["href"],
+        ))
+    return items
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+def parse_lxml(html: str, limit: int = 10) -> List[RankedItem]:
+    import lxml.html
+
+    root = lxml.html.fromstring(extract_ranking_block(html))
+    items = []
+    for article in root.xpath(f"//ul[{_has_class(RANKING_LIST_CLASS)}]/li[{_has_class('as_thumb')}]")[:limit]:
+        items.append((
+            article.xpath(f"string(.//em[{_has_class('list_ranking_num')}])").strip(),
+            article.xpath(f"string(.//strong[{_has_class('list_title')}])").strip(),
+            article.xpath(f".//a[{_has_class('_es_pc_link')}]/@href")[0],
+        ))
+    return items
+
+def parse_selectolax(html: str, limit: int = 10) -> List[RankedItem]:
+    from selectolax.parser import HTMLParser
+
+    tree = HTMLParser(extract_ranking_block(html))
+    items = []
+    for article in tree.css(f"ul.{RANKING_LIST_CLASS} > li.as_thumb")[:limit]:
+        items.append((
+            article.css_first("em.list_ranking_num").text().strip(),
+            article.css_first("strong.list_title").text().strip(),
+            article.css_first("a._es_pc_link").attributes["href"],
+        ))
+    return items
+
+PARSERS: Dict[str, Callable[[str, int], List[RankedItem]]] = {
+    "bs4": parse_bs4,
+    "lxml": parse_lxml,
+    "selectolax": parse_selectolax,
+}
+
+def available_parsers() -> List[str]:
+    """설치된 라이브러리 기준으로 쓸 수 있는 백엔드 (빠른 순)"""
+    names = []
+    for name, module in (("selectolax", "selectolax.parser"), ("lxml", "lxml.html"), ("bs4", "bs4")):
+        try:
+            __import__(module)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+def get_parser(name: str = "auto") -> Tuple[str, Callable[[str, int], List[RankedItem]]]:
+    """이름으로 파서 선택 ("auto"면 설치된 것 중 가장 빠른 것, 없는 백엔드면 bs4)"""
+    available = available_parsers()
+    if name == "auto" or name not in available:
+        name = available[0] if available else "bs4"
+    return name, PARSERS[name]
+
+# 점진 파서 처리 클래스
+class RankingStreamParser(HTMLParser):
+    """청크 단위로 받은 HTML에서 랭킹 목록만 읽는 점진 파서
+
+    목록 시작/끝 태그는 정규식으로 찾고, 목록 안쪽만 HTMLParser에 넘깁니다.
+    순위가 여러 목록으로 나뉠 수 있으므로 limit개를 다 읽기 전까지는 목록이 끝나도 다음 목록을 찾습니다.
+    limit개를 다 읽으면 done이 True가 되어 나머지 다운로드를 중단할 수 있습니다.
+    """
+
+    def __init__(self, limit: int = 10):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.items: List[RankedItem] = []
+        self.done = False
+        self.block: List[str] = []  # 파서에 넘긴 목록 원문 (변경 감지용 해시에 사용)
+        self._buffer = ""  # 아직 파서에 넘기지 않은 입력
+        self._in_list = False
+        self._fed = 0  # 파서에 넘긴 글자 수
+        self._line_starts = [0]  # getpos()의 줄 번호 -> 넘긴 원문 기준 위치
+        self._end = None  # limit번째 기사의 </li> 끝 위치
+        self._current = None
+        self._field = None
+
+    def feed_chunk(self, text: str):
+        if self.done:
+            return
+        self._buffer += text
+        while not self.done:
+            if not self._in_list:
+                match = _LIST_OPEN.search(self._buffer)
+                if not match:
+                    # 시작 태그가 청크 경계에 걸칠 수 있으므로 끝부분만 남김
+                    self._buffer = self._buffer[-1024:]
+                    return
+                self._in_list = True
+                self._buffer = self._buffer[match.start():]
+            end = _LIST_CLOSE.search(self._buffer)
+            if not end:
+                # 닫는 태그가 청크 경계에 걸칠 수 있으므로 몇 글자는 다음 청크와 함께 처리
+                safe = max(0, len(self._buffer) - 8)
+                self._emit(self._buffer[:safe])
+                self._buffer = self._buffer[safe:]
+                return
+            self._emit(self._buffer[:end.end()])
+            self._buffer = self._buffer[end.end():]
+            self._in_list = False
+
+    def _emit(self, text: str):
+        if not text:
+            return
+        for newline in re.finditer("\n", text):
+            self._line_starts.append(self._fed + newline.end())
+        self._fed += len(text)
+        self.block.append(text)
+        self.feed(text)
+
+    def ranking_block(self) -> str:
+        """읽은 목록 원문 (limit개를 다 읽었으면 마지막 기사까지만, 청크 경계와 무관)"""
+        text = "".join(self.block)
+        return text[:self._end] if self._end is not None else text
+
+    def _position(self) -> int:
+        line, column = self.getpos()
+        return self._line_starts[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        # limit개를 읽은 뒤 같은 청크에 남은 목록 내용은 무시
+        if self.done:
+            return
+        classes = (dict(attrs).get("class") or "").split()
+        if tag == "li" and "as_thumb" in classes:
+            self._current = {"rank": "", "title": "", "url": None}
+        elif self._current is None:
+            return
+        elif tag == "a" and "_es_pc_link" in classes:
+            self._current["url"] = dict(attrs).get("href")
+        elif tag == "em" and "list_ranking_num" in classes:
+            self._field = "rank"
+        elif tag == "strong" and "list_title" in classes:
+            self._field = "title"
+
+    def handle_data(self, data):
+        if self._current is not None and self._field:
+            self._current[self._field] += data
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        if tag in ("em", "strong"):
+            self._field = None
+        elif tag == "li" and self._current is not None:
+            item = self._current
+            self._current = None
+            if item["url"] and item["title"].strip():
+                self.items.append((item["rank"].strip(), item["title"].strip(), item["url"]))
+            if len(self.items) >= self.limit:
+                self.done = True
+                # getpos()는 </li>의 시작 위치
+                start = self._position()
+                self._end = "".join(self.block).index(">", start) + 1
+        elif tag == "ul":
+            # 목록이 끝나면 열려 있던 항목 정리 (다음 목록은 feed_chunk에서 찾음)
+            self._current = None
+            self._field = None
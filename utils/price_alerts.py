@@ -0,0 +1,118 @@
+import json
+import os
+import time
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Tuple
+
+class PriceAlert:
+    def __init__(self, alert_id: int, user_id: int, market: str, price: float,
+                 channel_id: Optional[int] = None, dm: bool = True,
+                 created_at: float = None, last_fired: float = 0.0):
+        self.alert_id = alert_id
+        self.user_id = user_id
+        self.market = market
+        self.price = price
+        self.channel_id = channel_id
+        self.dm = dm
+        self.created_at = created_at or time.time()
+        self.last_fired = last_fired
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PriceAlert":
+        return cls(**data)
+
+# 가격 알림 인덱스 처리 클래스
+class PriceAlertIndex:
+    """마켓별 목표가 정렬 인덱스 (틱당 O(log n + 발동 수))"""
+
+    def __init__(self, path: str, cooldown: float = 300.0):
+        self.path = path
+        self.cooldown = cooldown
+        self.alerts: Dict[int, PriceAlert] = {}
+        self._index: Dict[str, List[Tuple[float, int]]] = {}
+        self.last_price: Dict[str, float] = {}
+        self.next_id = 1
+        self.load()
+
+    def load(self):
+        """저장된 알림 불러오기"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        for item in data.get("alerts", []):
+            self._insert(PriceAlert.from_dict(item))
+        self.next_id = data.get("next_id", len(self.alerts) + 1)
+
+    def save(self):
+        """알림 목록 저장 (임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "next_id": self.next_id,
+                "alerts": [alert.to_dict() for alert in self.alerts.values()],
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def markets(self) -> List[str]:
+        """알림이 걸린 마켓 목록"""
+        return list(self._index)
+
+    def user_alerts(self, user_id: int) -> List[PriceAlert]:
+        return [alert for alert in self.alerts.values() if alert.user_id == user_id]
+
+    def add(self, user_id: int, market: str, price: float,
+            channel_id: Optional[int] = None, dm: bool = True) -> PriceAlert:
+        alert = PriceAlert(self.next_id, user_id, market, price, channel_id, dm)
+        self.next_id += 1
+        self._insert(alert)
+        self.save()
+        return alert
+
+    def remove(self, alert_id: int, user_id: Optional[int] = None) -> bool:
+        """알림 삭제 (user_id를 주면 본인 알림만 삭제)"""
+        alert = self.alerts.get(alert_id)
+        if not alert or (user_id is not None and alert.user_id != user_id):
+            return False
+        del self.alerts[alert_id]
+        index = self._index[alert.market]
+        del index[bisect_left(index, (alert.price, alert_id))]
+        if not index:
+            del self._index[alert.market]
+        self.save()
+        return True
+
+    def _insert(self, alert: PriceAlert):
+        self.alerts[alert.alert_id] = alert
+        insort(self._index.setdefault(alert.market, []), (alert.price, alert.alert_id))
+
+    def evaluate(self, market: str, price: float) -> List[Tuple[PriceAlert, bool]]:
+        """직전 가격과 현재 가격 사이를 지나간 목표가 알림 반환 [(알림, 상승 여부)]"""
+        prev = self.last_price.get(market)
+        self.last_price[market] = price
+        index = self._index.get(market)
+        if prev is None or not index or prev == price:
+            return []
+
+        rising = price > prev
+        if rising:
+            # prev < 목표가 <= price
+            lo, hi = bisect_right(index, (prev, float("inf"))), bisect_right(index, (price, float("inf")))
+        else:
+            # price <= 목표가 < prev
+            lo, hi = bisect_left(index, (price, 0)), bisect_left(index, (prev, 0))
+
+        now = time.time()
+        fired = []
+        for _, alert_id in index[lo:hi]:
+            alert = self.alerts[alert_id]
+            # 목표가 근처에서 오르내릴 때 반복 알림 방지
+            if now - alert.last_fired < self.cooldown:
+                continue
+            alert.last_fired = now
+            fired.append((alert, rising))
+        return fired
@@ -0,0 +1,93 @@
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# 단기 시세 기록 처리 클래스
+class PriceHistory:
+    """(마켓 x 시간 슬롯) 고정 크기 배열 링 버퍼"""
+
+    def __init__(self, capacity: int, initial_markets: int = 256):
+        self.capacity = capacity
+        self.markets: List[str] = []
+        self.market_index: Dict[str, int] = {}
+        self.prices = np.full((initial_markets, capacity), np.nan)
+        # 누적 거래대금(UTC 0시 기준)을 기록해 두고 구간 거래대금은 차이로 계산
+        self.values = np.full((initial_markets, capacity), np.nan)
+        self.times = np.full(capacity, np.nan)
+        self.head = 0  # 다음에 기록할 슬롯
+        self.count = 0
+
+    def _row(self, market: str) -> int:
+        row = self.market_index.get(market)
+        if row is None:
+            row = len(self.markets)
+            if row >= self.prices.shape[0]:
+                # 행이 모자라면 두 배로 늘림 (신규 상장 시에만 발생)
+                extra = np.full(self.prices.shape, np.nan)
+                self.prices = np.vstack([self.prices, extra])
+                self.values = np.vstack([self.values, extra.copy()])
+            self.markets.append(market)
+            self.market_index[market] = row
+        return row
+
+    def record(self, tickers: List[Dict], now: Optional[float] = None):
+        """시세 스냅샷 하나를 새 슬롯에 기록 (가장 오래된 슬롯을 덮어씀)"""
+        now = time.time() if now is None else now
+        rows = np.array([self._row(ticker["market"]) for ticker in tickers], dtype=np.intp)
+        slot = self.head
+        self.prices[:, slot] = np.nan
+        self.values[:, slot] = np.nan
+        self.prices[rows, slot] = [ticker["trade_price"] for ticker in tickers]
+        self.values[rows, slot] = [ticker.get("acc_trade_price", np.nan) for ticker in tickers]
+        self.times[slot] = now
+        self.head = (slot + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def _slot_before(self, timestamp: float) -> Optional[int]:
+        """timestamp 이전의 가장 최근 슬롯"""
+        if self.count == 0:
+            return None
+        start = (self.head - self.count) % self.capacity
+        order = (start + np.arange(self.count)) % self.capacity
+        pos = int(np.searchsorted(self.times[order], timestamp, side="right")) - 1
+        return int(order[pos]) if pos >= 0 else None
+
+    def changes(self, window: float, now: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, float]:
+        """모든 마켓의 window초 동안 변동률과 구간 거래대금 (O(마켓 수))
+
+        기록이 window보다 짧으면 가장 오래된 슬롯과 비교하고 실제 비교 구간(초)을 함께 반환합니다.
+        """
+        n = len(self.markets)
+        if self.count < 2:
+            return np.full(n, np.nan), np.full(n, np.nan), 0.0
+        latest = (self.head - 1) % self.capacity
+        now = self.times[latest] if now is None else now
+        past = self._slot_before(now - window)
+        if past is None:
+            past = (self.head - self.count) % self.capacity
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = self.prices[:n, latest] / self.prices[:n, past] - 1
+            traded = self.values[:n, latest] - self.values[:n, past]
+        # 누적 거래대금이 0시에 초기화되면 음수가 되므로 제외
+        traded = np.where(traded >= 0, traded, np.nan)
+        return change, traded, float(self.times[latest] - self.times[past])
+
+    def movers(self, window: float, n: int = 5) -> Tuple[List[Tuple[str, float]], List[Tuple[str, float]], float]:
+        """window초 동안 상승/하락 상위 n개 [(마켓, 변동률)]"""
+        change, _, span = self.changes(window)
+        valid = np.flatnonzero(~np.isnan(change))
+        if len(valid) == 0:
+            return [], [], span
+        k = min(n, len(valid))
+        values = change[valid]
+        # 전체 정렬 대신 argpartition으로 상하위 k개만 골라 정렬
+        top = valid[np.argpartition(-values, k - 1)[:k]]
+        bottom = valid[np.argpartition(values, k - 1)[:k]]
+        top = top[np.argsort(-change[top])]
+        bottom = bottom[np.argsort(change[bottom])]
+        return (
+            [(self.markets[i], float(change[i])) for i in top],
+            [(self.markets[i], float(change[i])) for i in bottom],
+            span,
+        )
@@ -0,0 +1,135 @@
+import asyncio
+import time
+from typing import Dict, Optional
+
+class RateLimitExceeded(Exception):
+    """대기 한도를 넘어 요청을 보내지 않고 버린 경우"""
+
+# 초가 바뀐 직후에 보낸 요청이 서버에서 이전 초로 세지지 않도록 두는 여유(초)
+WINDOW_MARGIN = 0.01
+
+class SecondWindow:
+    """업비트처럼 벽시계 1초 단위로 요청 수를 세는 창 (초마다 rate개)
+
+    요청은 보낼 초에 배정하고, 그 초가 다 찼으면 다음 초로 미룹니다.
+    초가 바뀔 때 아직 응답을 받지 못한 요청은 서버에서 새 초로 셀 수 있으므로 새 초에 이미 쓴 것으로 봅니다.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.second = int(time.time())  # 마지막으로 요청을 배정한 초
+        self.used = 0  # self.second에 배정한 요청 수
+        self.capacity = rate  # self.second에 보낼 수 있는 요청 수 (Remaining-Req로 줄어듦)
+        self.inflight = 0  # 보냈지만 응답을 받지 않은 요청 수
+
+    def _advance(self, now: float):
+        if int(now) > self.second:
+            self.second = int(now)
+            self.used = self.inflight
+            self.capacity = self.rate
+
+    def reserve(self) -> float:
+        """요청 하나를 배정하고 기다려야 할 시간(초) 반환"""
+        now = time.time()
+        self._advance(now)
+        while self.used >= self.capacity:
+            # 지금 초의 마지막 요청들이 서버에는 다음 초에 도착할 수도 있음
+            carry = self.inflight if self.second == int(now) else 0
+            self.second += 1
+            self.used = carry
+            self.capacity = self.rate
+        self.used += 1
+        if self.second == int(now):
+            return 0.0
+        return self.second - now + WINDOW_MARGIN
+
+    def release(self):
+        """사용하지 않은 예약 반환"""
+        self.used = max(0, self.used - 1)
+
+    def start(self):
+        self.inflight += 1
+
+    def finish(self):
+        self.inflight = max(0, self.inflight - 1)
+
+    def limit_remaining(self, remaining: int):
+        """서버가 알려준 남은 요청 수보다 많이 보내지 않도록, 이번 초가 끝날 때까지 보정
+
+        응답을 기다리는 다른 요청은 서버에서 아직 세지 않았을 수 있으므로 남은 수에서 뺍니다.
+        """
+        now = time.time()
+        self._advance(now)
+        if self.second != int(now):
+            return  # 이미 다음 초로 미룬 요청이 있으면 지금 초는 다 쓴 상태
+        others = max(0, self.inflight - 1)
+        self.capacity = min(self.capacity, self.used + remaining - others)
+
+    def exhaust(self):
+        """이번 초에는 더 보내지 않음"""
+        now = time.time()
+        self._advance(now)
+        if self.second == int(now):
+            self.capacity = min(self.capacity, self.used)
+
+# 업비트 요청 수 제한 처리 클래스
+class UpbitRateLimiter:
+    """Remaining-Req 헤더를 반영하는 그룹별 초당 요청 수 제한
+
+    acquire로 보낼 차례를 기다리고, 응답을 받으면 update, 요청이 끝나면(실패 포함) finish를 호출합니다.
+    """
+
+    def __init__(self, rate: float = 10, max_wait: float = 2.0):
+        self.rate = rate
+        self.max_wait = max_wait
+        self.windows: Dict[str, SecondWindow] = {}
+        self.stats = {
+            "requests": 0,
+            "delayed": 0,
+            "shed": 0,
+            "throttled": 0,
+            "wait_seconds": 0.0,
+        }
+
+    def _window(self, group: str) -> SecondWindow:
+        if group not in self.windows:
+            self.windows[group] = SecondWindow(self.rate)
+        return self.windows[group]
+
+    async def acquire(self, group: str = "default"):
+        """요청 전 호출, 대기 시간이 max_wait를 넘으면 RateLimitExceeded"""
+        window = self._window(group)
+        wait = window.reserve()
+        if wait > self.max_wait:
+            window.release()
+            self.stats["shed"] += 1
+            raise RateLimitExceeded(f"요청이 많아 잠시 후 다시 시도해주세요. ({group})")
+
+        self.stats["requests"] += 1
+        if wait > 0:
+            self.stats["delayed"] += 1
+            self.stats["wait_seconds"] += wait
+            await asyncio.sleep(wait)
+        window.start()
+
+    def finish(self, group: str = "default"):
+        """acquire 뒤 보낸 요청이 끝나면 호출 (응답을 못 받은 경우 포함)"""
+        self._window(group).finish()
+
+    def update(self, group: str, remaining_req: Optional[str], status: int):
+        """응답의 Remaining-Req 헤더와 상태 코드로 이번 초의 남은 요청 수 보정"""
+        window = self._window(group)
+        if status == 429:
+            # 이번 초에는 새 요청을 보내지 않음
+            self.stats["throttled"] += 1
+            window.exhaust()
+            return
+
+        if not remaining_req:
+            return
+        # 예: "group=default; min=1800; sec=29"
+        fields = dict(
+            part.strip().split("=", 1) for part in remaining_req.split(";") if "=" in part
+        )
+        if "sec" in fields:
+            window.limit_remaining(int(fields["sec"]))
@@ -0,0 +1,74 @@
+import asyncio
+import random
+import time
+from typing import Optional
+
+import aiohttp
+
+class CircuitOpenError(Exception):
+    """연속 실패로 차단기가 열려 요청을 보내지 않은 경우"""
+
+# 재시도 정책 처리 클래스
+class RetryPolicy:
+    """요청당 제한 시간 + 지수 백오프 재시도 (full jitter)"""
+
+    def __init__(self, attempts: int = 3, timeout: float = 5.0, base_delay: float = 0.5, max_delay: float = 8.0):
+        self.attempts = max(1, attempts)
+        self.timeout = timeout
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째(0부터) 실패 뒤 기다릴 시간 (여러 요청이 동시에 다시 몰리지 않도록 무작위)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    @staticmethod
+    def retryable(error: Exception) -> bool:
+        """시간 초과/연결 오류/5xx/429만 재시도 (그 외 4xx는 다시 보내도 같음)"""
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status >= 500 or error.status == 429
+        return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientError))
+
+# 서킷 브레이커 처리 클래스
+class CircuitBreaker:
+    """연속 failure_threshold번 실패하면 reset_timeout 동안 요청 차단
+
+    차단 시간이 지나면 요청 하나를 시험 삼아 보내고(half-open), 성공하면 닫고 실패하면 다시 엽니다.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def retry_after(self) -> float:
+        """요청을 다시 보낼 수 있을 때까지 남은 시간(초)"""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "half_open":
+            # 시험 요청은 차단 시간마다 하나만 보내도록 시각을 다시 잡음
+            self.opened_at = time.monotonic()
+            return True
+        return state == "closed"
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
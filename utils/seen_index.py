@@ -0,0 +1,67 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List
+
+# 전송한 기사 기록 처리 클래스
+class SeenIndex:
+    """채널별로 이미 보낸 기사 키 (JSON 파일 저장, 보관 기간/개수 제한)
+
+    키는 처음 본 순서대로 저장되므로 오래된 것부터 앞에서 잘라내면 됩니다.
+    """
+
+    def __init__(self, path: str, ttl: float = 3 * 86400, max_per_channel: int = 500):
+        self.path = path
+        self.ttl = ttl
+        self.max_per_channel = max_per_channel
+        self.channels: Dict[str, "OrderedDict[str, float]"] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            for channel_id, entries in data.items():
+                self.channels[channel_id] = OrderedDict((key, seen_at) for key, seen_at in entries)
+
+    def save(self):
+        self.evict()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                channel_id: list(entries.items()) for channel_id, entries in self.channels.items()
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def subscribe(self, channel_id: int):
+        self.channels.setdefault(str(channel_id), OrderedDict())
+        self.save()
+
+    def unsubscribe(self, channel_id: int):
+        self.channels.pop(str(channel_id), None)
+        self.save()
+
+    def channel_ids(self) -> List[int]:
+        return [int(channel_id) for channel_id in self.channels]
+
+    def unseen(self, channel_id: int, keys: Iterable[str]) -> List[str]:
+        """아직 보내지 않은 키만 반환 (입력 순서 유지)"""
+        entries = self.channels.get(str(channel_id), {})
+        return [key for key in keys if key not in entries]
+
+    def mark(self, channel_id: int, keys: Iterable[str], now: float = None):
+        """보낸 키 기록 (저장은 save에서)"""
+        now = time.time() if now is None else now
+        entries = self.channels.setdefault(str(channel_id), OrderedDict())
+        for key in keys:
+            entries[key] = now
+            entries.move_to_end(key)
+
+    def evict(self, now: float = None):
+        """보관 기간이 지났거나 개수를 넘은 오래된 키 삭제"""
+        now = time.time() if now is None else now
+        for entries in self.channels.values():
+            while entries:
+                key, seen_at = next(iter(entries.items()))
+                if now - seen_at <= self.ttl and len(entries) <= self.max_per_channel:
+                    break
+                entries.popitem(last=False)
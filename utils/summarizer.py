@@ -0,0 +1,115 @@
+"""기사 본문 추출 + 추출 요약 (외부 API 없이 문장 점수로 상위 문장 선택)
+
+프로세스 풀에서 실행하도록 모듈 함수로만 구성합니다.
+"""
+import math
+import re
+from collections import Counter
+from html import unescape
+from html.parser import HTMLParser
+from typing import List
+
+# 네이버 뉴스 기사 본문 영역 (<article id="dic_area">)
+_BODY_OPEN = re.compile(r"<(article|div)\b[^>]*\bid=[\"'](dic_area|articleBodyContents|newsct_article)[\"']", re.IGNORECASE)
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_TOKEN = re.compile(r"[가-힣A-Za-z0-9]{2,}")
+# 토큰 끝에 붙은 조사를 떼어 같은 단어로 셈
+_JOSA = ("에서", "으로", "에게", "까지", "부터", "은", "는", "이", "가", "을", "를", "의", "에", "로", "과", "와", "도", "만")
+
+class _TextExtractor(HTMLParser):
+    """태그를 지우고 본문 텍스트만 모음 (script/style, 사진 설명 제외)"""
+
+    SKIP = {"script", "style", "noscript", "figcaption"}
+    VOID = {"br", "img", "hr", "input", "meta", "link", "source", "wbr"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID:
+            if tag == "br" and not self.skip_depth:
+                self.parts.append("\n")
+        elif tag in self.SKIP or self.skip_depth:
+            self.skip_depth += 1
+        elif tag == "em" and "img_desc" in (dict(attrs).get("class") or ""):
+            self.skip_depth += 1
+        elif tag in ("p", "div"):
+            self.parts.append("\n")
+
+    def handle_startendtag(self, tag, attrs):
+        # <br/>처럼 스스로 닫는 태그는 깊이를 바꾸지 않음
+        if tag == "br" and not self.skip_depth:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag not in self.VOID and self.skip_depth:
+            self.skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+def extract_article_text(html: str) -> str:
+    """기사 본문 텍스트 (본문 영역을 못 찾으면 페이지 전체)"""
+    match = _BODY_OPEN.search(html)
+    if match:
+        end = html.find(f"</{match.group(1)}>", match.end())
+        html = html[match.start():end if end != -1 else len(html)]
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    text = unescape("".join(extractor.parts))
+    return re.sub(r"[ \t\r\f\v]+", " ", text).strip()
+
+def _tokens(sentence: str) -> List[str]:
+    tokens = []
+    for token in _TOKEN.findall(sentence.lower()):
+        for josa in _JOSA:
+            if token.endswith(josa) and len(token) > len(josa) + 1:
+                token = token[:-len(josa)]
+                break
+        tokens.append(token)
+    return tokens
+
+def split_sentences(text: str) -> List[str]:
+    sentences = {}
+    for line in text.split("\n"):
+        for sentence in _SENTENCE_SPLIT.split(line.strip()):
+            sentence = sentence.strip()
+            # 너무 짧은 문장과 기자 이메일/저작권 문구는 제외
+            if len(sentence) < 15 or "@" in sentence or "무단" in sentence:
+                continue
+            # 같은 문장이 반복되면 한 번만 (순서 유지)
+            sentences.setdefault(sentence, None)
+    return list(sentences)
+
+def summarize_text(text: str, sentences: int = 2, max_length: int = 200) -> str:
+    """단어 빈도 기반 문장 점수로 상위 문장을 골라 원래 순서대로 연결"""
+    candidates = split_sentences(text)
+    if not candidates:
+        return ""
+    tokenized = [_tokens(sentence) for sentence in candidates]
+    frequency = Counter(token for tokens in tokenized for token in set(tokens))
+    top = max(frequency.values(), default=1)
+
+    scores = []
+    for index, tokens in enumerate(tokenized):
+        if not tokens:
+            scores.append(0.0)
+            continue
+        score = sum(frequency[token] / top for token in set(tokens)) / math.sqrt(len(tokens))
+        # 기사는 앞 문장에 핵심이 오는 경우가 많으므로 앞쪽 문장 가산점
+        score *= 1.0 + 0.5 / (index + 1)
+        scores.append(score)
+
+    chosen = sorted(sorted(range(len(candidates)), key=lambda i: -scores[i])[:sentences])
+    summary = " ".join(candidates[i] for i in chosen)
+    if len(summary) > max_length:
+        summary = summary[:max_length - 1].rstrip() + "…"
+    return summary
+
+def summarize_article(html: str, sentences: int = 2) -> str:
+    """기사 페이지 HTML -> 요약문 (프로세스 풀에서 실행)"""
+    return summarize_text(extract_article_text(html), sentences)
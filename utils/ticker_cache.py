@@ -0,0 +1,76 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+# 시세 스냅샷 캐시 처리 클래스
+class TickerCache:
+    """마켓별 시세 스냅샷 캐시 (짧은 TTL + 동시 요청 병합)"""
+
+    def __init__(self, fetcher: Callable[[List[str]], Awaitable[List[Dict]]], ttl: float = 1.5):
+        self.fetcher = fetcher
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Dict]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.upstream_calls = 0
+
+    def put(self, tickers: List[Dict]):
+        """외부에서 받은 시세를 캐시에 반영"""
+        now = time.monotonic()
+        for ticker in tickers:
+            self._entries[ticker["market"]] = (now, ticker)
+
+    def peek(self, market: str) -> Dict | None:
+        """TTL 이내의 캐시 항목만 반환 (업스트림 요청 없음)"""
+        entry = self._entries.get(market)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    async def get(self, markets: List[str]) -> List[Dict]:
+        """캐시된 시세 반환, 없는 마켓은 한 번의 요청으로 묶어서 조회"""
+        found: Dict[str, Dict] = {}
+        pending: Dict[str, asyncio.Task] = {}
+        missing = []
+
+        for market in dict.fromkeys(markets):
+            ticker = self.peek(market)
+            if ticker is not None:
+                found[market] = ticker
+                self.hits += 1
+            elif market in self._inflight:
+                # 이미 진행 중인 요청이 있으면 그 결과를 공유
+                pending[market] = self._inflight[market]
+                self.hits += 1
+            else:
+                missing.append(market)
+                self.misses += 1
+
+        if missing:
+            task = asyncio.create_task(self._load(missing))
+            for market in missing:
+                self._inflight[market] = task
+                pending[market] = task
+
+        # 호출자가 취소되어도 공유 요청은 계속 진행되도록 shield 처리
+        for task in set(pending.values()):
+            loaded = await asyncio.shield(task)
+            for market, t in pending.items():
+                if t is task and market in loaded:
+                    found[market] = loaded[market]
+
+        return [found[market] for market in markets if market in found]
+
+    async def _load(self, markets: List[str]) -> Dict[str, Dict]:
+        """업스트림 조회 후 캐시 갱신"""
+        try:
+            self.upstream_calls += 1
+            data = await self.fetcher(markets)
+            self.put(data)
+            return {ticker["market"]: ticker for ticker in data}
+        finally:
+            current = asyncio.current_task()
+            for market in markets:
+                if self._inflight.get(market) is current:
+                    del self._inflight[market]
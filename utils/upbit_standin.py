@@ -0,0 +1,204 @@
+"""오프라인 테스트용 업비트 대체 서버
+
+REST(/v1/market/all, /v1/ticker, /v1/ticker/all, /v1/candles/*)와 웹소켓(/websocket/v1)을 흉내 냅니다.
+REST 응답에는 그룹별 초당 요청 수 제한과 Remaining-Req 헤더가 적용됩니다.
+
+    python -m utils.upbit_standin --port 8765
+    UPBIT_API_URL=http://127.0.0.1:8765/v1 UPBIT_WS_URL=ws://127.0.0.1:8765/websocket/v1 UPBIT_STREAM=1 python bot.py
+"""
+import argparse
+import asyncio
+import json
+import random
+import math
+import time
+from datetime import datetime, timezone
+from aiohttp import web
+
+BASE_MARKETS = {
+    'BTC': '비트코인',
+    'ETH': '이더리움',
+    'XRP': '리플',
+    'SOL': '솔라나',
+    'DOGE': '도지코인',
+    'ADA': '에이다',
+    'USDT': '테더',
+}
+
+class UpbitStandIn:
+    """랜덤 워크 시세를 제공하는 업비트 대체 서버"""
+
+    def __init__(self, extra_markets: int = 200, tick_interval: float = 0.2, seed: int = 42, rate_limit: int = 10):
+        self.rng = random.Random(seed)
+        self.tick_interval = tick_interval
+        self.rate_limit = rate_limit
+        self.request_log = {}  # 그룹 -> (초, 요청 수)
+        self.catalog = []
+        self.tickers = {}
+        self.quote_prices = {}  # 마켓 -> 기준 통화 원화 가격
+
+        names = dict(BASE_MARKETS)
+        for i in range(extra_markets):
+            names[f"C{i:03d}"] = f"테스트코인{i}"
+        for symbol, korean in names.items():
+            price = self.rng.uniform(10, 100_000_000)
+            self._add_market(f"KRW-{symbol}", korean, 1_400 if symbol == "USDT" else price)
+        # 테더 마켓 시세를 원화 시세보다 조금 낮게 맞춰 김치 프리미엄이 0~5% 수준이 되도록 설정
+        for symbol in ("BTC", "ETH", "XRP", "SOL"):
+            krw_price = self.tickers[f"KRW-{symbol}"]["trade_price"]
+            self._add_market(f"USDT-{symbol}", names[symbol],
+                             krw_price / 1_400 / self.rng.uniform(1.0, 1.05), quote_price=1_400)
+        for symbol in ("ETH", "XRP", "SOL"):
+            btc_price = self.tickers["KRW-BTC"]["trade_price"]
+            self._add_market(f"BTC-{symbol}", names[symbol],
+                             self.tickers[f"KRW-{symbol}"]["trade_price"] / btc_price, quote_price=btc_price)
+
+    def _add_market(self, market: str, korean: str, price: float, quote_price: float = 1):
+        """마켓 추가 (거래대금은 quote_price로 나눠 기준 통화 단위로 맞춤)"""
+        self.quote_prices[market] = quote_price
+        self.catalog.append({
+            "market": market,
+            "korean_name": korean,
+            "english_name": market.split("-")[1],
+            "market_warning": "CAUTION" if self.rng.random() < 0.03 else "NONE",
+        })
+        self.tickers[market] = {
+            "market": market,
+            "trade_price": price,
+            "opening_price": price,
+            "prev_closing_price": price,
+            "high_price": price,
+            "low_price": price,
+            "signed_change_rate": 0.0,
+            "signed_change_price": 0.0,
+            "acc_trade_price": self.rng.uniform(1e7, 1e11) / quote_price,
+            "acc_trade_price_24h": self.rng.uniform(1e8, 5e11) / quote_price,
+            "acc_trade_volume_24h": self.rng.uniform(1e3, 1e7),
+            "timestamp": int(time.time() * 1000),
+        }
+
+    def step(self, market: str) -> dict:
+        """한 마켓의 시세를 한 틱 움직임"""
+        t = self.tickers[market]
+        price = max(t["trade_price"] * (1 + self.rng.gauss(0, 0.002)), 1e-8)
+        t["trade_price"] = price
+        t["high_price"] = max(t["high_price"], price)
+        t["low_price"] = min(t["low_price"], price)
+        t["signed_change_price"] = price - t["prev_closing_price"]
+        t["signed_change_rate"] = t["signed_change_price"] / t["prev_closing_price"]
+        traded = self.rng.uniform(0, 1e7) / self.quote_prices[market]
+        t["acc_trade_price"] += traded
+        t["acc_trade_price_24h"] += traded
+        t["timestamp"] = int(time.time() * 1000)
+        return t
+
+    @web.middleware
+    async def rate_limit_middleware(self, request: web.Request, handler):
+        """업비트처럼 그룹별 초당 요청 수를 제한하고 Remaining-Req 헤더 추가"""
+        if request.path.startswith("/websocket"):
+            return await handler(request)
+
+        group = request.path.split("/")[2] if request.path.count("/") >= 2 else "default"
+        second = int(time.time())
+        start, count = self.request_log.get(group, (second, 0))
+        if start != second:
+            start, count = second, 0
+        count += 1
+        self.request_log[group] = (start, count)
+
+        remaining = max(self.rate_limit - count, 0)
+        if count > self.rate_limit:
+            response = web.json_response({"error": {"name": 429, "message": "Too many requests"}}, status=429)
+        else:
+            response = await handler(request)
+        response.headers["Remaining-Req"] = f"group={group}; min=1800; sec={remaining}"
+        return response
+
+    async def market_all(self, request: web.Request) -> web.Response:
+        return web.json_response(self.catalog)
+
+    async def ticker(self, request: web.Request) -> web.Response:
+        markets = request.query.get("markets", "").split(",")
+        if any(m not in self.tickers for m in markets):
+            return web.json_response({"error": {"name": 404, "message": "Code not found"}}, status=404)
+        return web.json_response([self.step(m) for m in markets])
+
+    async def ticker_all(self, request: web.Request) -> web.Response:
+        quotes = request.query.get("quote_currencies", "KRW").split(",")
+        return web.json_response([self.step(m) for m in self.tickers if m.split("-")[0] in quotes])
+
+    async def candles(self, request: web.Request) -> web.Response:
+        """과거 캔들 (같은 시각은 항상 같은 값)"""
+        market = request.query.get("market")
+        if market not in self.tickers:
+            return web.json_response({"error": {"name": 404, "message": "Code not found"}}, status=404)
+        unit = request.match_info.get("unit")
+        step = int(unit) * 60 if unit else 86400
+        count = min(int(request.query.get("count", 1)), 200)
+        to = request.query.get("to")
+        end = int(datetime.fromisoformat(to.replace("Z", "+00:00")).timestamp()) if to else int(time.time())
+        end -= end % step
+
+        base = self.tickers[market]["prev_closing_price"]
+        candles = []
+        for k in range(1, count + 1):
+            ts = end - k * step
+            rng = random.Random(f"{market}:{step}:{ts}")
+            close = base * math.exp(0.05 * math.sin(ts / (step * 37)) + rng.gauss(0, 0.01))
+            open_ = close * math.exp(rng.gauss(0, 0.005))
+            candles.append({
+                "market": market,
+                "candle_date_time_utc": datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"),
+                "opening_price": open_,
+                "high_price": max(open_, close) * (1 + abs(rng.gauss(0, 0.003))),
+                "low_price": min(open_, close) * (1 - abs(rng.gauss(0, 0.003))),
+                "trade_price": close,
+                "timestamp": (ts + step) * 1000,
+                "candle_acc_trade_price": rng.uniform(1e6, 1e9),
+                "candle_acc_trade_volume": rng.uniform(1, 1e4),
+            })
+        return web.json_response(candles)
+
+    async def websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        msg = await ws.receive()
+        codes = []
+        for part in json.loads(msg.data):
+            if part.get("type") == "ticker":
+                codes = [c for c in part.get("codes", []) if c in self.tickers]
+
+        # 처음에는 전체 스냅샷, 이후에는 일부 마켓만 갱신
+        try:
+            for code in codes:
+                await ws.send_bytes(self._ws_message(code, self.tickers[code]))
+            while not ws.closed and codes:
+                for code in self.rng.sample(codes, min(len(codes), 20)):
+                    await ws.send_bytes(self._ws_message(code, self.step(code)))
+                await asyncio.sleep(self.tick_interval)
+        except ConnectionResetError:
+            pass  # 클라이언트가 연결을 끊은 경우
+        return ws
+
+    def _ws_message(self, code: str, ticker: dict) -> bytes:
+        data = {k: v for k, v in ticker.items() if k != "market"}
+        data.update({"type": "ticker", "code": code, "stream_type": "REALTIME"})
+        return json.dumps(data).encode()
+
+    def make_app(self) -> web.Application:
+        app = web.Application(middlewares=[self.rate_limit_middleware])
+        app.router.add_get("/v1/market/all", self.market_all)
+        app.router.add_get("/v1/ticker", self.ticker)
+        app.router.add_get("/v1/ticker/all", self.ticker_all)
+        app.router.add_get("/v1/candles/minutes/{unit}", self.candles)
+        app.router.add_get("/v1/candles/days", self.candles)
+        app.router.add_get("/websocket/v1", self.websocket)
+        return app
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="업비트 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    web.run_app(UpbitStandIn().make_app(), host=args.host, port=args.port)
@@ -0,0 +1,125 @@
+import aiohttp
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# 업비트 실시간 시세 웹소켓 처리 클래스
+class UpbitTickerStream:
+    """업비트 ticker 웹소켓을 구독해 인메모리 시세판을 유지"""
+
+    def __init__(
+        self,
+        url: str,
+        markets_provider: Callable[[], Awaitable[List[str]]],
+        stale_after: float = 10.0,
+        max_backoff: float = 60.0,
+        on_ticker: Optional[Callable[[Dict], None]] = None,
+    ):
+        self.url = url
+        self.markets_provider = markets_provider
+        self.stale_after = stale_after
+        self.max_backoff = max_backoff
+        self.on_ticker = on_ticker
+        self.book: Dict[str, Dict] = {}
+        self.subscribed: List[str] = []
+        self.connected = False
+        self.last_message_at = 0.0
+        self.reconnects = 0
+        self._session = None
+        self._ws = None
+        self._task = None
+
+    def start(self):
+        """백그라운드 구독 시작"""
+        if not self._task:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """구독 종료 및 세션 정리"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """연결이 살아 있고 최근에 메시지를 받았는지 여부"""
+        return self.connected and time.monotonic() - self.last_message_at < self.stale_after
+
+    def snapshot(self, markets: List[str]) -> Optional[List[Dict]]:
+        """시세판에서 바로 응답, 하나라도 없거나 오래됐으면 None (REST로 폴백)"""
+        # ticker는 체결이 있을 때만 오므로 마켓별 수신 시각이 아닌 연결 상태로 신선도를 판단
+        if not self.is_fresh:
+            return None
+        tickers = []
+        for market in markets:
+            ticker = self.book.get(market)
+            if ticker is None:
+                return None
+            tickers.append(ticker)
+        return tickers
+
+    async def refresh_subscription(self):
+        """구독 대상 마켓이 바뀌었으면 재연결해서 다시 구독"""
+        markets = await self.markets_provider()
+        if self._ws and set(markets) != set(self.subscribed):
+            await self._ws.close()
+
+    async def _run(self):
+        backoff = 1.0
+        while True:
+            try:
+                markets = await self.markets_provider()
+                if not self._session:
+                    self._session = aiohttp.ClientSession()
+                async with self._session.ws_connect(self.url, heartbeat=30) as ws:
+                    self._ws = ws
+                    await ws.send_json([
+                        {"ticket": str(uuid.uuid4())},
+                        {"type": "ticker", "codes": markets},
+                        {"format": "DEFAULT"},
+                    ])
+                    self.subscribed = markets
+                    self.connected = True
+                    self.last_message_at = time.monotonic()
+                    logging.info(f"시세 웹소켓 연결: {len(markets)}개 마켓 구독")
+
+                    async for msg in ws:
+                        if msg.type in (aiohttp.WSMsgType.BINARY, aiohttp.WSMsgType.TEXT):
+                            self._handle(json.loads(msg.data))
+                            backoff = 1.0
+                        elif msg.type == aiohttp.WSMsgType.ERROR:
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.warning(f"시세 웹소켓 오류: {e}")
+            finally:
+                self.connected = False
+                self._ws = None
+
+            # 지수 백오프 + 지터로 재연결
+            self.reconnects += 1
+            await asyncio.sleep(backoff + random.uniform(0, backoff / 2))
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _handle(self, data: dict):
+        """ticker 메시지를 REST 응답과 같은 형태로 맞춰 시세판에 반영"""
+        if data.get("type") != "ticker":
+            return
+        self.last_message_at = time.monotonic()
+        ticker = dict(data)
+        ticker["market"] = data["code"]
+        self.book[ticker["market"]] = ticker
+        if self.on_ticker:
+            self.on_ticker(ticker)
@@ -0,0 +1,36 @@
+import json
+import os
+from typing import Dict, List
+
+# 관심 목록 저장 처리 클래스
+class WatchlistStore:
+    """유저/채널/서버별 관심 마켓 목록 (JSON 파일 저장)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lists: Dict[str, List[str]] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.lists = json.load(f)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.lists, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """prefix로 시작하는 키 목록 (예: "channel:")"""
+        return [key for key in self.lists if key.startswith(prefix)]
+
+    def get(self, key: str) -> List[str]:
+        return list(self.lists.get(key, []))
+
+    def set(self, key: str, markets: List[str]):
+        """목록 저장 (빈 목록이면 삭제)"""
+        if markets:
+            self.lists[key] = list(dict.fromkeys(markets))
+        else:
+            self.lists.pop(key, None)
+        self.save()